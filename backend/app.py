@@ -1,12 +1,46 @@
 from flask import Flask
 from flask_cors import CORS
-from routes.game import game_bp
+from routes.game import game_bp, levels_body
 from routes.health import health_bp
 from config import Config
+from services.cipher_registry import cipher_registry
+from services.cipher_service import CipherService, cipher_service
+from services.dictionary_service import word_dictionary
+from services.feedback_engine import feedback_engine
+from services.puzzle_factory import PuzzleFactory, puzzle_factory
+from services.rsa_key_reservoir import rsa_key_reservoir
+from services.session_store import session_store
+from services.word_pool import word_pool
+from utils.serialization import install_json_provider
 
-def create_app():
+def create_app(registry=None):
+    """
+    Create the Flask app.
+
+    Args:
+        registry: CipherRegistry for the routes to use (defaults to the
+            process-wide one); attached as app.extensions['cipher_registry'],
+            with the CipherService and PuzzleFactory built on it as
+            app.extensions['cipher_service'] and ['puzzle_factory']
+    """
     app = Flask(__name__)
     app.config.from_object(Config)
+    install_json_provider(app, fast=app.config['FAST_JSON'])
+
+    # Cipher levels; each cipher module is imported the first time its level is used
+    registry = registry or cipher_registry
+    app.extensions['cipher_registry'] = registry
+    if registry is cipher_registry:
+        app.extensions['cipher_service'] = cipher_service
+        app.extensions['puzzle_factory'] = puzzle_factory
+    else:
+        # Queues only for the standard levels this registry also has; others are built inline
+        service = CipherService(registry)
+        app.extensions['cipher_service'] = service
+        app.extensions['puzzle_factory'] = PuzzleFactory(
+            {level: depth for level, depth in Config.PUZZLE_QUEUE_DEPTHS.items() if level in registry},
+            cipher_service=service
+        )
 
     # Initialize CORS
     CORS(app, origins=app.config['CORS_ORIGINS'])
@@ -15,8 +49,60 @@ def create_app():
     app.register_blueprint(game_bp, url_prefix='/api')
     app.register_blueprint(health_bp, url_prefix='/api')
 
+    if app.config['WARM_UP']:
+        warm_up(app)
+
+    # A preloading server's master never serves requests; its workers start their own
+    if not app.config['PRELOAD']:
+        start_services(app)
+
     return app
 
+def start_services(app):
+    """
+    Start the background services the app's config enables.
+
+    create_app calls this unless PRELOAD is set, in which case a preforking
+    server calls it in each worker after the fork (see gunicorn.conf.py), so
+    threads are started where they run and workers do not share queued
+    words, puzzles or RSA keys.
+
+    Args:
+        app: App created by create_app
+    """
+    # Load or build the guess feedback matrix off the request path
+    if app.config['FEEDBACK_MATRIX']:
+        feedback_engine.start()
+
+    # Expire idle game sessions off the request path
+    session_store.start_sweeper()
+
+    # Keep the word pool filled in the background
+    if app.config['WORD_POOL_PREFETCH']:
+        word_pool.start()
+
+    # Generate larger RSA keys in worker processes ahead of demand
+    if app.config['RSA_KEY_BITS']:
+        rsa_key_reservoir.start(warm_up=app.config['RSA_KEY_WARMUP'])
+
+    # Pre-generate encrypted puzzles for every level in the background
+    if app.config['PUZZLE_PREGENERATE']:
+        app.extensions['puzzle_factory'].start()
+
+def warm_up(app):
+    """
+    Load what the first requests would otherwise load on demand.
+
+    Imports every cipher module (with NumPy and pycryptodome) and builds
+    their shared tables, maps the guess dictionary and serializes /levels.
+    Call it in the parent of a preforked server so workers share the loaded
+    pages, or set WARM_UP=true to run it inside create_app.
+    """
+    app.extensions['cipher_registry'].prepare()
+    word_dictionary.load()
+    with app.app_context():
+        levels_body()
+
 if __name__ == '__main__':
     app = create_app()
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
@@ -0,0 +1,53 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from a2wsgi import WSGIMiddleware
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.routing import Mount
+from app import create_app
+from config import Config
+from routes.game_async import game_routes
+from services.async_word_service import async_word_service
+
+def create_asgi_app(flask_app=None, word_service=None):
+    """
+    Create the ASGI app.
+
+    /api/generate and /api/validate are served by async views
+    (routes.game_async), so one worker process can hold many requests
+    waiting on the word API. Every other path is passed to the Flask app,
+    which also starts the background services. Run it with e.g.
+    `uvicorn --factory asgi:create_asgi_app --workers 1`.
+
+    Args:
+        flask_app: Flask app for the remaining routes (defaults to create_app())
+        word_service: AsyncWordService used by /generate (defaults to the
+            process-wide one)
+    """
+    flask_app = flask_app or create_app()
+    word_service = word_service or async_word_service
+    # Puzzle encryption (keygen, verification) runs here, off the event loop
+    cpu_executor = ThreadPoolExecutor(Config.ASYNC_CPU_WORKERS, thread_name_prefix='puzzle-encrypt')
+
+    @asynccontextmanager
+    async def lifespan(app):
+        await word_service.start()
+        try:
+            yield
+        finally:
+            await word_service.close()
+            cpu_executor.shutdown(wait=False)
+
+    app = Starlette(
+        routes=game_routes('/api') + [Mount('/', app=WSGIMiddleware(flask_app))],
+        middleware=[Middleware(CORSMiddleware, allow_origins=Config.CORS_ORIGINS,
+                               allow_methods=['*'], allow_headers=['*'])],
+        lifespan=lifespan
+    )
+    app.state.flask_app = flask_app
+    app.state.cipher_registry = flask_app.extensions['cipher_registry']
+    app.state.puzzle_factory = flask_app.extensions['puzzle_factory']
+    app.state.word_service = word_service
+    app.state.cpu_executor = cpu_executor
+    return app
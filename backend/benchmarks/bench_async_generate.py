@@ -0,0 +1,86 @@
+"""
+Concurrency benchmark for the async /generate path under a slow word API.
+
+Starts the ASGI app (asgi.py) in-process with the word pool prefetch and
+puzzle pre-generation disabled, so every request waits on upstream, and
+points its word service at the stand-in word API (stub_word_api) with the
+given latency. Fires --requests concurrent GET /api/generate calls and
+reports wall time, latency percentiles, upstream round trips and the
+number of threads the process used.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_async_generate [--requests 2000] [--latency 1.0] [--level 1]
+"""
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+import httpx
+from config import Config
+from benchmarks.stub_word_api import create_stub_word_api
+from services.async_word_service import AsyncWordService
+
+async def run(requests: int, latency: float, level: int) -> dict:
+    """Fire the requests concurrently and collect their latencies."""
+    # Imported after the Config overrides in main() so create_app sees them
+    from asgi import create_asgi_app
+
+    stub = create_stub_word_api(latency)
+    word_service = AsyncWordService(transport=httpx.ASGITransport(app=stub))
+    app = create_asgi_app(word_service=word_service)
+
+    latencies = []
+    statuses = []
+    peak_threads = threading.active_count()
+
+    async def one(client: httpx.AsyncClient):
+        nonlocal peak_threads
+        started = time.perf_counter()
+        response = await client.get(f'/api/generate?level={level}')
+        latencies.append(time.perf_counter() - started)
+        statuses.append(response.status_code)
+        peak_threads = max(peak_threads, threading.active_count())
+
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+            started = time.perf_counter()
+            await asyncio.gather(*(one(client) for _ in range(requests)))
+            elapsed = time.perf_counter() - started
+        word_stats = word_service.get_stats()
+
+    latencies.sort()
+    return {
+        'elapsed': elapsed,
+        'p50': statistics.median(latencies),
+        'p99': latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        'errors': sum(status != 200 for status in statuses),
+        'upstream_requests': stub.state.requests,
+        'word_stats': word_stats,
+        'peak_threads': peak_threads
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=2000, help='concurrent /generate calls')
+    parser.add_argument('--latency', type=float, default=1.0, help='stand-in word API latency in seconds')
+    parser.add_argument('--level', type=int, default=1, help='cipher level requested')
+    args = parser.parse_args()
+
+    # Every request goes upstream: no prefetched words, no pre-built puzzles
+    Config.WORD_POOL_PREFETCH = False
+    Config.PUZZLE_PREGENERATE = False
+    Config.FEEDBACK_MATRIX = False
+
+    result = asyncio.run(run(args.requests, args.latency, args.level))
+    print(f"{args.requests} concurrent /generate, level {args.level}, upstream latency {args.latency:.2f} s")
+    print(f"  wall time          {result['elapsed']:>8.2f} s ({args.requests / result['elapsed']:,.0f} requests/s)")
+    print(f"  latency p50 / p99  {result['p50'] * 1000:>8.0f} / {result['p99'] * 1000:.0f} ms")
+    print(f"  errors             {result['errors']:>8}")
+    print(f"  upstream requests  {result['upstream_requests']:>8}")
+    print(f"  fallback words     {result['word_stats']['fallbacks']:>8}")
+    print(f"  peak threads       {result['peak_threads']:>8} (ASYNC_CPU_WORKERS={Config.ASYNC_CPU_WORKERS})")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Throughput benchmark for the DES cipher engine.
+
+Each path is compared with the original implementation (a new DES object
+per word, a padded two-block encrypt and a base64 round trip for the display
+letters) under the same keying:
+
+  one key:        DESCipher.encrypt with its cached cipher object, and
+                  encrypt_many (every word in a single ECB call)
+  key per word:   DESCipher.encrypt_batch (fresh random keys, as puzzles use)
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_des [--words 20000] [--repeats 3]
+"""
+import argparse
+import base64
+import random
+from Crypto.Cipher import DES
+from Crypto.Util.Padding import pad
+from benchmarks.bench_encrypt_batch import best_of
+from ciphers.des_cipher import KEY_ALPHABET, DESCipher
+from services.word_service import FALLBACK_WORDS
+
+def legacy_encrypt(key: bytes, plaintext: str) -> str:
+    """The original per-word DES display encryption."""
+    plaintext = (plaintext + 'X' * 8)[:8]
+    encrypted = DES.new(key, DES.MODE_ECB).encrypt(pad(plaintext.encode(), DES.block_size))
+    encrypted_b64 = base64.b64encode(encrypted).decode()
+    result = ""
+    for char in encrypted_b64[:10]:
+        if char.isalpha():
+            result += char.upper()
+        else:
+            result += chr(ord('A') + (int(char) % 26) if char.isdigit() else 65)
+        if len(result) >= 5:
+            break
+    return result[:5]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--words', type=int, default=20000, help='words per run')
+    parser.add_argument('--repeats', type=int, default=3, help='runs per measurement (best is kept)')
+    args = parser.parse_args()
+
+    words = [random.choice(FALLBACK_WORDS) for _ in range(args.words)]
+    cipher = DESCipher()
+
+    def legacy_fresh_keys():
+        for word in words:
+            key = bytes(random.choice(KEY_ALPHABET) for _ in range(8))
+            legacy_encrypt(key, word)
+
+    legacy_one_key = best_of(lambda: [legacy_encrypt(cipher.key, word) for word in words], args.repeats)
+    legacy_key_per_word = best_of(legacy_fresh_keys, args.repeats)
+
+    runs = [
+        ('one key', 'encrypt', lambda: [cipher.encrypt(word) for word in words], legacy_one_key),
+        ('one key', 'encrypt_many', lambda: cipher.encrypt_many(words), legacy_one_key),
+        ('key per word', 'encrypt_batch', lambda: DESCipher.encrypt_batch(words), legacy_key_per_word),
+    ]
+
+    print(f"{'keying':<13} {'path':<14} {'legacy words/s':>15} {'words/s':>12} {'speedup':>8}")
+    for keying, name, run, legacy in runs:
+        elapsed = best_of(run, args.repeats)
+        print(f"{keying:<13} {name:<14} {args.words / legacy:>15,.0f} {args.words / elapsed:>12,.0f} "
+              f"{legacy / elapsed:>7.2f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""
+Throughput benchmark for batched puzzle encryption.
+
+Compares CipherService.encrypt_batch against the per-word
+CipherService.encrypt_word loop for every level, reporting words per second.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_encrypt_batch [--words 5000] [--levels 1 3 5 6 7]
+"""
+import argparse
+import random
+import time
+from services.cipher_service import CipherService
+from services.word_service import FALLBACK_WORDS
+
+def best_of(func, repeats: int) -> float:
+    """Return the fastest wall time of several runs of func."""
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--words', type=int, default=5000, help='words per batch')
+    parser.add_argument('--levels', type=int, nargs='*', default=list(range(1, 10)), help='levels to benchmark')
+    parser.add_argument('--repeats', type=int, default=3, help='runs per measurement (best is kept)')
+    args = parser.parse_args()
+
+    service = CipherService()
+    words = [random.choice(FALLBACK_WORDS) for _ in range(args.words)]
+
+    print(f"{'level':>5} {'cipher':<22} {'loop words/s':>14} {'batch words/s':>14} {'speedup':>8}")
+    for level in args.levels:
+        name = service.get_cipher_class(level).NAME
+        loop = best_of(lambda: [service.encrypt_word(word, level) for word in words], args.repeats)
+        batch = best_of(lambda: service.encrypt_batch(words, level), args.repeats)
+        print(f"{level:>5} {name:<22} {args.words / loop:>14,.0f} {args.words / batch:>14,.0f} {loop / batch:>7.2f}x")
+
+if __name__ == '__main__':
+    main()
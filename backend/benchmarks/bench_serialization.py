@@ -0,0 +1,72 @@
+"""
+Serialization benchmark for the /generate and /validate response bodies.
+
+Each body is built with the route's payload function in the verbose and the
+compact form, then turned into a Flask response by the default json-module
+provider and by the orjson provider. Reports encoded size and responses per
+second for every combination.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_serialization [--responses 20000] [--repeats 3]
+"""
+import argparse
+import random
+import uuid
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from benchmarks.bench_encrypt_batch import best_of
+from routes.game import guess_payload, puzzle_payload
+from services.cipher_service import CipherService
+from services.word_service import FALLBACK_WORDS
+from utils.feedback_utils import PATTERN_COUNT
+from utils.serialization import OrjsonProvider, orjson
+
+def sample_payloads(count: int, compact: bool) -> dict:
+    """Representative response bodies for each endpoint."""
+    service = CipherService()
+    puzzles = []
+    for _ in range(count):
+        level = random.randint(1, 9)
+        cipher = service.get_cipher_for_level(level)
+        puzzles.append(puzzle_payload(
+            str(uuid.uuid4()), level, cipher.NAME,
+            cipher.encrypt(random.choice(FALLBACK_WORDS)), cipher.get_hints(), compact
+        ))
+    guesses = [
+        guess_payload(random.randrange(PATTERN_COUNT - 1), random.randint(1, 5), compact=compact)
+        for _ in range(count)
+    ]
+    return {'/generate': puzzles, '/validate': guesses}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--responses', type=int, default=20000, help='responses encoded per run')
+    parser.add_argument('--repeats', type=int, default=3, help='runs per measurement (best is kept)')
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    providers = [('json', DefaultJSONProvider(app))]
+    if orjson is not None:
+        providers.append(('orjson', OrjsonProvider(app)))
+    else:
+        print("orjson is not installed; only the default provider is measured")
+
+    # A few hundred distinct bodies, cycled to the requested count
+    distinct = min(args.responses, 500)
+    modes = {'verbose': sample_payloads(distinct, False), 'compact': sample_payloads(distinct, True)}
+
+    print(f"{'endpoint':<10} {'mode':<8} {'encoder':<7} {'bytes':>6} {'responses/s':>12} {'speedup':>8}")
+    with app.app_context():
+        for endpoint in ('/generate', '/validate'):
+            baseline = None
+            for mode, payloads in modes.items():
+                bodies = (payloads[endpoint] * (args.responses // distinct + 1))[:args.responses]
+                for encoder, provider in providers:
+                    size = sum(len(provider.response(body).get_data()) for body in bodies[:distinct]) / distinct
+                    elapsed = best_of(lambda: [provider.response(body) for body in bodies], args.repeats)
+                    baseline = baseline or elapsed
+                    print(f"{endpoint:<10} {mode:<8} {encoder:<7} {size:>6.0f} "
+                          f"{args.responses / elapsed:>12,.0f} {baseline / elapsed:>7.2f}x")
+
+if __name__ == '__main__':
+    main()
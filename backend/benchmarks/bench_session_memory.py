@@ -0,0 +1,80 @@
+"""
+Memory benchmark for game session storage.
+
+Reports retained bytes per session for the original layout (a dict of
+5-key dicts keyed by UUID strings) and for SessionStore's compact
+records (16-byte UUID keys, __slots__ records, packed words).
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_session_memory [--sessions 1000000]
+"""
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+import uuid
+from services.session_store import SessionStore
+from services.word_service import FALLBACK_WORDS
+
+CIPHER_NAMES = ['Caesar Cipher', 'Monoalphabetic Cipher', 'Vigenère Cipher', 'Playfair Cipher',
+                'Rail Fence Cipher', 'Hill Cipher', 'One-Time Pad', 'DES Cipher', 'RSA Cipher']
+
+def _fresh_word() -> str:
+    """A word as a new string object, like one decoded from an API response."""
+    return random.choice(FALLBACK_WORDS).lower().upper()
+
+def build_dict_sessions(count: int):
+    """The original layout: {session_id_str: {level, actual_word, cipher_name, timestamp, attempts}}."""
+    sessions = {}
+    for _ in range(count):
+        level = random.randint(1, 9)
+        sessions[str(uuid.uuid4())] = {
+            'level': level,
+            'actual_word': _fresh_word(),
+            'cipher_name': CIPHER_NAMES[level - 1],
+            'timestamp': time.time(),
+            'attempts': 0
+        }
+    return sessions
+
+def build_store_sessions(count: int):
+    """The compact layout used by SessionStore."""
+    store = SessionStore()
+    for _ in range(count):
+        level = random.randint(1, 9)
+        store.put(str(uuid.uuid4()), level, _fresh_word(), CIPHER_NAMES[level - 1])
+    return store
+
+def measure(builder, count: int) -> float:
+    """
+    Build `count` sessions and measure the memory they retain.
+
+    Returns:
+        Retained bytes per session
+    """
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    container = builder(count)
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del container
+    return (after - before) / count
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sessions', type=int, default=1000000, help='number of live sessions to build')
+    args = parser.parse_args()
+
+    dict_bytes = measure(build_dict_sessions, args.sessions)
+    store_bytes = measure(build_store_sessions, args.sessions)
+
+    print(f"sessions:                 {args.sessions:,}")
+    print(f"dict of dicts (before):   {dict_bytes:8.1f} bytes/session  ({dict_bytes * args.sessions / 2**20:,.1f} MiB)")
+    print(f"SessionStore (after):     {store_bytes:8.1f} bytes/session  ({store_bytes * args.sessions / 2**20:,.1f} MiB)")
+    print(f"reduction:                {1 - store_bytes / dict_bytes:8.1%}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""
+Throughput benchmark for the shared-memory session store.
+
+Runs the request-path mix (put, get, increment_attempts x6, pop) against
+the in-process SessionStore with one process, and against
+SharedSessionStore with 1, 2 and 4 forked worker processes on one table.
+It also checks that every worker sees the sessions the others create.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_session_shared [--ops 200000] [--capacity 65536]
+"""
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+import uuid
+from services.session_store import SessionStore
+from services.shared_session_store import SharedSessionStore, default_path
+
+PROCESS_COUNTS = (1, 2, 4)
+
+def _play(store, games: int):
+    """Play `games` full sessions against the store."""
+    for _ in range(games):
+        session_id = str(uuid.uuid4())
+        store.put(session_id, 1, 'CRANE', 'Caesar Cipher')
+        store.get(session_id)
+        for _ in range(6):
+            store.increment_attempts(session_id)
+        store.pop(session_id)
+
+def _worker(store, games: int, barrier, created, seen):
+    """One worker process: play games, then look up the sessions every other worker created."""
+    barrier.wait()
+    _play(store, games)
+    session_id = str(uuid.uuid4())
+    store.put(session_id, 2, 'SMILE', 'Monoalphabetic Cipher')
+    created.put(session_id)
+    barrier.wait()
+    while True:
+        other = created.get()
+        if other is None:
+            break
+        seen.put(store.get(other) is not None)
+
+def run_shared(store: SharedSessionStore, processes: int, ops: int) -> tuple:
+    """
+    Run the workload in forked processes sharing one table.
+
+    Returns:
+        (store operations per second across all processes, whether every
+        cross-process lookup found its session)
+    """
+    context = multiprocessing.get_context('fork')
+    games = max(1, ops // (9 * processes))
+    barrier = context.Barrier(processes + 1)
+    created, seen = context.Queue(), context.Queue()
+    workers = [context.Process(target=_worker, args=(store, games, barrier, created, seen))
+               for _ in range(processes)]
+    for worker in workers:
+        worker.start()
+
+    barrier.wait()
+    started = time.perf_counter()
+    barrier.wait()
+    elapsed = time.perf_counter() - started
+
+    # Hand every created id to a worker (not necessarily its creator), then stop them
+    session_ids = [created.get() for _ in range(processes)]
+    for session_id in session_ids[1:] + session_ids[:1]:
+        created.put(session_id)
+    for _ in range(processes):
+        created.put(None)
+    found = all(seen.get() for _ in range(processes))
+    for worker in workers:
+        worker.join()
+    return (games * processes * 9) / elapsed, found
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--ops', type=int, default=200000, help='total store operations per run')
+    parser.add_argument('--capacity', type=int, default=1 << 16, help='shared table slots')
+    args = parser.parse_args()
+
+    games = max(1, args.ops // 9)
+    started = time.perf_counter()
+    _play(SessionStore(), games)
+    memory = games * 9 / (time.perf_counter() - started)
+    print(f"{'store':<24} {'processes':>9} {'ops/s':>12} {'vs memory':>10} {'shared':>7}")
+    print(f"{'SessionStore (memory)':<24} {1:>9} {memory:>12,.0f} {1:>9.2f}x {'-':>7}")
+
+    # A private table on the same filesystem the store uses by default
+    path = os.path.join(tempfile.mkdtemp(dir=os.path.dirname(default_path())), 'sessions')
+    store = SharedSessionStore(path=path, capacity=args.capacity)
+    try:
+        for processes in PROCESS_COUNTS:
+            rate, found = run_shared(store, processes, args.ops)
+            print(f"{'SharedSessionStore':<24} {processes:>9} {rate:>12,.0f} {rate / memory:>9.2f}x "
+                  f"{'yes' if found else 'NO':>7}")
+    finally:
+        store.close()
+        store.unlink()
+        os.rmdir(os.path.dirname(path))
+
+if __name__ == '__main__':
+    main()
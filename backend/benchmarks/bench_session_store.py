@@ -0,0 +1,66 @@
+"""
+Contention benchmark for the sharded session store.
+
+Compares the lock-striped SessionStore against the same store with a single
+shard (i.e. one global lock) at 1, 8 and 32 threads. Each thread runs the
+request-path mix: put, get, increment_attempts x6 and pop.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_session_store [--ops 20000] [--shards 16]
+"""
+import argparse
+import threading
+import time
+import uuid
+from services.session_store import SessionStore
+
+THREAD_COUNTS = (1, 8, 32)
+
+def _worker(store: SessionStore, games: int, barrier: threading.Barrier):
+    """Play `games` full sessions against the store."""
+    session_ids = [str(uuid.uuid4()) for _ in range(games)]
+    barrier.wait()
+    for session_id in session_ids:
+        store.put(session_id, 1, 'CRANE', 'Caesar Cipher')
+        store.get(session_id)
+        for _ in range(6):
+            store.increment_attempts(session_id)
+        store.pop(session_id)
+
+def run(shards: int, threads: int, ops: int) -> float:
+    """
+    Run the workload and return throughput.
+
+    Returns:
+        Store operations per second across all threads
+    """
+    store = SessionStore(shards=shards)
+    games_per_thread = max(1, ops // (9 * threads))
+    barrier = threading.Barrier(threads + 1)
+    workers = [
+        threading.Thread(target=_worker, args=(store, games_per_thread, barrier))
+        for _ in range(threads)
+    ]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+    return (games_per_thread * threads * 9) / elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--ops', type=int, default=200000, help='total store operations per run')
+    parser.add_argument('--shards', type=int, default=16, help='shard count for the striped store')
+    args = parser.parse_args()
+
+    print(f"{'threads':>8} {'global lock ops/s':>20} {f'{args.shards} shards ops/s':>20} {'speedup':>8}")
+    for threads in THREAD_COUNTS:
+        single = run(1, threads, args.ops)
+        striped = run(args.shards, threads, args.ops)
+        print(f"{threads:>8} {single:>20,.0f} {striped:>20,.0f} {striped / single:>7.2f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Cost benchmark for stateless session tokens versus the session store.
+
+Plays full games (start, read, six guesses, end) through SessionTokens and
+through the in-process SessionStore, and reports games per second and the
+memory retained per game still in progress (the store keeps a record until
+the game ends or expires; tokens keep only a replay-cache entry).
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_session_tokens [--games 20000] [--open-games 100000]
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+import uuid
+from services.session_store import SessionStore
+from services.session_tokens import SessionTokens
+
+def play_store(store: SessionStore, games: int):
+    """Play full games against the session store."""
+    for _ in range(games):
+        session_id = str(uuid.uuid4())
+        store.put(session_id, 1, 'CRANE', 'Caesar Cipher')
+        store.get(session_id)
+        for _ in range(6):
+            store.increment_attempts(session_id)
+        store.pop(session_id)
+
+def play_tokens(tokens: SessionTokens, games: int):
+    """Play full games with tokens, sending each guess with the latest token like /validate."""
+    for _ in range(games):
+        token = tokens.issue(1, 'CRANE')
+        tokens.get(token)
+        for _ in range(5):
+            token = tokens.increment_attempts(token)[1]
+        tokens.increment_attempts(token)
+        tokens.pop(token)
+
+def retained_per_game(start_game, count: int) -> float:
+    """Server memory still allocated per game after starting count games (the client holds the handle)."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for _ in range(count):
+        start_game()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / count
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--games', type=int, default=20000, help='full games played per measurement')
+    parser.add_argument('--open-games', type=int, default=100000, help='games in progress for the memory measurement')
+    args = parser.parse_args()
+
+    store = SessionStore()
+    tokens = SessionTokens(cache_size=args.open_games)
+    tokens.issue(1, 'CRANE')  # derive the key outside the timings
+
+    print(f"{'backend':<14} {'games/s':>10} {'bytes/open game':>16}")
+    for name, play, start_game in (
+        ('SessionStore', lambda: play_store(store, args.games),
+         lambda: store.put(str(uuid.uuid4()), 1, 'CRANE', 'Caesar Cipher')),
+        ('SessionTokens', lambda: play_tokens(tokens, args.games),
+         lambda: tokens.issue(1, 'CRANE')),
+    ):
+        started = time.perf_counter()
+        play()
+        rate = args.games / (time.perf_counter() - started)
+        print(f"{name:<14} {rate:>10,.0f} {retained_per_game(start_game, args.open_games):>16,.0f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+"""
+Cold-start benchmark for the backend, with budgets that fail the run.
+
+Each measurement runs in a fresh interpreter:
+
+  import:          `python -X importtime -c "import app"`, reporting the
+                   cumulative import time of app and the slowest modules,
+                   and checking that heavy dependencies stay out of it
+  first response:  wall time from launching the interpreter to the first
+                   response of the test client (create_app included)
+
+Background services (word prefetch, puzzle pre-generation, the feedback
+matrix) are disabled unless --background is given, so only the request
+path is measured.
+
+Exits with status 1 if the median import time or time to first response
+is over its budget, or if a forbidden module is imported by `import app`.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_startup [--repeats 5] [--import-budget-ms 250]
+        [--response-budget-ms 600] [--path /api/health] [--warm-up]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Loaded on first use of a level, never by `import app`
+DEFAULT_FORBIDDEN = ('numpy', 'Crypto', 'requests')
+
+FIRST_RESPONSE_SCRIPT = """
+from app import create_app
+response = create_app().test_client().get({path!r})
+assert response.status_code < 500, response.status_code
+"""
+
+def run_env(background: bool, warm_up: bool) -> dict:
+    """Environment for the measured interpreters."""
+    env = dict(os.environ)
+    if not background:
+        env.update(WORD_POOL_PREFETCH='false', PUZZLE_PREGENERATE='false', FEEDBACK_MATRIX='false')
+    env['WARM_UP'] = 'true' if warm_up else 'false'
+    return env
+
+def parse_importtime(stderr: str, root: str = 'app') -> dict:
+    """
+    Parse -X importtime output for the modules imported under root.
+
+    Returns:
+        Dictionary of module -> cumulative microseconds, root included
+        (interpreter startup imports such as site are left out)
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        _, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = len(name) - len(name.lstrip())
+        entries.append((name.strip(), int(cumulative_us), depth))
+
+    # Children are printed before their parent, more deeply indented
+    end = max(i for i, (name, _, _) in enumerate(entries) if name == root)
+    root_depth = entries[end][2]
+    start = end
+    while start > 0 and entries[start - 1][2] > root_depth:
+        start -= 1
+    return {name: cumulative_us for name, cumulative_us, _ in entries[start:end + 1]}
+
+def measure_import(env: dict) -> dict:
+    """Import app once with -X importtime."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import app'],
+                            env=env, capture_output=True, text=True, check=True)
+    return parse_importtime(result.stderr)
+
+def measure_first_response(env: dict, path: str) -> float:
+    """Seconds from launching an interpreter to its first response."""
+    started = time.perf_counter()
+    subprocess.run([sys.executable, '-c', FIRST_RESPONSE_SCRIPT.format(path=path)],
+                   env=env, capture_output=True, check=True)
+    return time.perf_counter() - started
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeats', type=int, default=5, help='fresh interpreters per measurement (median is kept)')
+    parser.add_argument('--import-budget-ms', type=float, default=250, help='budget for importing app')
+    parser.add_argument('--response-budget-ms', type=float, default=600, help='budget for launch to first response')
+    parser.add_argument('--path', default='/api/health', help='endpoint requested for the first response')
+    parser.add_argument('--forbid', nargs='*', default=list(DEFAULT_FORBIDDEN),
+                        help='modules that `import app` must not load')
+    parser.add_argument('--top', type=int, default=10, help='slowest modules to list')
+    parser.add_argument('--warm-up', action='store_true', help='run app.warm_up in create_app (WARM_UP=true)')
+    parser.add_argument('--background', action='store_true', help='leave background services enabled')
+    args = parser.parse_args()
+
+    env = run_env(args.background, args.warm_up)
+    imports = [measure_import(env) for _ in range(args.repeats)]
+    import_ms = statistics.median(modules['app'] for modules in imports) / 1000
+    responses_ms = statistics.median(
+        measure_first_response(env, args.path) for _ in range(args.repeats)
+    ) * 1000
+
+    print("slowest imports under app (cumulative ms, last run):")
+    slowest = sorted(imports[-1].items(), key=lambda item: item[1], reverse=True)
+    for name, cumulative_us in [item for item in slowest if item[0] != 'app'][:args.top]:
+        print(f"  {cumulative_us / 1000:>8.1f}  {name}")
+
+    failures = []
+    loaded = [name for name in args.forbid if name in imports[-1]]
+    if loaded:
+        failures.append(f"`import app` loads {', '.join(loaded)}")
+    if import_ms > args.import_budget_ms:
+        failures.append(f"import app {import_ms:.0f} ms > {args.import_budget_ms:.0f} ms budget")
+    if responses_ms > args.response_budget_ms:
+        failures.append(f"first response {responses_ms:.0f} ms > {args.response_budget_ms:.0f} ms budget")
+
+    print(f"{'import app':<16} {import_ms:>8.1f} ms   (budget {args.import_budget_ms:.0f} ms)")
+    print(f"{'first response':<16} {responses_ms:>8.1f} ms   (budget {args.response_budget_ms:.0f} ms, {args.path})")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        sys.exit(1)
+    print("OK: within budget")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""
+Local stand-in for the random word API, with configurable latency.
+
+Answers GET /word?number=N with a JSON list of N words from the fallback
+list after sleeping --latency seconds, and counts the requests it served.
+Use it in-process through httpx.ASGITransport (see bench_async_generate) or
+run it as a server and point WORD_API_URL at it.
+
+Usage (from the backend directory):
+    python -m benchmarks.stub_word_api [--port 8001] [--latency 1.0]
+    WORD_API_URL=http://127.0.0.1:8001/word uvicorn --factory asgi:create_asgi_app
+"""
+import argparse
+import asyncio
+import random
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from services.word_service import FALLBACK_WORDS
+
+def create_stub_word_api(latency: float = 0.0, words: list = None) -> Starlette:
+    """
+    Build the stand-in word API.
+
+    Args:
+        latency: Seconds to wait before every response
+        words: Words to sample from (defaults to the fallback list)
+
+    Returns:
+        Starlette app; app.state.requests counts the requests served
+    """
+    words = words or FALLBACK_WORDS
+
+    async def random_words(request: Request):
+        request.app.state.requests += 1
+        count = int(request.query_params.get('number', 1))
+        await asyncio.sleep(latency)
+        return JSONResponse([random.choice(words).lower() for _ in range(count)])
+
+    app = Starlette(routes=[Route('/word', random_words)])
+    app.state.requests = 0
+    return app
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8001)
+    parser.add_argument('--latency', type=float, default=1.0, help='seconds before each response')
+    args = parser.parse_args()
+
+    import uvicorn
+    uvicorn.run(create_stub_word_api(args.latency), host=args.host, port=args.port, log_level='warning')
+
+if __name__ == '__main__':
+    main()
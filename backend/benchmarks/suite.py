@@ -0,0 +1,195 @@
+"""
+Regression benchmark suite for the request hot paths.
+
+Times each case below with timeit (loop count calibrated to at least
+0.2 s, best of --repeats runs) and reports seconds per call:
+
+    cipher.<level>.encrypt / .decrypt   every registered BaseCipher subclass
+                                        (decrypt where it is implemented)
+    validation.validate_guess           ValidationService.validate_guess
+    levels.get_all_levels_info          CipherService.get_all_levels_info
+    http.roundtrip.<level>              GET /api/generate, a wrong guess and the
+                                        answer via POST /api/validate, through
+                                        the Flask test client
+
+The HTTP cases run with the word pool prefetch and puzzle pre-generation
+disabled and WordService stubbed to a fixed word list, so no request leaves
+the process and every /generate builds its puzzle inline.
+
+--output writes the results as JSON. --baseline compares against an earlier
+results file and exits with status 1 if any case is more than --threshold
+slower (by best time) than it was there.
+
+Usage (from the backend directory):
+    python -m benchmarks.suite [--output results.json] [--filter cipher.] [--repeats 5]
+    python -m benchmarks.suite --baseline results.json [--threshold 0.10]
+"""
+import argparse
+import contextlib
+import itertools
+import json
+import platform
+import statistics
+import sys
+import time
+import timeit
+from unittest import mock
+from config import Config
+from services.cipher_registry import cipher_registry
+from services.cipher_service import cipher_service
+from services.validation_service import ValidationService
+from services.word_service import WordService, FALLBACK_WORDS
+
+SAMPLE_WORD = 'CRANE'
+
+class StubWords:
+    """Stands in for WordService: no API calls, and the answer of the next puzzle is chosen by the caller."""
+
+    def __init__(self):
+        self._words = itertools.cycle(FALLBACK_WORDS)
+        self.word = SAMPLE_WORD
+
+    def next_word(self) -> str:
+        """Pick the answer the next /generate will use."""
+        self.word = next(self._words)
+        return self.word
+
+    def patch(self):
+        """Context manager routing WordService's word sources to this stub."""
+        stack = contextlib.ExitStack()
+        stack.enter_context(mock.patch.object(WordService, 'fetch_batch_from_api', staticmethod(lambda count=None: [])))
+        stack.enter_context(mock.patch.object(WordService, 'get_fallback_word', staticmethod(lambda: self.word)))
+        return stack
+
+def cipher_cases() -> dict:
+    """encrypt, and decrypt where the cipher supports it, for every registered level."""
+    cases = {}
+    for level in cipher_registry.levels():
+        # Built once outside the timings: the cases measure the cipher, not its key setup
+        cipher = cipher_registry.create(level)
+        cases[f'cipher.{level}.encrypt'] = lambda cipher=cipher: cipher.encrypt(SAMPLE_WORD)
+        ciphertext = cipher.encrypt(SAMPLE_WORD)
+        try:
+            cipher.decrypt(ciphertext)
+        except NotImplementedError:
+            # e.g. DES, whose display ciphertext is truncated
+            continue
+        cases[f'cipher.{level}.decrypt'] = lambda cipher=cipher, ciphertext=ciphertext: cipher.decrypt(ciphertext)
+    return cases
+
+def service_cases() -> dict:
+    """Guess validation and the /levels listing."""
+    return {
+        'validation.validate_guess': lambda: ValidationService.validate_guess('SLATE', SAMPLE_WORD),
+        'levels.get_all_levels_info': cipher_service.get_all_levels_info
+    }
+
+def http_cases(stub: StubWords) -> dict:
+    """One game per call through the Flask test client: /generate, a wrong guess, the answer."""
+    # Imported after the Config overrides in main() so create_app sees them
+    from app import create_app
+
+    client = create_app().test_client()
+
+    def play(level: int):
+        word = stub.next_word()
+        session_id = client.get(f'/api/generate?level={level}').get_json()['session_id']
+        wrong = SAMPLE_WORD if word != SAMPLE_WORD else 'SLATE'
+        result = client.post('/api/validate', json={'guess': wrong, 'session_id': session_id}).get_json()
+        session_id = result.get('session_id') or session_id
+        result = client.post('/api/validate', json={'guess': word, 'session_id': session_id}).get_json()
+        if not result.get('correct'):
+            raise RuntimeError(f'Round trip at level {level} did not solve the game: {result}')
+
+    return {f'http.roundtrip.{level}': lambda level=level: play(level) for level in cipher_registry.levels()}
+
+def measure(func, repeats: int) -> dict:
+    """Seconds per call of func: best and median over repeats calibrated runs."""
+    timer = timeit.Timer(func)
+    loops, _ = timer.autorange()
+    runs = [total / loops for total in timer.repeat(repeats, loops)]
+    return {'best': min(runs), 'median': statistics.median(runs), 'loops': loops}
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Compare best times against a baseline run.
+
+    Returns:
+        Names of the cases more than threshold slower than in the baseline
+    """
+    regressions = []
+    print(f"\n{'case':<32} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            print(f"{name:<32} {'-':>12} {format_time(result['best']):>12} {'new':>8}")
+            continue
+        change = result['best'] / previous['best'] - 1
+        flag = ''
+        if change > threshold:
+            regressions.append(name)
+            flag = '  REGRESSION'
+        print(f"{name:<32} {format_time(previous['best']):>12} {format_time(result['best']):>12} {change:>+7.1%}{flag}")
+    for name in sorted(baseline.keys() - results.keys()):
+        print(f"{name:<32} {format_time(baseline[name]['best']):>12} {'-':>12} {'missing':>8}")
+    return regressions
+
+def format_time(seconds: float) -> str:
+    """Seconds per call in the most readable unit."""
+    if seconds >= 1e-3:
+        return f'{seconds * 1e3:.2f} ms'
+    return f'{seconds * 1e6:.2f} us'
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', help='write results to this JSON file')
+    parser.add_argument('--baseline', help='results JSON from an earlier run to compare against')
+    parser.add_argument('--threshold', type=float, default=0.10, help='slowdown that counts as a regression (0.10 = 10%%)')
+    parser.add_argument('--filter', nargs='*', default=[], help='only run cases whose name starts with one of these')
+    parser.add_argument('--repeats', type=int, default=5, help='calibrated runs per case (best is compared)')
+    args = parser.parse_args()
+
+    # Deterministic, offline puzzle path: no background threads, every word from the stub
+    Config.WORD_POOL_PREFETCH = False
+    Config.PUZZLE_PREGENERATE = False
+    Config.FEEDBACK_MATRIX = False
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+
+    stub = StubWords()
+    cases = {**cipher_cases(), **service_cases(), **http_cases(stub)}
+    if args.filter:
+        cases = {name: func for name, func in cases.items() if name.startswith(tuple(args.filter))}
+        if baseline is not None:
+            baseline = {name: result for name, result in baseline.items() if name.startswith(tuple(args.filter))}
+
+    results = {}
+    print(f"{'case':<32} {'best':>12} {'median':>12} {'loops':>8}")
+    with stub.patch():
+        for name, func in cases.items():
+            result = results[name] = measure(func, args.repeats)
+            print(f"{name:<32} {format_time(result['best']):>12} {format_time(result['median']):>12} {result['loops']:>8}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'repeats': args.repeats,
+                'results': results
+            }, f, indent=2)
+        print(f"\nWrote {len(results)} results to {args.output}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) slower than the baseline by more than {args.threshold:.0%}")
+            sys.exit(1)
+        print(f"\nNo case slower than the baseline by more than {args.threshold:.0%}")
+
+if __name__ == '__main__':
+    main()
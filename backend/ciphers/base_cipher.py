@@ -1,8 +1,15 @@
 from abc import ABC, abstractmethod
+from typing import List, Tuple
 
 class BaseCipher(ABC):
     """Abstract base class for all cipher implementations."""
 
+    # Level metadata, declared by each subclass so it can be read without an instance
+    LEVEL: int
+    NAME: str
+    DESCRIPTION: str
+    DIFFICULTY: str
+
     @abstractmethod
     def encrypt(self, plaintext: str) -> str:
         """
@@ -16,6 +23,78 @@ class BaseCipher(ABC):
         """
         pass
 
+    @abstractmethod
+    def decrypt(self, ciphertext: str) -> str:
+        """
+        Decrypt ciphertext produced by encrypt under this instance's key.
+
+        Args:
+            ciphertext: The encrypted text (uppercase letters)
+
+        Returns:
+            The recovered plaintext (uppercase letters)
+
+        Raises:
+            NotImplementedError: If the cipher's output cannot be inverted
+        """
+        pass
+
+    @classmethod
+    def round_trips(cls, word: str) -> bool:
+        """
+        Check whether a word can decrypt back to itself under some key.
+
+        Ciphers whose losses do not depend on the key (Playfair folds J into
+        I) override this so puzzle generation rejects such words once
+        instead of failing verification under every key.
+
+        Args:
+            word: The word to check (uppercase letters only)
+
+        Returns:
+            False if no key can round-trip the word
+        """
+        return True
+
+    @classmethod
+    def encrypt_batch(cls, words: List[str]) -> Tuple[List[str], List['BaseCipher']]:
+        """
+        Encrypt a batch of words, each under its own freshly keyed cipher.
+
+        Subclasses with array kernels override this; the default encrypts
+        word by word.
+
+        Args:
+            words: The words to encrypt (uppercase letters only)
+
+        Returns:
+            Tuple of (encrypted_words, ciphers) where ciphers[i] holds the
+            key used for words[i] and can produce its hints
+        """
+        ciphers = [cls() for _ in words]
+        encrypted_words = [cipher.encrypt(word) for cipher, word in zip(ciphers, words)]
+        return encrypted_words, ciphers
+
+    @classmethod
+    def decrypt_batch(cls, encrypted_words: List[str], ciphers: List['BaseCipher']) -> List[str]:
+        """
+        Decrypt a batch of words, each under the cipher that encrypted it.
+
+        Subclasses with array kernels override this; the default decrypts
+        word by word.
+
+        Args:
+            encrypted_words: Output of encrypt_batch
+            ciphers: The matching cipher instances from encrypt_batch
+
+        Returns:
+            List of recovered plaintexts
+
+        Raises:
+            NotImplementedError: If the cipher's output cannot be inverted
+        """
+        return [cipher.decrypt(word) for cipher, word in zip(ciphers, encrypted_words)]
+
     @abstractmethod
     def get_hints(self) -> tuple[str, str, str]:
         """
@@ -29,22 +108,26 @@ class BaseCipher(ABC):
         """
         pass
 
-    @abstractmethod
-    def get_level_info(self) -> dict:
+    @classmethod
+    def get_level_info(cls) -> dict:
         """
-        Get information about this cipher level.
+        Get information about this cipher level, read from the class attributes.
 
         Returns:
             Dictionary with 'name', 'description', and 'difficulty' keys
         """
-        pass
+        return {
+            'name': cls.NAME,
+            'description': cls.DESCRIPTION,
+            'difficulty': cls.DIFFICULTY
+        }
 
-    @abstractmethod
-    def get_level_number(self) -> int:
+    @classmethod
+    def get_level_number(cls) -> int:
         """
         Get the level number for this cipher (1-9).
 
         Returns:
             Integer level number
         """
-        pass
\ No newline at end of file
+        return cls.LEVEL
\ No newline at end of file
@@ -1,25 +1,44 @@
 import random
+import numpy as np
+from utils.batch_utils import codes_to_words, rng, words_to_codes
+from utils.translation_utils import SHIFT_TABLES
 from .base_cipher import BaseCipher
 
 class CaesarCipher(BaseCipher):
     """Caesar cipher implementation with random shift."""
 
-    def __init__(self):
+    LEVEL = 1
+    NAME = 'Caesar Cipher'
+    DESCRIPTION = 'Simple substitution cipher where each letter is shifted by a fixed number of positions'
+    DIFFICULTY = 'Easy'
+
+    def __init__(self, shift: int = None):
         # Random shift between 1 and 25
-        self.shift = random.randint(1, 25)
+        self.shift = shift if shift is not None else random.randint(1, 25)
 
     def encrypt(self, plaintext: str) -> str:
         """Encrypt plaintext using Caesar cipher with random shift."""
-        encrypted = ""
-        for char in plaintext:
-            if char.isalpha():
-                # Shift only letters, preserve case by converting to uppercase
-                shifted = ord(char.upper()) - ord('A') + self.shift
-                shifted = shifted % 26
-                encrypted += chr(shifted + ord('A'))
-            else:
-                encrypted += char
-        return encrypted
+        # Shift only letters (output uppercase) through the precompiled table
+        return plaintext.translate(SHIFT_TABLES[self.shift % 26])
+
+    def decrypt(self, ciphertext: str) -> str:
+        """Decrypt Caesar ciphertext by shifting back."""
+        return ciphertext.translate(SHIFT_TABLES[-self.shift % 26])
+
+    @classmethod
+    def encrypt_batch(cls, words: list) -> tuple:
+        """Encrypt a batch of words as one broadcast add mod 26, a random shift per word."""
+        codes = words_to_codes(words)
+        shifts = rng.integers(1, 26, size=(len(words), 1), dtype=np.uint8)
+        encrypted_words = codes_to_words((codes + shifts) % 26)
+        return encrypted_words, [cls(shift) for shift in shifts[:, 0].tolist()]
+
+    @classmethod
+    def decrypt_batch(cls, encrypted_words: list, ciphers: list) -> list:
+        """Decrypt a batch of words as one broadcast subtract mod 26."""
+        codes = words_to_codes(encrypted_words).astype(np.int16)
+        shifts = np.array([cipher.shift for cipher in ciphers], dtype=np.int16)[:, None]
+        return codes_to_words((codes - shifts) % 26)
 
     def get_hints(self) -> tuple[str, str, str]:
         """Get progressive hints for Caesar cipher."""
@@ -38,16 +57,4 @@ class CaesarCipher(BaseCipher):
 
         hint3 = f"The shift is exactly {self.shift}"
 
-        return (hint1, hint2, hint3)
-
-    def get_level_info(self) -> dict:
-        """Get level information for Caesar cipher."""
-        return {
-            'name': 'Caesar Cipher',
-            'description': 'Simple substitution cipher where each letter is shifted by a fixed number of positions',
-            'difficulty': 'Easy'
-        }
-
-    def get_level_number(self) -> int:
-        """Caesar cipher is level 1."""
-        return 1
\ No newline at end of file
+        return (hint1, hint2, hint3)
\ No newline at end of file
@@ -1,51 +1,106 @@
 import random
 import string
+import numpy as np
 from Crypto.Cipher import DES
-from Crypto.Util.Padding import pad
-import base64
+from utils.batch_utils import rng
 from .base_cipher import BaseCipher
 
+# DES keys are drawn from these characters
+KEY_ALPHABET = (string.ascii_letters + string.digits).encode()
+# Ciphertext byte -> display letter
+DISPLAY_TABLE = bytes(ord('A') + b % 26 for b in range(256))
+# Number of display letters taken from the start of each ciphertext block
+DISPLAY_LENGTH = 5
+
+def _to_blocks(words) -> bytearray:
+    """
+    Lay words out as one contiguous buffer of 8-byte DES blocks.
+
+    Each word keeps its first 8 letters (uppercased, non-letters removed)
+    and is right-padded with 'X'.
+    """
+    buffer = bytearray(b'X' * (DES.block_size * len(words)))
+    for i, word in enumerate(words):
+        if not (word.isascii() and word.isalpha()):
+            word = ''.join(c for c in word if c.isalpha())
+        block = word[:DES.block_size].upper().encode('ascii', 'ignore')
+        offset = i * DES.block_size
+        buffer[offset:offset + len(block)] = block
+    return buffer
+
+def _display(ciphertext: bytearray, count: int) -> list:
+    """Map the leading bytes of each ciphertext block to display letters."""
+    letters = ciphertext.translate(DISPLAY_TABLE).decode('ascii')
+    return [
+        letters[offset:offset + DISPLAY_LENGTH]
+        for offset in range(0, count * DES.block_size, DES.block_size)
+    ]
+
 class DESCipher(BaseCipher):
     """DES cipher demonstration for educational purposes."""
 
-    def __init__(self):
+    LEVEL = 8
+    NAME = 'DES Cipher'
+    DESCRIPTION = 'Symmetric block cipher standard using 64-bit blocks and complex permutations'
+    DIFFICULTY = 'Expert'
+
+    def __init__(self, key: bytes = None):
         # Generate a random 8-byte DES key
-        self.key = ''.join(random.choice(string.ascii_letters + string.digits) for _ in range(8)).encode()
+        self.key = key or bytes(random.choice(KEY_ALPHABET) for _ in range(8))
+        self._engine = None
+
+    @property
+    def engine(self):
+        """The DES object for this key, created on first use and then reused (ECB is stateless)."""
+        if self._engine is None:
+            self._engine = DES.new(self.key, DES.MODE_ECB)
+        return self._engine
 
     def encrypt(self, plaintext: str) -> str:
         """Encrypt plaintext using DES cipher."""
-        # Convert to uppercase and ensure it's at least 8 characters
-        plaintext = ''.join(c.upper() for c in plaintext if c.isalpha())
-
-        # Pad or truncate to 8 characters
-        if len(plaintext) < 8:
-            plaintext += 'X' * (8 - len(plaintext))
-        else:
-            plaintext = plaintext[:8]
-
-        # Convert to bytes
-        plaintext_bytes = plaintext.encode()
-
-        # Create DES cipher
-        cipher = DES.new(self.key, DES.MODE_ECB)
-
-        # Encrypt and encode as base64, then take first 5 letters for display
-        encrypted_bytes = cipher.encrypt(pad(plaintext_bytes, DES.block_size))
-        encrypted_b64 = base64.b64encode(encrypted_bytes).decode()
-
-        # Convert to a 5-letter display format
-        # Use the first 5 characters that are letters, or substitute with letters
-        result = ""
-        for char in encrypted_b64[:10]:  # Take first 10 chars to find 5 letters
-            if char.isalpha():
-                result += char.upper()
-            else:
-                # Map numbers to letters for display
-                result += chr(ord('A') + (int(char) % 26) if char.isdigit() else 65)
-            if len(result) >= 5:
-                break
-
-        return result[:5]
+        return self.encrypt_many([plaintext])[0]
+
+    def encrypt_many(self, words: list) -> list:
+        """
+        Encrypt many words under this cipher's key with a single ECB call.
+
+        Each word becomes one 8-byte block (first 8 letters, padded with 'X')
+        and is shown as the first 5 ciphertext bytes mapped to letters.
+
+        Args:
+            words: The words to encrypt
+
+        Returns:
+            List of 5-letter display strings, one per word
+        """
+        ciphertext = bytearray(self.engine.encrypt(_to_blocks(words)))
+        return _display(ciphertext, len(words))
+
+    def decrypt(self, ciphertext: str) -> str:
+        """
+        DES puzzles cannot be decrypted.
+
+        Raises:
+            NotImplementedError: Always; the display keeps 5 of the 8
+                ciphertext bytes and reduces each mod 26, so the block
+                cannot be recovered
+        """
+        raise NotImplementedError("DES display ciphertext is truncated and cannot be decrypted")
+
+    @classmethod
+    def encrypt_batch(cls, words: list) -> tuple:
+        """Encrypt a batch of words, each under its own random key, into one shared buffer."""
+        count = len(words)
+        keys = np.frombuffer(KEY_ALPHABET, dtype=np.uint8)[rng.integers(0, len(KEY_ALPHABET), (count, 8))]
+        ciphers = [cls(key.tobytes()) for key in keys]
+
+        # Slicing bytes is cheaper than bytearray here: pycryptodome passes bytes straight through
+        plaintext = bytes(_to_blocks(words))
+        ciphertext = bytearray(b''.join(
+            cipher.engine.encrypt(plaintext[offset:offset + DES.block_size])
+            for cipher, offset in zip(ciphers, range(0, len(plaintext), DES.block_size))
+        ))
+        return _display(ciphertext, count), ciphers
 
     def get_hints(self) -> tuple[str, str, str]:
         """Get progressive hints for DES cipher."""
@@ -54,15 +109,3 @@ class DESCipher(BaseCipher):
         hint3 = f"This demonstration uses ECB mode with 8-byte key blocks"
 
         return (hint1, hint2, hint3)
-
-    def get_level_info(self) -> dict:
-        """Get level information for DES cipher."""
-        return {
-            'name': 'DES Cipher',
-            'description': 'Symmetric block cipher standard using 64-bit blocks and complex permutations',
-            'difficulty': 'Expert'
-        }
-
-    def get_level_number(self) -> int:
-        """DES cipher is level 8."""
-        return 8
\ No newline at end of file
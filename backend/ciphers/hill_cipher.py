@@ -1,63 +1,123 @@
 import numpy as np
-from utils.math_utils import generate_invertible_matrix
+from config import Config
+from utils.batch_utils import codes_to_words, words_to_codes
+from utils.math_utils import generate_invertible_matrices, generate_invertible_matrix, matrix_mod_inv, mod_det, modinv
+from utils.translation_utils import UPPERCASE
+from utils.word_utils import WORD_LENGTH
 from .base_cipher import BaseCipher
 
-class HillCipher(BaseCipher):
-    """Hill cipher implementation with 2x2 matrix."""
-
-    def __init__(self):
-        self.matrix_size = 2
-        self.key_matrix = generate_invertible_matrix(self.matrix_size)
+# Inverse of every determinant mod 26 (0 where none exists)
+_DET_INVERSES = np.array([modinv(det, 26) or 0 for det in range(26)], dtype=np.int64)
 
-    def encrypt(self, plaintext: str) -> str:
-        """Encrypt plaintext using Hill cipher."""
+class HillCipher(BaseCipher):
+    """Hill cipher implementation with an n x n key matrix (2x2 by default)."""
+
+    LEVEL = 6
+    NAME = 'Hill Cipher'
+    DESCRIPTION = 'Polygraphic substitution cipher using linear algebra and matrix multiplication'
+    DIFFICULTY = 'Hard'
+
+    def __init__(self, key_matrix: np.ndarray = None, matrix_size: int = None):
+        if key_matrix is None:
+            key_matrix = generate_invertible_matrix(matrix_size or Config.HILL_MATRIX_SIZE)
+        self.key_matrix = np.asarray(key_matrix, dtype=np.int64)
+        self.matrix_size = self.key_matrix.shape[0]
+        self._inverse_matrix = None
+
+    def _to_blocks(self, text: str) -> np.ndarray:
+        """Letters of text as an (blocks, n) code array, padded with X."""
         # Convert to uppercase and remove non-letters
-        plaintext = ''.join(c.upper() for c in plaintext if c.isalpha())
+        letters = ''.join(c for c in text.upper() if c in UPPERCASE)
 
         # Pad with X if necessary
-        while len(plaintext) % self.matrix_size != 0:
-            plaintext += 'X'
-
-        encrypted = ""
+        letters += 'X' * (-len(letters) % self.matrix_size)
 
-        # Process in blocks
-        for i in range(0, len(plaintext), self.matrix_size):
-            block = plaintext[i:i+self.matrix_size]
+        codes = np.frombuffer(letters.encode('ascii'), dtype=np.uint8).astype(np.int64) - ord('A')
+        return codes.reshape(-1, self.matrix_size)
 
-            # Convert to numbers
-            numbers = [ord(c) - ord('A') for c in block]
+    @staticmethod
+    def _to_text(blocks: np.ndarray) -> str:
+        """Flatten a block array of codes back into letters."""
+        return (blocks.astype(np.uint8) + ord('A')).tobytes().decode('ascii')
 
-            # Multiply by key matrix
-            result = np.dot(self.key_matrix, numbers) % 26
-
-            # Convert back to letters
-            for num in result:
-                encrypted += chr(int(num) + ord('A'))
-
-        return encrypted
+    def encrypt(self, plaintext: str) -> str:
+        """Encrypt plaintext using Hill cipher."""
+        # Every block is multiplied by the key matrix at once: (K @ b^T)^T = b @ K^T
+        return self._to_text(self._to_blocks(plaintext) @ self.key_matrix.T % 26)
+
+    def decrypt(self, ciphertext: str) -> str:
+        """
+        Decrypt Hill ciphertext with the exact inverse key matrix mod 26.
+
+        The X padding encrypt adds to a WORD_LENGTH-letter answer is removed;
+        other lengths come back with their padding.
+        """
+        if self._inverse_matrix is None:
+            self._inverse_matrix = matrix_mod_inv(self.key_matrix, 26)
+        return self._strip_padding(self._to_text(self._to_blocks(ciphertext) @ self._inverse_matrix.T % 26))
+
+    def _strip_padding(self, plaintext: str) -> str:
+        """Remove the X letters encrypt padded a WORD_LENGTH-letter answer with (exactly -WORD_LENGTH % n)."""
+        padding = -WORD_LENGTH % self.matrix_size
+        if padding and len(plaintext) == WORD_LENGTH + padding:
+            return plaintext[:WORD_LENGTH]
+        return plaintext
+
+    @classmethod
+    def encrypt_batch(cls, words: list) -> tuple:
+        """Encrypt a batch of words as one batched key_matrix @ blocks product mod 26."""
+        codes = words_to_codes(words).astype(np.int64)
+        count, length = codes.shape
+        size = Config.HILL_MATRIX_SIZE
+
+        # Pad with X to a whole number of blocks
+        padding = -length % size
+        if padding:
+            codes = np.concatenate([codes, np.full((count, padding), ord('X') - ord('A'))], axis=1)
+        blocks = codes.reshape(count, -1, size)
+
+        keys = generate_invertible_matrices(count, size)
+        encrypted = np.einsum('nij,nbj->nbi', keys, blocks) % 26
+        encrypted_words = codes_to_words(encrypted.reshape(count, -1))
+        return encrypted_words, [cls(key) for key in keys]
+
+    @classmethod
+    def decrypt_batch(cls, encrypted_words: list, ciphers: list) -> list:
+        """Decrypt a batch of words as one batched inverse @ blocks product mod 26."""
+        if not ciphers:
+            return []
+        size = ciphers[0].matrix_size
+        if any(cipher.matrix_size != size for cipher in ciphers):
+            return super().decrypt_batch(encrypted_words, ciphers)
+
+        codes = words_to_codes(encrypted_words).astype(np.int64)
+        count = len(ciphers)
+        blocks = codes.reshape(count, -1, size)
+
+        keys = np.stack([cipher.key_matrix for cipher in ciphers])
+        if size == 2:
+            # inverse = det^-1 * [[d, -b], [-c, a]] mod 26, for all keys at once
+            a, b, c, d = keys[:, 0, 0], keys[:, 0, 1], keys[:, 1, 0], keys[:, 1, 1]
+            det_inverses = _DET_INVERSES[(a * d - b * c) % 26]
+            adjugates = np.stack([np.stack([d, -b], axis=1), np.stack([-c, a], axis=1)], axis=1)
+            inverses = adjugates * det_inverses[:, None, None] % 26
+        else:
+            inverses = np.stack([matrix_mod_inv(cipher.key_matrix, 26) for cipher in ciphers])
+        for cipher, inverse in zip(ciphers, inverses):
+            cipher._inverse_matrix = inverse
+
+        decrypted = codes_to_words((np.einsum('nij,nbj->nbi', inverses, blocks) % 26).reshape(count, -1))
+        return [cipher._strip_padding(word) for cipher, word in zip(ciphers, decrypted)]
 
     def get_hints(self) -> tuple[str, str, str]:
         """Get progressive hints for Hill cipher."""
         hint1 = "This is a Hill cipher using matrix multiplication"
 
-        # Calculate determinant
-        det = int(round(np.linalg.det(self.key_matrix))) % 26
+        # Exact determinant mod 26
+        det = mod_det(self.key_matrix, 26)
         hint2 = f"The key matrix has determinant {det} (mod 26)"
 
         # Reveal the key matrix
-        matrix_str = " ".join(str(self.key_matrix.flatten()[i]) for i in range(4))
-        hint3 = f"The key matrix is [[{self.key_matrix[0][0]}, {self.key_matrix[0][1]}], [{self.key_matrix[1][0]}, {self.key_matrix[1][1]}]]"
+        hint3 = f"The key matrix is {self.key_matrix.tolist()}"
 
         return (hint1, hint2, hint3)
-
-    def get_level_info(self) -> dict:
-        """Get level information for Hill cipher."""
-        return {
-            'name': 'Hill Cipher',
-            'description': 'Polygraphic substitution cipher using linear algebra and matrix multiplication',
-            'difficulty': 'Hard'
-        }
-
-    def get_level_number(self) -> int:
-        """Hill cipher is level 6."""
-        return 6
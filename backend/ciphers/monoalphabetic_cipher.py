@@ -1,25 +1,35 @@
 import random
+from utils.translation_utils import substitution_table
 from .base_cipher import BaseCipher
 
 class MonoalphabeticCipher(BaseCipher):
     """Monoalphabetic substitution cipher with random mapping."""
 
+    LEVEL = 2
+    NAME = 'Monoalphabetic Cipher'
+    DESCRIPTION = 'Each letter maps to a different unique letter in a fixed pattern'
+    DIFFICULTY = 'Easy'
+
     def __init__(self):
         # Create a random substitution mapping
         self.alphabet = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
         shuffled = list(self.alphabet)
         random.shuffle(shuffled)
         self.mapping = dict(zip(self.alphabet, shuffled))
+        # Compile the mapping once so encryption is a single str.translate
+        self._table = substitution_table(''.join(shuffled))
+        self._decrypt_table = None
 
     def encrypt(self, plaintext: str) -> str:
         """Encrypt plaintext using monoalphabetic substitution."""
-        encrypted = ""
-        for char in plaintext:
-            if char.isalpha():
-                encrypted += self.mapping[char.upper()]
-            else:
-                encrypted += char
-        return encrypted
+        return plaintext.translate(self._table)
+
+    def decrypt(self, ciphertext: str) -> str:
+        """Decrypt monoalphabetic ciphertext through the inverse substitution."""
+        if self._decrypt_table is None:
+            inverse = {cipher: plain for plain, cipher in self.mapping.items()}
+            self._decrypt_table = substitution_table(''.join(inverse[letter] for letter in self.alphabet))
+        return ciphertext.translate(self._decrypt_table)
 
     def get_hints(self) -> tuple[str, str, str]:
         """Get progressive hints for monoalphabetic cipher."""
@@ -31,24 +41,17 @@ class MonoalphabeticCipher(BaseCipher):
         hint2 = f"The letter E maps to {most_common_cipher}"
 
         # Reveal a few more mappings
-        mappings_reveal = []
-        for plain, cipher in self.mapping.items():
-            if plain in ['A', 'T', 'O']:  # Common letters
-                mappings_reveal.append(f"{plain}→{cipher}")
-            if len(mappings_reveal) >= 2:
-                break
+        mappings_reveal = [f"{plain}→{cipher}" for plain, cipher in self.revealed_mappings()]
         hint3 = f"Some mappings: {', '.join(mappings_reveal)}"
 
         return (hint1, hint2, hint3)
 
-    def get_level_info(self) -> dict:
-        """Get level information for monoalphabetic cipher."""
-        return {
-            'name': 'Monoalphabetic Cipher',
-            'description': 'Each letter maps to a different unique letter in a fixed pattern',
-            'difficulty': 'Easy'
-        }
-
-    def get_level_number(self) -> int:
-        """Monoalphabetic cipher is level 2."""
-        return 2
\ No newline at end of file
+    def revealed_mappings(self) -> list:
+        """The (plain, cipher) letter pairs given away by the third hint."""
+        revealed = []
+        for plain, cipher in self.mapping.items():
+            if plain in ['A', 'T', 'O']:  # Common letters
+                revealed.append((plain, cipher))
+            if len(revealed) >= 2:
+                break
+        return revealed
\ No newline at end of file
@@ -1,14 +1,21 @@
 import random
 import string
+import numpy as np
+from utils.batch_utils import codes_to_words, rng, words_to_codes
 from .base_cipher import BaseCipher
 
 class OneTimePadCipher(BaseCipher):
     """One-Time Pad cipher implementation."""
 
-    def __init__(self):
+    LEVEL = 7
+    NAME = 'One-Time Pad'
+    DESCRIPTION = 'Perfectly secure cipher using a random key as long as the message'
+    DIFFICULTY = 'Hard'
+
+    def __init__(self, key: str = None):
         # Generate a random key the same length as a typical word (5 letters)
         # In practice, this will be regenerated for each encryption
-        self.key = ''.join(random.choice(string.ascii_uppercase) for _ in range(5))
+        self.key = key or ''.join(random.choice(string.ascii_uppercase) for _ in range(5))
 
     def encrypt(self, plaintext: str) -> str:
         """Encrypt plaintext using One-Time Pad cipher."""
@@ -32,22 +39,34 @@ class OneTimePadCipher(BaseCipher):
 
         return encrypted
 
+    def decrypt(self, ciphertext: str) -> str:
+        """Decrypt One-Time Pad ciphertext by subtracting the last pad used."""
+        if len(ciphertext) != len(self.key):
+            raise ValueError("One-Time Pad ciphertext must be as long as the key")
+        return ''.join(
+            chr((ord(char) - ord(key_char)) % 26 + ord('A'))
+            for char, key_char in zip(ciphertext.upper(), self.key)
+        )
+
+    @classmethod
+    def encrypt_batch(cls, words: list) -> tuple:
+        """Encrypt a batch of words against a random pad per word in one array add."""
+        codes = words_to_codes(words)
+        keys = rng.integers(0, 26, size=codes.shape, dtype=np.uint8)
+        encrypted_words = codes_to_words((codes + keys) % 26)
+        return encrypted_words, [cls(key) for key in codes_to_words(keys)]
+
+    @classmethod
+    def decrypt_batch(cls, encrypted_words: list, ciphers: list) -> list:
+        """Decrypt a batch of words by subtracting every pad in one array op."""
+        codes = words_to_codes(encrypted_words).astype(np.int16)
+        keys = words_to_codes([cipher.key for cipher in ciphers])
+        return codes_to_words((codes - keys) % 26)
+
     def get_hints(self) -> tuple[str, str, str]:
         """Get progressive hints for One-Time Pad cipher."""
         hint1 = "This is a One-Time Pad cipher, theoretically unbreakable"
         hint2 = "Each letter is encrypted with a different random key character"
         hint3 = f"The key starts with: {self.key[:3]}..."
 
-        return (hint1, hint2, hint3)
-
-    def get_level_info(self) -> dict:
-        """Get level information for One-Time Pad cipher."""
-        return {
-            'name': 'One-Time Pad',
-            'description': 'Perfectly secure cipher using a random key as long as the message',
-            'difficulty': 'Hard'
-        }
-
-    def get_level_number(self) -> int:
-        """One-Time Pad cipher is level 7."""
-        return 7
\ No newline at end of file
+        return (hint1, hint2, hint3)
\ No newline at end of file
@@ -1,12 +1,61 @@
 import random
 import string
+from array import array
+import numpy as np
 from .base_cipher import BaseCipher
 
+# The 25 Playfair letters (J shares a cell with I) and their indices
+PLAYFAIR_ALPHABET = 'ABCDEFGHIKLMNOPQRSTUVWXYZ'
+
+def _build_index_table() -> bytes:
+    """Map letters (either case, J folded into I) to their index byte; anything else to 255."""
+    table = bytearray([255]) * 256
+    for index, letter in enumerate(PLAYFAIR_ALPHABET):
+        table[ord(letter)] = table[ord(letter.lower())] = index
+    table[ord('J')] = table[ord('j')] = PLAYFAIR_ALPHABET.index('I')
+    return bytes(table)
+
+_INDEX_TABLE = _build_index_table()
+
+# Digraph code a * 25 + b -> its two letters, shared by every key square
+_DIGRAPHS = tuple(a + b for a in PLAYFAIR_ALPHABET for b in PLAYFAIR_ALPHABET)
+
+def _build_cell_digraphs() -> np.ndarray:
+    """
+    Apply the Playfair rules to every pair of key-square cells.
+
+    The rules only depend on cell positions, so this table is the same for
+    every key square.
+
+    Returns:
+        Flat array of 625 entries: index cell1 * 25 + cell2 holds
+        out_cell1 * 25 + out_cell2
+    """
+    cells = np.arange(25)
+    row1, col1 = np.divmod(cells[:, None], 5)
+    row2, col2 = np.divmod(cells[None, :], 5)
+    same_row = row1 == row2
+    same_col = col1 == col2
+    # Same row: shift right; same column: shift down; rectangle: swap columns
+    out1 = np.where(same_row, row1 * 5 + (col1 + 1) % 5,
+                    np.where(same_col, ((row1 + 1) % 5) * 5 + col1, row1 * 5 + col2))
+    out2 = np.where(same_row, row2 * 5 + (col2 + 1) % 5,
+                    np.where(same_col, ((row2 + 1) % 5) * 5 + col2, row2 * 5 + col1))
+    return (out1 * 25 + out2).ravel().astype(np.intp)
+
+_CELL_DIGRAPHS = _build_cell_digraphs()
+
 class PlayfairCipher(BaseCipher):
     """Playfair cipher implementation with random key square."""
 
+    LEVEL = 4
+    NAME = 'Playfair Cipher'
+    DESCRIPTION = 'Digraphic substitution cipher using a 5x5 key square to encrypt letter pairs'
+    DIFFICULTY = 'Medium'
+
     def __init__(self):
         self.key_square = self._generate_key_square()
+        self._encrypt_table, self._decrypt_table = self._compile_digraph_tables()
 
     def _generate_key_square(self):
         """Generate a 5x5 Playfair key square."""
@@ -31,60 +80,124 @@ class PlayfairCipher(BaseCipher):
 
         return key_square  # 25 characters
 
-    def _find_position(self, char):
-        """Find the position of a character in the key square."""
-        char = char.replace('J', 'I')
-        index = self.key_square.index(char)
-        row = index // 5
-        col = index % 5
-        return row, col
-
-    def encrypt(self, plaintext: str) -> str:
-        """Encrypt plaintext using Playfair cipher."""
-        # Preprocess: uppercase, remove non-letters, handle double letters
-        plaintext = plaintext.upper().replace('J', 'I')
-        processed = ""
-
-        i = 0
-        while i < len(plaintext):
-            if i + 1 < len(plaintext):
-                char1, char2 = plaintext[i], plaintext[i + 1]
-                if char1 == char2:
-                    # Insert X between double letters
-                    processed += char1 + 'X'
-                    i += 1
-                else:
-                    processed += char1 + char2
-                    i += 2
-            else:
-                processed += plaintext[i]
-                i += 1
+    def _compile_digraph_tables(self):
+        """
+        Precompute the result of every digraph for this key square.
+
+        Returns:
+            Tuple of (encrypt_table, decrypt_table): flat arrays of 625 digraph
+            codes where code = first_index * 25 + second_index, with indices
+            into PLAYFAIR_ALPHABET. The decrypt table is built on first use.
+        """
+        # Key square cell -> letter index, and its inverse
+        square = np.frombuffer(
+            ''.join(self.key_square).encode('ascii').translate(_INDEX_TABLE), dtype=np.uint8
+        ).astype(np.intp)
+        cells = np.argsort(square)
+
+        # Letter digraph -> cell digraph -> encrypted cell digraph -> encrypted letter digraph
+        cell_pairs = np.add.outer(cells * 25, cells).ravel()
+        letter_pairs = np.add.outer(square * 25, square).ravel()
+        encrypted = letter_pairs.take(_CELL_DIGRAPHS.take(cell_pairs))
+
+        return array('H', encrypted.astype(np.uint16).tobytes()), None
+
+    def _get_decrypt_table(self) -> array:
+        """Invert the encrypt table (encryption is a bijection on digraphs)."""
+        if self._decrypt_table is None:
+            encrypted = np.frombuffer(self._encrypt_table.tobytes(), dtype=np.uint16)
+            decrypted = np.empty(625, dtype=np.uint16)
+            decrypted[encrypted] = np.arange(625, dtype=np.uint16)
+            self._decrypt_table = array('H', decrypted.tobytes())
+        return self._decrypt_table
+
+    @staticmethod
+    def _prepare(plaintext: str) -> bytes:
+        """
+        Split plaintext into Playfair digraphs in a single pass.
+
+        Inserts X between doubled letters within a pair and pads odd-length
+        text with X.
+
+        Returns:
+            Letter indices (J folded into I), an even number of them
+
+        Raises:
+            ValueError: If plaintext contains a character outside A-Z
+        """
+        indices = plaintext.encode('ascii', 'replace').translate(_INDEX_TABLE)
+        filler = PLAYFAIR_ALPHABET.index('X')
+
+        processed = bytearray()
+        for index in indices:
+            if index == 255:
+                raise ValueError(f"Playfair can only encrypt letters: {plaintext!r}")
+            if len(processed) % 2 == 1 and processed[-1] == index:
+                # Insert X between double letters
+                processed.append(filler)
+            processed.append(index)
 
         # If odd length, append X
         if len(processed) % 2 == 1:
-            processed += 'X'
-
-        # Encrypt pairs
-        encrypted = ""
-        for i in range(0, len(processed), 2):
-            char1, char2 = processed[i], processed[i + 1]
-            row1, col1 = self._find_position(char1)
-            row2, col2 = self._find_position(char2)
-
-            if row1 == row2:
-                # Same row: shift right
-                encrypted += self.key_square[row1 * 5 + (col1 + 1) % 5]
-                encrypted += self.key_square[row2 * 5 + (col2 + 1) % 5]
-            elif col1 == col2:
-                # Same column: shift down
-                encrypted += self.key_square[((row1 + 1) % 5) * 5 + col1]
-                encrypted += self.key_square[((row2 + 1) % 5) * 5 + col2]
-            else:
-                # Rectangle: swap columns
-                encrypted += self.key_square[row1 * 5 + col2]
-                encrypted += self.key_square[row2 * 5 + col1]
-
-        return encrypted
+            processed.append(filler)
+        return bytes(processed)
+
+    def encrypt(self, plaintext: str) -> str:
+        """Encrypt plaintext using Playfair cipher."""
+        processed = self._prepare(plaintext)
+        table = self._encrypt_table
+        return ''.join(
+            _DIGRAPHS[table[processed[i] * 25 + processed[i + 1]]]
+            for i in range(0, len(processed), 2)
+        )
+
+    def decrypt(self, ciphertext: str) -> str:
+        """
+        Decrypt Playfair ciphertext through the inverse digraph table.
+
+        X fillers between doubled letters and a trailing X pad are removed,
+        so a plaintext that genuinely contains X in those places (or J) does
+        not round-trip exactly.
+        """
+        indices = ciphertext.encode('ascii', 'replace').translate(_INDEX_TABLE)
+        if len(indices) % 2 == 1 or 255 in indices:
+            raise ValueError(f"Not a Playfair ciphertext: {ciphertext!r}")
+
+        table = self._get_decrypt_table()
+        processed = ''.join(
+            _DIGRAPHS[table[indices[i] * 25 + indices[i + 1]]]
+            for i in range(0, len(indices), 2)
+        )
+        return self._unprepare(processed)
+
+    @classmethod
+    def round_trips(cls, word: str) -> bool:
+        """
+        Check whether a word survives _prepare and _unprepare unchanged.
+
+        Every key square maps digraphs one-to-one, so this depends on the
+        word alone: words with J, or with an X that looks like a filler, fail
+        under every key.
+        """
+        try:
+            processed = cls._prepare(word)
+        except ValueError:
+            return False
+        return cls._unprepare(''.join(PLAYFAIR_ALPHABET[index] for index in processed)) == word
+
+    @staticmethod
+    def _unprepare(processed: str) -> str:
+        """Remove the X letters _prepare inserted between doubled letters and as a trailing pad."""
+        # Drop an X that separates a doubled letter across a pair boundary
+        chars = []
+        for i, char in enumerate(processed):
+            if (char == 'X' and i % 2 == 1 and 0 < i < len(processed) - 1
+                    and processed[i - 1] == processed[i + 1]):
+                continue
+            chars.append(char)
+        if chars and chars[-1] == 'X':
+            chars.pop()
+        return ''.join(chars)
 
     def get_hints(self) -> tuple[str, str, str]:
         """Get progressive hints for Playfair cipher."""
@@ -92,16 +205,4 @@ class PlayfairCipher(BaseCipher):
         hint2 = "The message is processed in letter pairs, and J is combined with I"
         hint3 = f"The key square contains: {' '.join(self.key_square[:10])}..."
 
-        return (hint1, hint2, hint3)
-
-    def get_level_info(self) -> dict:
-        """Get level information for Playfair cipher."""
-        return {
-            'name': 'Playfair Cipher',
-            'description': 'Digraphic substitution cipher using a 5x5 key square to encrypt letter pairs',
-            'difficulty': 'Medium'
-        }
-
-    def get_level_number(self) -> int:
-        """Playfair cipher is level 4."""
-        return 4
\ No newline at end of file
+        return (hint1, hint2, hint3)
\ No newline at end of file
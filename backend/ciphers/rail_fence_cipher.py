@@ -1,12 +1,39 @@
 import random
+from functools import lru_cache
+import numpy as np
+from utils.batch_utils import codes_to_words, rng, words_to_codes
 from .base_cipher import BaseCipher
 
+@lru_cache(maxsize=None)
+def rail_permutation(depth: int, length: int) -> np.ndarray:
+    """
+    Precompute the Rail Fence read-out order for a depth and text length.
+
+    Returns:
+        Index array such that ciphertext[i] = plaintext[permutation[i]]
+    """
+    positions = np.arange(length)
+    if depth == 1:
+        return positions
+    # Zigzag rail of each position: 0, 1, ..., depth-1, depth-2, ..., 1, 0, ...
+    period = 2 * (depth - 1)
+    phase = positions % period
+    rails = np.where(phase < depth, phase, period - phase)
+    permutation = np.argsort(rails, kind='stable')
+    permutation.setflags(write=False)
+    return permutation
+
 class RailFenceCipher(BaseCipher):
     """Rail Fence cipher implementation with random fence depth."""
 
-    def __init__(self):
+    LEVEL = 5
+    NAME = 'Rail Fence Cipher'
+    DESCRIPTION = 'Transposition cipher where letters are written in a zigzag pattern across multiple rails'
+    DIFFICULTY = 'Medium'
+
+    def __init__(self, fence_depth: int = None):
         # Random fence depth between 2 and 4
-        self.fence_depth = random.randint(2, 4)
+        self.fence_depth = fence_depth or random.randint(2, 4)
 
     def encrypt(self, plaintext: str) -> str:
         """Encrypt plaintext using Rail Fence cipher."""
@@ -33,22 +60,43 @@ class RailFenceCipher(BaseCipher):
         encrypted = ''.join(''.join(rail) for rail in rails)
         return encrypted
 
+    def decrypt(self, ciphertext: str) -> str:
+        """Decrypt Rail Fence ciphertext by scattering letters back through the rail permutation."""
+        permutation = rail_permutation(self.fence_depth, len(ciphertext))
+        plaintext = [''] * len(ciphertext)
+        for char, position in zip(ciphertext, permutation.tolist()):
+            plaintext[position] = char
+        return ''.join(plaintext)
+
+    @classmethod
+    def encrypt_batch(cls, words: list) -> tuple:
+        """Encrypt a batch of words by gathering through precomputed rail permutations."""
+        codes = words_to_codes(words)
+        count, length = codes.shape
+        depths = rng.integers(2, 5, size=count)
+
+        # Row d-2 holds the read-out order for depth d
+        permutations = np.stack([rail_permutation(depth, length) for depth in (2, 3, 4)])
+        encrypted_words = codes_to_words(np.take_along_axis(codes, permutations[depths - 2], axis=1))
+        return encrypted_words, [cls(depth) for depth in depths.tolist()]
+
+    @classmethod
+    def decrypt_batch(cls, encrypted_words: list, ciphers: list) -> list:
+        """Decrypt a batch of words by gathering through the inverse rail permutations."""
+        codes = words_to_codes(encrypted_words)
+        count, length = codes.shape
+        depths = np.array([cipher.fence_depth for cipher in ciphers])
+
+        # Row d-1 holds the inverse read-out order for depth d
+        inverses = np.stack([
+            np.argsort(rail_permutation(depth, length)) for depth in range(1, depths.max(initial=1) + 1)
+        ])
+        return codes_to_words(np.take_along_axis(codes, inverses[depths - 1], axis=1))
+
     def get_hints(self) -> tuple[str, str, str]:
         """Get progressive hints for Rail Fence cipher."""
         hint1 = "This is a transposition cipher written in a zigzag pattern"
         hint2 = f"The fence depth is between 2 and 4 rails"
         hint3 = f"The fence depth is exactly {self.fence_depth} rails"
 
-        return (hint1, hint2, hint3)
-
-    def get_level_info(self) -> dict:
-        """Get level information for Rail Fence cipher."""
-        return {
-            'name': 'Rail Fence Cipher',
-            'description': 'Transposition cipher where letters are written in a zigzag pattern across multiple rails',
-            'difficulty': 'Medium'
-        }
-
-    def get_level_number(self) -> int:
-        """Rail Fence cipher is level 5."""
-        return 5
\ No newline at end of file
+        return (hint1, hint2, hint3)
\ No newline at end of file
@@ -1,65 +1,151 @@
 import random
 import math
+import threading
+from config import Config
+from utils.translation_utils import LETTERS
 from .base_cipher import BaseCipher
 
+# Small primes for demonstration (real RSA would use much larger primes)
+DEMO_PRIMES = (61, 53, 59, 47, 43, 41, 37, 31, 29, 23)
+
+def primes_in_range(low: int, high: int) -> list:
+    """All primes p with low <= p < high (sieve of Eratosthenes)."""
+    sieve = bytearray([1]) * max(high, 2)
+    sieve[0] = sieve[1] = 0
+    for i in range(2, math.isqrt(high - 1) + 1 if high > 2 else 0):
+        if sieve[i]:
+            sieve[i * i::i] = bytes(len(range(i * i, high, i)))
+    return [p for p in range(max(low, 2), high) if sieve[p]]
+
+def configured_prime_pairs() -> list:
+    """
+    Default key source: every ordered pair of distinct configured primes.
+
+    Uses Config.RSA_PRIME_RANGE ("low:high") when set, else DEMO_PRIMES.
+    """
+    if Config.RSA_PRIME_RANGE:
+        low, high = (int(bound) for bound in Config.RSA_PRIME_RANGE.split(':'))
+        primes = primes_in_range(low, high)
+    else:
+        primes = DEMO_PRIMES
+    return [(p, q) for p in primes for q in primes if p != q]
+
+class RSAKeypair:
+    """An RSA keypair with its per-letter encryption table and display mappings."""
+
+    __slots__ = ('p', 'q', 'n', 'e', 'd', 'encrypt_table', 'display_table')
+
+    def __init__(self, p: int, q: int, e: int = None):
+        self.p, self.q = p, q
+        self.n = p * q
+        phi_n = (p - 1) * (q - 1)
+
+        if e is None:
+            # Choose small public exponent e
+            e = 65537 if phi_n > 65537 else 3
+            # Ensure e and phi_n are coprime
+            while math.gcd(e, phi_n) != 1:
+                e += 2
+        self.e = e
+
+        # Calculate private exponent d
+        self.d = pow(e, -1, phi_n)
+
+        # c = m^e mod n for every letter value m (A=0, ..., Z=25)
+        self.encrypt_table = tuple(pow(m, e, self.n) for m in range(26))
+
+        # Display form used by the game: each ciphertext value reduced mod 26 to a letter
+        display = ''.join(chr(c % 26 + ord('A')) for c in self.encrypt_table)
+        self.display_table = str.maketrans(LETTERS, display * 2)
+
+class RSAKeyCache:
+    """Precomputes every keypair from a pluggable key source, once per process."""
+
+    def __init__(self, key_source=None):
+        # Callable returning (p, q) pairs or ready RSAKeypair objects
+        self._key_source = key_source or configured_prime_pairs
+        self._keypairs = None
+        self._lock = threading.Lock()
+
+    def keypairs(self) -> list:
+        """All cached keypairs, generating them on first use."""
+        if self._keypairs is None:
+            with self._lock:
+                if self._keypairs is None:
+                    self._keypairs = [
+                        key if isinstance(key, RSAKeypair) else RSAKeypair(*key)
+                        for key in self._key_source()
+                    ]
+                    if not self._keypairs:
+                        raise ValueError("RSA key source produced no keypairs")
+        return self._keypairs
+
+    def random_keypair(self) -> RSAKeypair:
+        """Pick one cached keypair at random."""
+        return random.choice(self.keypairs())
+
+def generate_keypair(bits: int) -> RSAKeypair:
+    """
+    Generate a fresh keypair with a `bits`-bit modulus from two Miller-Rabin probable primes.
+
+    CPU-heavy for large sizes; meant to run in a worker process.
+    """
+    # math_utils pulls in NumPy, which the demo keys never need
+    from utils.math_utils import random_prime
+
+    half = bits // 2
+    while True:
+        p, q = random_prime(bits - half), random_prime(half)
+        # Keep e = 65537 usable
+        if p != q and math.gcd(65537, (p - 1) * (q - 1)) == 1:
+            return RSAKeypair(p, q, 65537)
+
+# Process-wide keypair cache
+rsa_key_cache = RSAKeyCache()
+
+# Callable returning the keypair for each new RSACipher; the key reservoir
+# installs itself here when larger configured key sizes are in use
+_key_provider = rsa_key_cache.random_keypair
+
+def set_key_provider(provider):
+    """Set the callable that supplies keypairs to new RSACipher instances (None restores the cache)."""
+    global _key_provider
+    _key_provider = provider or rsa_key_cache.random_keypair
+
 class RSACipher(BaseCipher):
     """RSA cipher demonstration with small primes for educational purposes."""
 
-    def __init__(self):
-        # Use small primes for demonstration (real RSA would use much larger primes)
-        self.p, self.q = self._generate_primes()
-        self.n = self.p * self.q
-        phi_n = (self.p - 1) * (self.q - 1)
+    LEVEL = 9
+    NAME = 'RSA Cipher'
+    DESCRIPTION = 'Asymmetric cipher using prime factorization and modular exponentiation'
+    DIFFICULTY = 'Expert'
 
-        # Choose small public exponent e
-        self.e = 65537 if phi_n > 65537 else 3
-        # Ensure e and phi_n are coprime
-        while math.gcd(self.e, phi_n) != 1:
-            self.e += 2
-
-        # Calculate private exponent d
-        self.d = self._mod_inverse(self.e, phi_n)
-
-    def _generate_primes(self):
-        """Generate two small prime numbers for demonstration."""
-        small_primes = [61, 53, 59, 47, 43, 41, 37, 31, 29, 23]
-        return random.sample(small_primes, 2)
-
-    def _mod_inverse(self, a, m):
-        """Calculate modular inverse using extended Euclidean algorithm."""
-        def egcd(a, b):
-            if a == 0:
-                return b, 0, 1
-            else:
-                g, y, x = egcd(b % a, a)
-                return g, x - (b // a) * y, x
-
-        g, x, y = egcd(a, m)
-        if g != 1:
-            return None
-        else:
-            return x % m
+    def __init__(self, keypair: RSAKeypair = None):
+        self.keypair = keypair or _key_provider()
+        self.p, self.q = self.keypair.p, self.keypair.q
+        self.n = self.keypair.n
+        self.e = self.keypair.e
+        self.d = self.keypair.d
 
     def encrypt(self, plaintext: str) -> str:
         """Encrypt plaintext using RSA cipher."""
         # Convert to uppercase and remove non-letters
-        plaintext = ''.join(c.upper() for c in plaintext if c.isalpha())
+        if not (plaintext.isascii() and plaintext.isalpha()):
+            plaintext = ''.join(c for c in plaintext if c in LETTERS)
 
-        encrypted = ""
+        # Each letter m becomes (m^e mod n) mod 26, looked up from the keypair's table
+        return plaintext.translate(self.keypair.display_table)
 
-        for char in plaintext:
-            # Convert letter to number (A=0, B=1, ..., Z=25)
-            m = ord(char) - ord('A')
+    def decrypt(self, ciphertext: str) -> str:
+        """
+        RSA puzzles cannot be decrypted.
 
-            # RSA encryption: c = m^e mod n
-            c = pow(m, self.e, self.n)
-
-            # Convert result back to a letter for display
-            # Use modulo 26 to ensure it's a letter
-            display_val = c % 26
-            encrypted += chr(display_val + ord('A'))
-
-        return encrypted
+        Raises:
+            NotImplementedError: Always; the display reduces each ciphertext
+                value mod 26, so letters whose values collide under that
+                reduction cannot be told apart
+        """
+        raise NotImplementedError("RSA display ciphertext is reduced mod 26 and cannot be decrypted")
 
     def get_hints(self) -> tuple[str, str, str]:
         """Get progressive hints for RSA cipher."""
@@ -67,16 +153,4 @@ class RSACipher(BaseCipher):
         hint2 = f"Public key: (n={self.n}, e={self.e})"
         hint3 = f"Private key uses primes p={self.p} and q={self.q}"
 
-        return (hint1, hint2, hint3)
-
-    def get_level_info(self) -> dict:
-        """Get level information for RSA cipher."""
-        return {
-            'name': 'RSA Cipher',
-            'description': 'Asymmetric cipher using prime factorization and modular exponentiation',
-            'difficulty': 'Expert'
-        }
-
-    def get_level_number(self) -> int:
-        """RSA cipher is level 9."""
-        return 9
\ No newline at end of file
+        return (hint1, hint2, hint3)
\ No newline at end of file
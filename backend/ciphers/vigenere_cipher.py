@@ -1,36 +1,89 @@
 import random
 import string
+import numpy as np
+from utils.batch_utils import codes_to_words, rng, words_to_codes
+from utils.translation_utils import LETTERS, SHIFT_BYTE_TABLES
 from .base_cipher import BaseCipher
 
 class VigenereCipher(BaseCipher):
     """Vigenère cipher implementation with random key."""
 
-    def __init__(self):
-        # Random key length between 3 and 7 characters
-        self.key_length = random.randint(3, 7)
-        # Generate random key using uppercase letters
-        self.key = ''.join(random.choice(string.ascii_uppercase) for _ in range(self.key_length))
+    LEVEL = 3
+    NAME = 'Vigenère Cipher'
+    DESCRIPTION = 'Polyalphabetic cipher using a repeating keyword for multiple Caesar shifts'
+    DIFFICULTY = 'Medium'
+
+    def __init__(self, key: str = None):
+        if key is None:
+            # Random key length between 3 and 7 characters
+            key_length = random.randint(3, 7)
+            # Generate random key using uppercase letters
+            key = ''.join(random.choice(string.ascii_uppercase) for _ in range(key_length))
+        self.key = key
+        self.key_length = len(key)
+        # One shift table per key position
+        self._tables = [SHIFT_BYTE_TABLES[ord(k) - ord('A')] for k in key]
+        self._decrypt_tables = None
 
     def encrypt(self, plaintext: str) -> str:
         """Encrypt plaintext using Vigenère cipher."""
-        encrypted = ""
-        key_index = 0
+        return self._translate(plaintext, self._tables)
+
+    def decrypt(self, ciphertext: str) -> str:
+        """Decrypt Vigenère ciphertext by shifting each letter back by its key letter."""
+        if self._decrypt_tables is None:
+            self._decrypt_tables = [SHIFT_BYTE_TABLES[-(ord(k) - ord('A')) % 26] for k in self.key]
+        return self._translate(ciphertext, self._decrypt_tables)
+
+    @staticmethod
+    def _translate(text: str, tables: list) -> str:
+        """Shift the letters of text through the per-key-position tables."""
+        if text.isascii() and text.isalpha():
+            return VigenereCipher._translate_letters(text.encode('ascii'), tables)
+
+        # The key only advances on letters: translate the letters on their own,
+        # then put the other characters back in place
+        letters = ''.join(char for char in text if char in LETTERS)
+        translated_letters = iter(VigenereCipher._translate_letters(letters.encode('ascii'), tables))
+        return ''.join(next(translated_letters) if char in LETTERS else char for char in text)
 
-        for char in plaintext:
-            if char.isalpha():
-                # Convert both plaintext and key to numbers (A=0, B=1, etc.)
-                plain_val = ord(char.upper()) - ord('A')
-                key_val = ord(self.key[key_index % len(self.key)]) - ord('A')
+    @staticmethod
+    def _translate_letters(letters: bytes, tables: list) -> str:
+        """Translate ASCII letters: position i of every key period shares one table."""
+        translated = bytearray(letters)
+        period = len(tables)
+        for offset, table in enumerate(tables):
+            translated[offset::period] = letters[offset::period].translate(table)
+        return translated.decode('ascii')
 
-                # Vigenère encryption: (plaintext + key) mod 26
-                cipher_val = (plain_val + key_val) % 26
-                encrypted += chr(cipher_val + ord('A'))
+    @classmethod
+    def encrypt_batch(cls, words: list) -> tuple:
+        """Encrypt a batch of words with per-word repeating keys gathered into one array add."""
+        codes = words_to_codes(words)
+        count, length = codes.shape
+        key_lengths = rng.integers(3, 8, size=count)
+        keys = rng.integers(0, 26, size=(count, 7), dtype=np.uint8)
 
-                key_index += 1
-            else:
-                encrypted += char
+        # Key letter applied at each position: keys[row, position % key_length]
+        positions = np.arange(length)[None, :] % key_lengths[:, None]
+        shifts = np.take_along_axis(keys, positions, axis=1)
+        encrypted_words = codes_to_words((codes + shifts) % 26)
 
-        return encrypted
+        key_words = codes_to_words(keys)
+        ciphers = [cls(key[:key_length]) for key, key_length in zip(key_words, key_lengths.tolist())]
+        return encrypted_words, ciphers
+
+    @classmethod
+    def decrypt_batch(cls, encrypted_words: list, ciphers: list) -> list:
+        """Decrypt a batch of words by gathering each word's key shifts and subtracting in one array op."""
+        codes = words_to_codes(encrypted_words).astype(np.int16)
+        count, length = codes.shape
+        key_lengths = np.array([cipher.key_length for cipher in ciphers])
+        keys = words_to_codes([cipher.key.ljust(key_lengths.max(), 'A') for cipher in ciphers])
+
+        positions = np.arange(length)[None, :] % key_lengths[:, None]
+        shifts = np.take_along_axis(keys, positions, axis=1)
+        return codes_to_words((codes - shifts) % 26)
 
     def get_hints(self) -> tuple[str, str, str]:
         """Get progressive hints for Vigenère cipher."""
@@ -38,16 +91,4 @@ class VigenereCipher(BaseCipher):
         hint2 = f"The key length is {self.key_length} letters"
         hint3 = f"The key starts with the letter {self.key[0]}"
 
-        return (hint1, hint2, hint3)
-
-    def get_level_info(self) -> dict:
-        """Get level information for Vigenère cipher."""
-        return {
-            'name': 'Vigenère Cipher',
-            'description': 'Polyalphabetic cipher using a repeating keyword for multiple Caesar shifts',
-            'difficulty': 'Medium'
-        }
-
-    def get_level_number(self) -> int:
-        """Vigenère cipher is level 3."""
-        return 3
\ No newline at end of file
+        return (hint1, hint2, hint3)
\ No newline at end of file
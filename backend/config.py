@@ -3,7 +3,98 @@ import os
 class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
     CORS_ORIGINS = os.environ.get('FLASK_CORS_ORIGINS', 'http://localhost:3000').split(',')
+    # Encode JSON responses with orjson when it is installed
+    FAST_JSON = os.environ.get('FAST_JSON', 'true').lower() == 'true'
+    # Load every cipher module, lookup table and the dictionary in create_app
+    # instead of on first use (see app.warm_up, e.g. for preforked servers)
+    WARM_UP = os.environ.get('WARM_UP', 'false').lower() == 'true'
+    # Set when create_app runs in the parent of a preforking server (gunicorn
+    # --preload): it then starts no background services, and each worker must
+    # call app.start_services after the fork (see gunicorn.conf.py). Forking an
+    # app created without it leaves the workers with no background services
+    PRELOAD = os.environ.get('PRELOAD', 'false').lower() == 'true'
+    # How long clients and proxies may cache the static /levels response, in seconds
+    LEVELS_CACHE_MAX_AGE = int(os.environ.get('LEVELS_CACHE_MAX_AGE', 3600))
+    # Directory for generated lookup tables that are memory-mapped at runtime
+    CACHE_DIR = os.environ.get('CRYPTOWORDLE_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache'))
     WORD_API_URL = os.environ.get('WORD_API_URL', 'https://random-word-api.herokuapp.com/word?length=5')
+    # Words requested per upstream round trip and keep-alive connections kept open
+    WORD_API_BATCH_SIZE = int(os.environ.get('WORD_API_BATCH_SIZE', 100))
+    WORD_API_POOL_SIZE = int(os.environ.get('WORD_API_POOL_SIZE', 4))
+    # Seconds to wait for one upstream word API response
+    WORD_API_TIMEOUT = float(os.environ.get('WORD_API_TIMEOUT', 5))
+    # Threads the ASGI app (asgi.py) encrypts puzzles on, off the event loop
+    ASYNC_CPU_WORKERS = int(os.environ.get('ASYNC_CPU_WORKERS', 4))
 
     # Game session timeout in seconds (30 minutes)
-    GAME_SESSION_TIMEOUT = 1800
\ No newline at end of file
+    GAME_SESSION_TIMEOUT = int(os.environ.get('GAME_SESSION_TIMEOUT', 1800))
+    # Number of lock-striped session store shards
+    SESSION_STORE_SHARDS = int(os.environ.get('SESSION_STORE_SHARDS', 16))
+    # Width in seconds of one session-expiry timing-wheel bucket
+    SESSION_EXPIRY_RESOLUTION = float(os.environ.get('SESSION_EXPIRY_RESOLUTION', 1))
+    # How often the background sweeper removes expired sessions, in seconds
+    SESSION_SWEEP_INTERVAL = float(os.environ.get('SESSION_SWEEP_INTERVAL', 30))
+    # 'memory' keeps sessions in this process; 'shared' keeps them in a memory-mapped
+    # table every worker process on the host opens (see services/shared_session_store.py)
+    SESSION_BACKEND = os.environ.get('SESSION_BACKEND', 'memory')
+    # Backing file of the shared table (defaults to /dev/shm, or the temp directory
+    # where there is none) and its size in session slots, rounded up to a power of two
+    SESSION_SHARED_PATH = os.environ.get('SESSION_SHARED_PATH')
+    SESSION_SHARED_CAPACITY = int(os.environ.get('SESSION_SHARED_CAPACITY', 1 << 20))
+    # Stateless sessions: hand out AES-GCM tokens (keyed from SECRET_KEY) as session ids
+    # instead of storing games, refusing replays of a game's older tokens through a
+    # per-process LRU cache of this many games (see services/session_tokens.py)
+    SESSION_TOKENS = os.environ.get('SESSION_TOKENS', 'false').lower() == 'true'
+    SESSION_TOKEN_REPLAY_CACHE = int(os.environ.get('SESSION_TOKEN_REPLAY_CACHE', 65536))
+
+    # Prefetched word pool: refill to the high watermark once depth drops below the low one
+    WORD_POOL_PREFETCH = os.environ.get('WORD_POOL_PREFETCH', 'true').lower() == 'true'
+    WORD_POOL_HIGH_WATERMARK = int(os.environ.get('WORD_POOL_HIGH_WATERMARK', 200))
+    WORD_POOL_LOW_WATERMARK = int(os.environ.get('WORD_POOL_LOW_WATERMARK', 50))
+    WORD_POOL_RETRY_INTERVAL = float(os.environ.get('WORD_POOL_RETRY_INTERVAL', 5))
+
+    # Pre-generated puzzle queues: target depth per cipher level and refill worker threads
+    PUZZLE_PREGENERATE = os.environ.get('PUZZLE_PREGENERATE', 'true').lower() == 'true'
+    PUZZLE_QUEUE_DEPTHS = {
+        level: int(os.environ.get(f'PUZZLE_QUEUE_DEPTH_{level}', 32)) for level in range(1, 10)
+    }
+    PUZZLE_FACTORY_WORKERS = int(os.environ.get('PUZZLE_FACTORY_WORKERS', 2))
+    # Puzzles encrypted per batched cipher call when refilling a queue
+    PUZZLE_BATCH_SIZE = int(os.environ.get('PUZZLE_BATCH_SIZE', 16))
+    # Drop puzzles that do not decrypt back to their word; rejected words are
+    # retried with fresh keys in later batches until tried this many times in total (at least once)
+    PUZZLE_VERIFY = os.environ.get('PUZZLE_VERIFY', 'true').lower() == 'true'
+    PUZZLE_VERIFY_ATTEMPTS = int(os.environ.get('PUZZLE_VERIFY_ATTEMPTS', 3))
+    # Score pre-generated puzzles by how many dictionary words fit them after
+    # each hint; reject those with more than PUZZLE_MAX_CANDIDATES fits at
+    # PUZZLE_AMBIGUITY_TIER hints (0 only records the scores). Only applies
+    # when DICTIONARY_PATH names a word list
+    PUZZLE_SCORE_AMBIGUITY = os.environ.get('PUZZLE_SCORE_AMBIGUITY', 'true').lower() == 'true'
+    PUZZLE_MAX_CANDIDATES = int(os.environ.get('PUZZLE_MAX_CANDIDATES', 0))
+    PUZZLE_AMBIGUITY_TIER = int(os.environ.get('PUZZLE_AMBIGUITY_TIER', 3))
+
+    # Word list (one word per line) of valid guesses, also used as the puzzle
+    # analysis dictionary; unset uses the built-in fallback words
+    DICTIONARY_PATH = os.environ.get('DICTIONARY_PATH')
+    # Reject guesses that are not in the dictionary (the answer is always
+    # accepted); only applies when DICTIONARY_PATH names a word list
+    DICTIONARY_CHECK_GUESSES = os.environ.get('DICTIONARY_CHECK_GUESSES', 'true').lower() == 'true'
+    # Precompute the dictionary's answers x guesses feedback matrix at startup
+    FEEDBACK_MATRIX = os.environ.get('FEEDBACK_MATRIX', 'true').lower() == 'true'
+
+    # Hill cipher key matrix size (n x n)
+    HILL_MATRIX_SIZE = int(os.environ.get('HILL_MATRIX_SIZE', 2))
+
+    # RSA demo keys use every prime pair from this range ("low:high"); unset uses the built-in small primes
+    RSA_PRIME_RANGE = os.environ.get('RSA_PRIME_RANGE')
+
+    # RSA modulus size in bits for generated keys (0 keeps the small demo primes)
+    RSA_KEY_BITS = int(os.environ.get('RSA_KEY_BITS', 0))
+    # Reservoir of pre-generated RSA keypairs, refilled by a process pool; the refill
+    # thread checks its depth and retries failed refills every RETRY_INTERVAL seconds
+    RSA_KEY_POOL_HIGH_WATERMARK = int(os.environ.get('RSA_KEY_POOL_HIGH_WATERMARK', 64))
+    RSA_KEY_POOL_LOW_WATERMARK = int(os.environ.get('RSA_KEY_POOL_LOW_WATERMARK', 16))
+    RSA_KEY_POOL_WORKERS = int(os.environ.get('RSA_KEY_POOL_WORKERS', 2))
+    RSA_KEY_POOL_RETRY_INTERVAL = float(os.environ.get('RSA_KEY_POOL_RETRY_INTERVAL', 5))
+    # Block startup until the reservoir holds at least its low watermark of keys
+    RSA_KEY_WARMUP = os.environ.get('RSA_KEY_WARMUP', 'false').lower() == 'true'
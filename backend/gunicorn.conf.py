@@ -0,0 +1,24 @@
+"""
+gunicorn settings for serving the backend from a preloaded app:
+
+    gunicorn -c gunicorn.conf.py 'app:create_app()'
+
+The master creates the app once (with WARM_UP, every worker shares its
+loaded modules and tables) but, with PRELOAD set, starts none of the
+background services: it never serves a request. Each worker starts its own
+in post_fork. By then the fork hooks in utils.batch_utils and the shared
+session store have reseeded the key generator and reopened the session file.
+"""
+import os
+
+# Read by config.Config, which the app imports after this file is loaded
+os.environ.setdefault('PRELOAD', 'true')
+os.environ.setdefault('WARM_UP', 'true')
+
+preload_app = True
+
+def post_fork(server, worker):
+    """Start the worker's word pool, puzzle factory, session sweeper and other services."""
+    from app import start_services
+
+    start_services(server.app.wsgi())
@@ -1,70 +1,226 @@
-import time
+import hashlib
 import uuid
-from flask import Blueprint, request, jsonify
-from services.word_service import WordService
-from services.cipher_service import CipherService
+from flask import Blueprint, current_app, request, jsonify
+from config import Config
+from services.cipher_registry import cipher_registry
+from services.dictionary_service import word_dictionary
+from services.session_store import session_store
+from services.session_tokens import session_tokens
 from services.validation_service import ValidationService
+from utils.feedback_utils import ALL_GREEN, decode_feedback
+from utils.serialization import COMPACT_MIMETYPE, wants_compact
 
 game_bp = Blueprint('game', __name__)
 
-# In-memory storage for game sessions (use Redis in production)
-game_sessions = {}
+def store_game_data(level: int, actual_word: str, cipher_name: str) -> str:
+    """
+    Start a game.
 
-def store_game_data(session_id: str, level: int, actual_word: str, cipher_name: str):
-    """Store game data in session."""
-    game_sessions[session_id] = {
+    Returns:
+        The session id for the client: a new UUID whose game is kept in
+        the session store, or the game's first token in token mode
+        (Config.SESSION_TOKENS)
+    """
+    if Config.SESSION_TOKENS:
+        return session_tokens.issue(level, actual_word)
+    session_id = str(uuid.uuid4())
+    session_store.put(session_id, level, actual_word, cipher_name)
+    return session_id
+
+def get_game_data(session_id: str, registry=None):
+    """
+    Get game data from session (None if there is no such game).
+
+    Args:
+        session_id: Session id (or token) sent by the client
+        registry: The app's CipherRegistry; token mode names the cipher from it
+    """
+    if Config.SESSION_TOKENS:
+        return session_tokens.get(session_id, registry)
+    return session_store.get(session_id)
+
+def advance_game(session_id: str, registry=None) -> tuple:
+    """
+    Use up one attempt of a game (registry as in get_game_data).
+
+    Returns:
+        (updated game data, session id for the next guess), or (None, None)
+        if there is no such game; the session id only changes in token mode
+    """
+    if Config.SESSION_TOKENS:
+        return session_tokens.increment_attempts(session_id, registry) or (None, None)
+    return session_store.increment_attempts(session_id), session_id
+
+def end_game(session_id: str, registry=None):
+    """Remove a finished game (registry as in get_game_data)."""
+    if Config.SESSION_TOKENS:
+        session_tokens.pop(session_id, registry)
+    else:
+        session_store.pop(session_id)
+
+def get_registry():
+    """The cipher registry attached to the current app (see create_app)."""
+    return current_app.extensions.setdefault('cipher_registry', cipher_registry)
+
+def get_puzzle_factory():
+    """The puzzle factory built from the current app's registry (see create_app)."""
+    return current_app.extensions['puzzle_factory']
+
+def levels_body() -> tuple:
+    """
+    The serialized /levels body and its ETag, built once per app.
+
+    Building it imports every cipher module, so it happens on the first
+    /levels request or in app.warm_up, not at registration.
+    """
+    cached = current_app.extensions.get('levels_response')
+    if cached is None:
+        body = jsonify({'levels': get_registry().get_all_levels_info()}).get_data()
+        cached = current_app.extensions['levels_response'] = (body, hashlib.sha256(body).hexdigest()[:32])
+    return cached
+
+def puzzle_payload(session_id: str, level: int, cipher_name: str, encrypted_word: str, hints,
+                   compact: bool = False) -> dict:
+    """
+    Build the /generate response body.
+
+    The compact form names the cipher by its numeric id (the level number)
+    and sends the hints as one list.
+    """
+    if compact:
+        return {
+            'session_id': session_id,
+            'cipher': level,
+            'encrypted_word': encrypted_word,
+            'hints': list(hints)
+        }
+    return {
+        'session_id': session_id,
+        'cipher': cipher_name,
+        'encrypted_word': encrypted_word,
         'level': level,
-        'actual_word': actual_word,
-        'cipher_name': cipher_name,
-        'timestamp': time.time(),
-        'attempts': 0
+        'hint1': hints[0],
+        'hint2': hints[1],
+        'hint3': hints[2]
     }
 
-def get_game_data(session_id: str):
-    """Get game data from session."""
-    return game_sessions.get(session_id)
+def guess_payload(code: int, attempts: int, actual_word: str = None, compact: bool = False,
+                  session_id: str = None) -> dict:
+    """
+    Build the /validate response body.
+
+    The compact form sends the feedback as its base-3 code (letter i is
+    code // 3**i % 3: 0 gray, 1 yellow, 2 green) instead of five color names.
+
+    Args:
+        code: Feedback code of the guess
+        attempts: Attempts used so far
+        actual_word: The answer, included once the game is over
+        compact: Use the compact form
+        session_id: Session id for the next guess, included when it changed
+            (token mode)
+    """
+    is_correct = code == ALL_GREEN
+    response = {
+        'result': code if compact else decode_feedback(code),
+        'correct': is_correct,
+        'attempts': attempts,
+        'max_attempts': 6
+    }
+    if actual_word is not None:
+        response['game_over'] = True
+        response['actual_word'] = actual_word
+    if session_id is not None:
+        response['session_id'] = session_id
+    return response
+
+def play_guess(data, registry, compact: bool = False) -> tuple:
+    """
+    Check a /validate request body and play its guess.
+
+    Shared by the Flask and async views; it takes session-store locks and,
+    in token mode, seals a new token, so async callers run it off the event
+    loop.
+
+    Args:
+        data: The decoded JSON body
+        registry: The app's CipherRegistry
+        compact: Build the compact response form
+
+    Returns:
+        (response body, HTTP status); error bodies are {'error': message}
+
+    Raises:
+        ValueError: If the session token has already been used (token mode)
+    """
+    if not data or not isinstance(data, dict):
+        return {'error': 'No data provided'}, 400
+
+    guess = data.get('guess', '').upper().strip()
+    session_id = data.get('session_id')
+
+    if not guess or not session_id:
+        return {'error': 'Guess and session_id are required'}, 400
+
+    if len(guess) != 5:
+        return {'error': 'Guess must be exactly 5 letters'}, 400
+
+    if not (guess.isascii() and guess.isalpha()):
+        return {'error': 'Guess must contain only letters A-Z'}, 400
 
-def cleanup_old_sessions():
-    """Remove old sessions (older than 30 minutes)."""
-    current_time = time.time()
-    expired_sessions = [
-        session_id for session_id, data in game_sessions.items()
-        if current_time - data['timestamp'] > 1800  # 30 minutes
-    ]
-    for session_id in expired_sessions:
-        del game_sessions[session_id]
+    # Get game data
+    game_data = get_game_data(session_id, registry)
+    if not game_data:
+        return {'error': 'No active game found. Please start a new game.'}, 404
+
+    # Unknown words are refused without using up an attempt
+    is_answer = guess == game_data.actual_word.upper()
+    if Config.DICTIONARY_CHECK_GUESSES and not is_answer and not word_dictionary.accepts_guess(guess):
+        return {'error': 'Not in word list'}, 400
+
+    # Validate the guess
+    code = ValidationService.feedback_code(guess, game_data.actual_word)
+    is_correct = code == ALL_GREEN
+
+    # Update attempts count (also refreshes the timestamp for session timeout)
+    game_data, next_session_id = advance_game(session_id, registry)
+    if not game_data:
+        return {'error': 'No active game found. Please start a new game.'}, 404
+
+    # If game is over, remove the session
+    actual_word = None
+    if is_correct or game_data.attempts >= 6:
+        actual_word = game_data.actual_word
+        end_game(session_id, registry)
+        next_session_id = None
+    elif next_session_id == session_id:
+        next_session_id = None
+
+    return guess_payload(code, game_data.attempts, actual_word, compact, next_session_id), 200
+
+def compact_response(payload: dict):
+    """jsonify a compact payload under the compact media type."""
+    response = jsonify(payload)
+    response.mimetype = COMPACT_MIMETYPE
+    return response
 
 @game_bp.route('/generate', methods=['GET'])
 def generate_puzzle():
     """Generate a new encrypted word puzzle."""
     try:
         level = int(request.args.get('level', 1))
-        cleanup_old_sessions()
-
-        # Fetch a 5-letter word
-        word = WordService.fetch_5_letter_word()
+        # Raises ValueError for levels the app's registry does not know
+        get_registry().get_cipher_class(level)
 
-        # Encrypt the word using the appropriate cipher
-        cipher_service = CipherService()
-        encrypted_word, cipher_name, hints = cipher_service.encrypt_word(word, level)
+        # Take a pre-built puzzle for this level from the factory queue
+        word, encrypted_word, cipher_name, hints = get_puzzle_factory().take(level)
 
-        # Generate a unique session ID
-        session_id = str(uuid.uuid4())
+        # Store game data under a new session ID
+        session_id = store_game_data(level, word, cipher_name)
 
-        # Store game data
-        store_game_data(session_id, level, word, cipher_name)
-
-        response = {
-            'session_id': session_id,
-            'cipher': cipher_name,
-            'encrypted_word': encrypted_word,
-            'level': level,
-            'hint1': hints[0],
-            'hint2': hints[1],
-            'hint3': hints[2]
-        }
-
-        return jsonify(response)
+        if wants_compact():
+            return compact_response(puzzle_payload(session_id, level, cipher_name, encrypted_word, hints, True))
+        return jsonify(puzzle_payload(session_id, level, cipher_name, encrypted_word, hints))
 
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
@@ -76,46 +232,11 @@ def generate_puzzle():
 def validate_guess():
     """Validate a user's guess."""
     try:
-        data = request.get_json()
-        if not data:
-            return jsonify({'error': 'No data provided'}), 400
-
-        guess = data.get('guess', '').upper().strip()
-        session_id = data.get('session_id')
-
-        if not guess or not session_id:
-            return jsonify({'error': 'Guess and session_id are required'}), 400
-
-        if len(guess) != 5:
-            return jsonify({'error': 'Guess must be exactly 5 letters'}), 400
-
-        # Get game data
-        game_data = get_game_data(session_id)
-        if not game_data:
-            return jsonify({'error': 'No active game found. Please start a new game.'}), 404
-
-        # Validate the guess
-        validation_service = ValidationService()
-        feedback, is_correct = validation_service.validate_guess(guess, game_data['actual_word'])
-
-        # Update attempts count
-        game_data['attempts'] += 1
-        game_data['timestamp'] = time.time()  # Update timestamp for session timeout
-
-        response = {
-            'result': feedback,
-            'correct': is_correct,
-            'attempts': game_data['attempts'],
-            'max_attempts': 6
-        }
-
-        # If game is over, remove the session
-        if is_correct or game_data['attempts'] >= 6:
-            response['game_over'] = True
-            response['actual_word'] = game_data['actual_word']
-            del game_sessions[session_id]
-
-        return jsonify(response)
+        compact = wants_compact()
+        body, status = play_guess(request.get_json(silent=True), get_registry(), compact)
+        if status == 200 and compact:
+            return compact_response(body)
+        return jsonify(body), status
 
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
@@ -125,11 +246,14 @@ def validate_guess():
 
 @game_bp.route('/levels', methods=['GET'])
 def get_levels():
-    """Get information about all available cipher levels."""
+    """Get information about all available cipher levels (static; supports If-None-Match)."""
     try:
-        cipher_service = CipherService()
-        levels = cipher_service.get_all_levels_info()
-        return jsonify({'levels': levels})
+        body, etag = levels_body()
+        response = current_app.response_class(body, mimetype='application/json')
+        response.set_etag(etag)
+        response.cache_control.public = True
+        response.cache_control.max_age = Config.LEVELS_CACHE_MAX_AGE
+        return response.make_conditional(request)
     except Exception as e:
         print(f"Error getting levels: {e}")
         return jsonify({'error': 'Failed to get levels'}), 500
@@ -142,17 +266,25 @@ def get_game_status():
         if not session_id:
             return jsonify({'error': 'session_id is required'}), 400
 
-        game_data = get_game_data(session_id)
+        game_data = get_game_data(session_id, get_registry())
         if not game_data:
             return jsonify({'error': 'No active game found'}), 404
 
+        if wants_compact():
+            return compact_response({
+                'level': game_data.level,
+                'attempts': game_data.attempts,
+                'max_attempts': 6
+            })
         return jsonify({
-            'level': game_data['level'],
-            'cipher_name': game_data['cipher_name'],
-            'attempts': game_data['attempts'],
+            'level': game_data.level,
+            'cipher_name': game_data.cipher_name,
+            'attempts': game_data.attempts,
             'max_attempts': 6
         })
 
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         print(f"Error getting game status: {e}")
         return jsonify({'error': 'Failed to get game status'}), 500
\ No newline at end of file
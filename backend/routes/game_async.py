@@ -0,0 +1,102 @@
+import asyncio
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from config import Config
+from routes.game import play_guess, puzzle_payload, store_game_data
+from utils.serialization import COMPACT_MIMETYPE, orjson
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse encoded with orjson when it is installed and Config.FAST_JSON is set."""
+
+    def render(self, content) -> bytes:
+        if orjson is not None and Config.FAST_JSON:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        return super().render(content)
+
+def wants_compact(request: Request) -> bool:
+    """Whether the request asked for the compact response format (see utils.serialization)."""
+    if request.query_params.get('compact', '').lower() in ('1', 'true'):
+        return True
+    accept = request.headers.get('accept', '')
+    return any(part.split(';')[0].strip() == COMPACT_MIMETYPE for part in accept.split(','))
+
+def json_response(request: Request, payload: dict, status_code: int = 200) -> FastJSONResponse:
+    """Encode a payload, under the compact media type if the request asked for it."""
+    media_type = COMPACT_MIMETYPE if wants_compact(request) else None
+    return FastJSONResponse(payload, status_code=status_code, media_type=media_type)
+
+def error_response(message: str, status_code: int) -> FastJSONResponse:
+    """Error body in the same shape as the Flask routes."""
+    return FastJSONResponse({'error': message}, status_code=status_code)
+
+def start_game(puzzle_factory, level: int, puzzle: tuple = None, word: str = None) -> tuple:
+    """
+    Build the puzzle if none was queued, then store the game (runs on the CPU executor).
+
+    Returns:
+        (puzzle, session id)
+    """
+    if puzzle is None:
+        puzzle = puzzle_factory.build_puzzle(level, word)
+    word, _, cipher_name, _ = puzzle
+    return puzzle, store_game_data(level, word, cipher_name)
+
+async def generate_puzzle(request: Request):
+    """Generate a new encrypted word puzzle without holding a thread while upstream is slow."""
+    try:
+        level = int(request.query_params.get('level', 1))
+        # Raises ValueError for levels the app's registry does not know
+        request.app.state.cipher_registry.get_cipher_class(level)
+
+        puzzle_factory = request.app.state.puzzle_factory
+        puzzle = puzzle_factory.try_take(level)
+        word = None
+        if puzzle is None:
+            # Wait on the word API as a coroutine; encryption happens on the CPU executor
+            word = await request.app.state.word_service.get_word()
+        # Session storage takes store locks or seals a token, so it leaves the event loop too
+        puzzle, session_id = await asyncio.get_running_loop().run_in_executor(
+            request.app.state.cpu_executor, start_game, puzzle_factory, level, puzzle, word
+        )
+        _, encrypted_word, cipher_name, hints = puzzle
+
+        return json_response(request, puzzle_payload(
+            session_id, level, cipher_name, encrypted_word, hints, wants_compact(request)
+        ))
+
+    except ValueError as e:
+        return error_response(str(e), 400)
+    except Exception as e:
+        print(f"Error generating puzzle: {e}")
+        return error_response('Failed to generate puzzle', 500)
+
+async def validate_guess(request: Request):
+    """Validate a user's guess."""
+    try:
+        try:
+            data = await request.json()
+        except ValueError:
+            data = None
+
+        # Store locks, token sealing and the first dictionary load all block, so none of it runs on the event loop
+        compact = wants_compact(request)
+        body, status = await asyncio.get_running_loop().run_in_executor(
+            request.app.state.cpu_executor, play_guess, data, request.app.state.cipher_registry, compact
+        )
+        if status != 200:
+            return error_response(body['error'], status)
+        return json_response(request, body)
+
+    except ValueError as e:
+        return error_response(str(e), 400)
+    except Exception as e:
+        print(f"Error validating guess: {e}")
+        return error_response('Failed to validate guess', 500)
+
+def game_routes(prefix: str = '') -> list:
+    """Async routes for /generate and /validate under a URL prefix."""
+    return [
+        Route(f'{prefix}/generate', generate_puzzle, methods=['GET']),
+        Route(f'{prefix}/validate', validate_guess, methods=['POST'])
+    ]
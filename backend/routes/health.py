@@ -1,4 +1,10 @@
-from flask import Blueprint, jsonify
+from flask import Blueprint, current_app, jsonify
+from services.dictionary_service import word_dictionary
+from services.feedback_engine import feedback_engine
+from services.rsa_key_reservoir import rsa_key_reservoir
+from services.session_tokens import session_tokens
+from services.word_pool import word_pool
+from services.word_service import WordService
 
 health_bp = Blueprint('health', __name__)
 
@@ -8,4 +14,21 @@ def health_check():
     return jsonify({
         'status': 'healthy',
         'message': 'CryptoWordle API is running'
+    })
+
+@health_bp.route('/metrics', methods=['GET'])
+def metrics():
+    """Expose internal pool metrics used to size the backend."""
+    # Imported here: the analyzer loads every cipher module, which startup avoids
+    from services.ambiguity_analyzer import ambiguity_analyzer
+
+    return jsonify({
+        'word_pool': word_pool.get_stats(),
+        'word_api': WordService.get_stats(),
+        'puzzle_factory': current_app.extensions['puzzle_factory'].get_stats(),
+        'rsa_key_reservoir': rsa_key_reservoir.get_stats(),
+        'ambiguity': ambiguity_analyzer.get_stats(),
+        'dictionary': word_dictionary.get_stats(),
+        'feedback': feedback_engine.get_stats(),
+        'session_tokens': session_tokens.get_stats()
     })
\ No newline at end of file
@@ -0,0 +1,241 @@
+import threading
+import numpy as np
+from ciphers.caesar_cipher import CaesarCipher
+from ciphers.hill_cipher import HillCipher
+from ciphers.monoalphabetic_cipher import MonoalphabeticCipher
+from ciphers.otp_cipher import OneTimePadCipher
+from ciphers.rail_fence_cipher import RailFenceCipher, rail_permutation
+from ciphers.rsa_cipher import RSACipher, rsa_key_cache
+from ciphers.vigenere_cipher import VigenereCipher
+from services.dictionary_service import word_dictionary
+from utils.batch_utils import pack_codes, words_to_codes
+from utils.math_utils import invertible_2x2_table, matrix_mod_inv, mod_det, modinv
+from utils.word_index import WordIndex
+from utils.word_utils import WORD_LENGTH
+
+# Candidate counts are reported after 0, 1, 2 and 3 hints
+HINT_TIERS = 4
+
+# Shift ranges named by the Caesar cipher's second hint
+_CAESAR_BRACKETS = ((1, 5), (6, 10), (11, 15), (16, 20), (21, 25))
+
+def _count(consistent: np.ndarray) -> int:
+    """Number of dictionary words flagged consistent."""
+    return int(np.count_nonzero(consistent))
+
+class AmbiguityAnalyzer:
+    """
+    Counts how many dictionary words are consistent with a puzzle as hints are revealed.
+
+    Each cipher's remaining key space is enumerated as one array operation:
+    over the keys themselves where the space is small (Caesar shifts, Rail
+    Fence depths, every invertible 2x2 Hill matrix), or over the dictionary
+    where it is not (monoalphabetic, Vigenère, One-Time Pad and RSA keys
+    are checked as constraints on each candidate word). Playfair and DES
+    are not supported.
+    """
+
+    def __init__(self, index: WordIndex = None):
+        self._index = index
+        self._dictionary = None
+        self._hill_inverses = None
+        self._analyzers = {
+            CaesarCipher: self._caesar,
+            MonoalphabeticCipher: self._monoalphabetic,
+            VigenereCipher: self._vigenere,
+            RailFenceCipher: self._rail_fence,
+            HillCipher: self._hill,
+            OneTimePadCipher: self._one_time_pad,
+            RSACipher: self._rsa,
+        }
+
+        self._stats_lock = threading.Lock()
+        self._scored = {}
+        self._tier_totals = {}
+
+    @property
+    def index(self) -> WordIndex:
+        """The candidate word index (the shared dictionary unless one was given)."""
+        if self._index is None:
+            self._index = word_dictionary.index
+        return self._index
+
+    def supports(self, cipher) -> bool:
+        """Whether puzzles from this cipher can be analyzed."""
+        if isinstance(cipher, HillCipher) and cipher.matrix_size != 2:
+            return False
+        return type(cipher) in self._analyzers
+
+    def analyze(self, encrypted_word: str, cipher):
+        """
+        Count the dictionary words consistent with a puzzle at each hint tier.
+
+        Args:
+            encrypted_word: The puzzle ciphertext
+            cipher: The cipher instance that produced it (its key determines
+                what each hint reveals)
+
+        Returns:
+            Tuple of HINT_TIERS counts (after 0, 1, 2 and 3 hints), or None if
+            the cipher is not supported
+        """
+        if not self.supports(cipher):
+            return None
+        ciphertext = words_to_codes([encrypted_word])[0].astype(np.int64)
+        counts = tuple(int(count) for count in self._analyzers[type(cipher)](ciphertext, cipher))
+
+        name = cipher.NAME
+        with self._stats_lock:
+            self._scored[name] = self._scored.get(name, 0) + 1
+            totals = self._tier_totals.setdefault(name, [0] * HINT_TIERS)
+            for tier, count in enumerate(counts):
+                totals[tier] += count
+        return counts
+
+    def get_stats(self) -> dict:
+        """
+        Get per-cipher scoring metrics.
+
+        Returns:
+            Dictionary of cipher name -> puzzles scored and mean candidate
+            count at each hint tier
+        """
+        with self._stats_lock:
+            return {
+                name: {
+                    'scored': scored,
+                    'mean_candidates': [round(total / scored, 2) for total in self._tier_totals[name]]
+                }
+                for name, scored in self._scored.items()
+            }
+
+    def _dictionary_codes(self) -> np.ndarray:
+        """Every dictionary word as an (N, 5) int64 array of letter codes."""
+        if self._dictionary is None:
+            self._dictionary = self.index.letter_codes().astype(np.int64)
+        return self._dictionary
+
+    def _count_candidates(self, candidates: np.ndarray) -> int:
+        """Number of distinct dictionary words among (K, 5) candidate plaintexts."""
+        packed = pack_codes(candidates)
+        return len(np.unique(packed[self.index.contains_codes(packed)]))
+
+    def _caesar(self, ciphertext, cipher):
+        """Key space: shifts 1-25, then the hinted range of 5, then the exact shift."""
+        def count(shifts):
+            return self._count_candidates((ciphertext[None, :] - np.asarray(shifts)[:, None]) % 26)
+
+        every_shift = count(range(1, 26))
+        low, high = next(bracket for bracket in _CAESAR_BRACKETS if bracket[0] <= cipher.shift <= bracket[1])
+        return every_shift, every_shift, count(range(low, high + 1)), count([cipher.shift])
+
+    def _monoalphabetic(self, ciphertext, cipher):
+        """Scan the dictionary: a word fits if its letter pattern matches and revealed letters agree."""
+        words = self._dictionary_codes()
+        # Same repeated-letter pattern <=> some substitution maps the word to the ciphertext
+        fits = np.ones(len(words), dtype=bool)
+        for i in range(WORD_LENGTH):
+            for j in range(i + 1, WORD_LENGTH):
+                fits &= (words[:, i] == words[:, j]) == (ciphertext[i] == ciphertext[j])
+        pattern = _count(fits)
+
+        def reveal(fits, plain, encrypted):
+            # plain appears exactly where its cipher letter does
+            return fits & np.all((words == ord(plain) - 65) == (ciphertext == ord(encrypted) - 65), axis=1)
+
+        fits = reveal(fits, 'E', cipher.mapping['E'])
+        with_e = _count(fits)
+        for plain, encrypted in cipher.revealed_mappings():
+            fits = reveal(fits, plain, encrypted)
+        return pattern, pattern, with_e, _count(fits)
+
+    def _vigenere(self, ciphertext, cipher):
+        """Scan the dictionary: a word fits a key length if positions one key period apart share a shift."""
+        shifts = (ciphertext[None, :] - self._dictionary_codes()) % 26
+
+        def fits_key_length(length):
+            fits = np.ones(len(shifts), dtype=bool)
+            for i in range(WORD_LENGTH - length):
+                fits &= shifts[:, i] == shifts[:, i + length]
+            return fits
+
+        any_length = np.zeros(len(shifts), dtype=bool)
+        for length in range(3, 8):
+            any_length |= fits_key_length(length)
+        exact_length = fits_key_length(cipher.key_length)
+        first_letter = exact_length & (shifts[:, 0] == ord(cipher.key[0]) - 65)
+
+        any_count = _count(any_length)
+        return any_count, any_count, _count(exact_length), _count(first_letter)
+
+    def _rail_fence(self, ciphertext, cipher):
+        """Key space: every zigzag depth, then depths 2-4, then the exact depth."""
+        length = len(ciphertext)
+
+        def count(depths):
+            inverses = np.stack([np.argsort(rail_permutation(depth, length)) for depth in depths])
+            return self._count_candidates(ciphertext[inverses])
+
+        every_depth = count(range(2, max(length, 2) + 1))
+        return every_depth, every_depth, count(range(2, 5)), count([cipher.fence_depth])
+
+    def _hill(self, ciphertext, cipher):
+        """Key space: every invertible 2x2 matrix, then those with the hinted determinant, then the key."""
+        if self._hill_inverses is None:
+            # The inverses of all invertible matrices are all invertible matrices
+            table = invertible_2x2_table().astype(np.int64)
+            determinants = (table[:, 0] * table[:, 3] - table[:, 1] * table[:, 2]) % 26
+            self._hill_inverses = (table.reshape(-1, 2, 2), determinants)
+        inverses, determinants = self._hill_inverses
+        blocks = ciphertext.reshape(-1, 2)
+        if len(ciphertext) > WORD_LENGTH:
+            # A 5-letter answer was padded with X to fill the last block, so
+            # only keys that decrypt the pad letter to X need a full decrypt
+            pad_letters = inverses[:, 1, :] @ blocks[-1] % 26
+            keep = pad_letters == ord('X') - 65
+            inverses, determinants = inverses[keep], determinants[keep]
+
+        # Keys whose first block is not the start of any dictionary word are skipped too
+        words = self._dictionary_codes()
+        prefixes = np.zeros(26 * 26, dtype=bool)
+        prefixes[words[:, 0] * 26 + words[:, 1]] = True
+        first_block = inverses @ blocks[0] % 26
+        keep = prefixes[first_block[:, 0] * 26 + first_block[:, 1]]
+        inverses, determinants = inverses[keep], determinants[keep]
+
+        def count(keys):
+            plaintexts = np.einsum('kij,bj->kbi', keys, blocks).reshape(len(keys), -1) % 26
+            return self._count_candidates(plaintexts[:, :WORD_LENGTH])
+
+        every_key = count(inverses)
+        with_det = count(inverses[determinants == modinv(mod_det(cipher.key_matrix, 26), 26)])
+        own_key = matrix_mod_inv(cipher.key_matrix, 26)[None]
+        return every_key, every_key, with_det, count(own_key)
+
+    def _one_time_pad(self, ciphertext, cipher):
+        """Any word fits until the third hint fixes the first three pad letters."""
+        words = self._dictionary_codes()
+        pad = words_to_codes([cipher.key[:3]])[0].astype(np.int64)
+        fits = np.all((ciphertext[None, :3] - words[:, :3]) % 26 == pad, axis=1)
+        return len(words), len(words), len(words), int(np.count_nonzero(fits))
+
+    def _rsa(self, ciphertext, cipher):
+        """Scan the dictionary against each candidate key's display function."""
+        words = self._dictionary_codes()
+
+        def fits(keypairs):
+            displays = np.array([keypair.encrypt_table for keypair in keypairs], dtype=object) % 26
+            displays = displays.astype(np.int64)
+            # displays[k][words] is each word as shown under key k
+            matches = np.all(displays[:, words] == ciphertext, axis=2)
+            return _count(matches.any(axis=0))
+
+        keypairs = list(rsa_key_cache.keypairs())
+        if cipher.keypair not in keypairs:
+            keypairs.append(cipher.keypair)
+        any_key = fits(keypairs)
+        own_key = fits([cipher.keypair])
+        return any_key, any_key, own_key, own_key
+
+# Process-wide analyzer sharing one candidate index
+ambiguity_analyzer = AmbiguityAnalyzer()
@@ -0,0 +1,151 @@
+import asyncio
+import threading
+from collections import deque
+from typing import List
+from config import Config
+from services.word_pool import word_pool
+from services.word_service import WordService
+
+class AsyncWordService:
+    """
+    Word API client for the ASGI app (asgi.py).
+
+    All requests share one httpx.AsyncClient and its connection pool, so a
+    slow upstream holds waiting coroutines rather than threads. Requests
+    that find the prefetch pool empty join a single in-flight batch fetch,
+    sized for everyone waiting, instead of each making a round trip.
+    """
+
+    # Batch fetches a request waits on before falling back to the local word list
+    REFILL_ROUNDS = 2
+
+    def __init__(self, pool=None, transport=None):
+        self.pool = pool or word_pool
+        # Optional httpx transport, e.g. httpx.ASGITransport over a stand-in word API
+        self._transport = transport
+        self._client = None
+        # Words fetched for waiting requests, handed out before the next fetch
+        self._words = deque()
+        self._pending = None
+        self._waiting = 0
+
+        self._stats_lock = threading.Lock()
+        self._upstream_requests = 0
+        self._words_received = 0
+        self._coalesced = 0
+        self._fallbacks = 0
+
+    async def start(self):
+        """Open the shared client (no-op if already open); bound to the running event loop."""
+        if self._client is None:
+            import httpx
+            limits = httpx.Limits(
+                max_connections=Config.WORD_API_POOL_SIZE,
+                max_keepalive_connections=Config.WORD_API_POOL_SIZE
+            )
+            self._client = httpx.AsyncClient(limits=limits, timeout=Config.WORD_API_TIMEOUT,
+                                             transport=self._transport)
+
+    async def close(self):
+        """Cancel any in-flight fetch and close the shared client."""
+        if self._pending is not None:
+            self._pending.cancel()
+            self._pending = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def fetch_batch(self, count: int = None, max_attempts: int = 5) -> List[str]:
+        """
+        Fetch a batch of random 5-letter words from the external API only.
+
+        Args:
+            count: Number of words to request (defaults to Config.WORD_API_BATCH_SIZE)
+            max_attempts: Round trips to try before giving up
+
+        Returns:
+            List of valid 5-letter words in uppercase; empty if no valid
+            word was received
+        """
+        import httpx
+
+        count = count or Config.WORD_API_BATCH_SIZE
+        await self.start()
+        for _ in range(max_attempts):
+            try:
+                response = await self._client.get(Config.WORD_API_URL, params={'number': count})
+                response.raise_for_status()
+                word_data = response.json()
+            except (httpx.HTTPError, ValueError) as e:
+                print(f"Error fetching words: {e}")
+                continue
+
+            with self._stats_lock:
+                self._upstream_requests += 1
+            words = WordService.parse_words(word_data)
+            if words:
+                with self._stats_lock:
+                    self._words_received += len(words)
+                return words
+        return []
+
+    async def get_word(self) -> str:
+        """
+        Get a word for a puzzle, waiting on the word API if none is ready.
+
+        Returns:
+            A 5-letter word in uppercase: from the prefetch pool, else from
+            a batch fetch, else from the local fallback list
+        """
+        word = self.pool.try_get_word()
+        if word is not None:
+            return word
+
+        self._waiting += 1
+        try:
+            for _ in range(self.REFILL_ROUNDS):
+                if self._words:
+                    return self._words.popleft()
+                await self._refill()
+            if self._words:
+                return self._words.popleft()
+        finally:
+            self._waiting -= 1
+
+        with self._stats_lock:
+            self._fallbacks += 1
+        return WordService.get_fallback_word()
+
+    def get_stats(self) -> dict:
+        """
+        Get upstream traffic counters.
+
+        Returns:
+            Dictionary with request and word counts, how many requests joined
+            a fetch already in flight and how many fell back to the local list
+        """
+        with self._stats_lock:
+            return {
+                'upstream_requests': self._upstream_requests,
+                'words_received': self._words_received,
+                'coalesced_waits': self._coalesced,
+                'fallbacks': self._fallbacks
+            }
+
+    async def _refill(self):
+        """Wait for a batch fetch, joining the one already in flight."""
+        if self._pending is None or self._pending.done():
+            self._pending = asyncio.ensure_future(self._fetch_for_waiting())
+        else:
+            with self._stats_lock:
+                self._coalesced += 1
+        # Shielded so one cancelled request does not cancel the fetch for the others
+        await asyncio.shield(self._pending)
+
+    async def _fetch_for_waiting(self):
+        """Fetch enough words for every waiting request (at least one batch)."""
+        count = max(Config.WORD_API_BATCH_SIZE, self._waiting - len(self._words))
+        self._words.extend(await self.fetch_batch(count, max_attempts=1))
+
+# Process-wide service used by the async routes
+async_word_service = AsyncWordService()
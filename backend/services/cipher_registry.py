@@ -0,0 +1,153 @@
+import importlib
+import threading
+
+class CipherRegistry:
+    """
+    Maps levels to cipher classes and the warm-up hooks each cipher has.
+
+    A level can be registered by class or by a 'module:Class' path; paths
+    are imported the first time the level is used, so a process only loads
+    the cipher modules (and their NumPy / pycryptodome dependencies) it needs.
+
+    Prepare hooks are zero-argument callables that build the module-level
+    tables and caches a cipher would otherwise build on its first use (Rail
+    Fence permutations, the invertible 2x2 key table, RSA keypairs); tables
+    built at import need no hook. prepare() runs them all, e.g. in the
+    parent of a preforked server.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def register(self, cipher_class, level: int = None, prepare: tuple = (), replace: bool = False):
+        """
+        Add a cipher level.
+
+        Args:
+            cipher_class: A BaseCipher subclass, or its 'module:Class' path
+                to import on first use
+            level: Level number (defaults to cipher_class.LEVEL; required
+                for paths)
+            prepare: Zero-argument warm-up hooks run by prepare()
+            replace: Allow replacing an already registered level
+
+        Returns:
+            The registered cipher class
+
+        Raises:
+            ValueError: If the level is already registered and replace is
+                False, or a path is given without a level
+        """
+        if level is None:
+            if isinstance(cipher_class, str):
+                raise ValueError(f"A level is required to register {cipher_class} lazily")
+            level = cipher_class.LEVEL
+        with self._lock:
+            if level in self._entries and not replace:
+                raise ValueError(f"Level {level} is already registered")
+            self._entries[level] = [cipher_class, tuple(prepare)]
+        return cipher_class
+
+    def levels(self) -> list:
+        """Registered level numbers, in order."""
+        return sorted(self._entries)
+
+    def __contains__(self, level) -> bool:
+        return level in self._entries
+
+    def is_loaded(self, level: int) -> bool:
+        """Whether a level's cipher class has been imported."""
+        return level in self._entries and not isinstance(self._entries[level][0], str)
+
+    @property
+    def cipher_classes(self) -> dict:
+        """Dictionary of level -> cipher class (imports every lazily registered level)."""
+        return {level: self.get_cipher_class(level) for level in self.levels()}
+
+    def get_cipher_class(self, level: int):
+        """
+        Get the cipher class for a level.
+
+        Args:
+            level: The difficulty level
+
+        Returns:
+            A BaseCipher subclass
+
+        Raises:
+            ValueError: If level is not registered
+        """
+        try:
+            entry = self._entries[level]
+        except KeyError:
+            raise ValueError(f"Unsupported level: {level}. Supported levels: {self.levels()}") from None
+
+        cipher_class = entry[0]
+        if isinstance(cipher_class, str):
+            module_name, class_name = cipher_class.split(':')
+            # The import lock makes concurrent first uses import the module once
+            cipher_class = getattr(importlib.import_module(module_name), class_name)
+            entry[0] = cipher_class
+        return cipher_class
+
+    def create(self, level: int):
+        """Create a freshly keyed cipher instance for a level."""
+        return self.get_cipher_class(level)()
+
+    def prepare(self):
+        """Import every cipher and run its prepare hooks now, so requests never pay for them."""
+        for level in self.levels():
+            self.get_cipher_class(level)
+            for hook in self._entries[level][1]:
+                hook()
+
+    def get_all_levels_info(self) -> list:
+        """
+        Get information about all registered cipher levels.
+
+        Read from each cipher class's metadata (importing lazily registered
+        levels); no cipher is instantiated.
+
+        Returns:
+            List of dictionaries containing level information
+        """
+        levels = []
+        for level in self.levels():
+            level_info = self.get_cipher_class(level).get_level_info()
+            level_info['level'] = level
+            levels.append(level_info)
+        return levels
+
+def _rail_permutations():
+    # Fill rail_permutation's cache with the read-out order of every depth a 5-letter word can use
+    from ciphers.rail_fence_cipher import rail_permutation
+    from utils.word_utils import WORD_LENGTH
+    for depth in range(1, WORD_LENGTH + 1):
+        rail_permutation(depth, WORD_LENGTH)
+
+def _hill_key_table():
+    # Load (or build and cache) the table generate_invertible_matrix draws 2x2 keys from
+    from utils.math_utils import invertible_2x2_table
+    invertible_2x2_table()
+
+def _rsa_keypairs():
+    from ciphers.rsa_cipher import rsa_key_cache
+    rsa_key_cache.keypairs()
+
+def default_registry() -> CipherRegistry:
+    """Build a registry holding the nine standard cipher levels, each imported on first use."""
+    registry = CipherRegistry()
+    registry.register('ciphers.caesar_cipher:CaesarCipher', 1)
+    registry.register('ciphers.monoalphabetic_cipher:MonoalphabeticCipher', 2)
+    registry.register('ciphers.vigenere_cipher:VigenereCipher', 3)
+    registry.register('ciphers.playfair_cipher:PlayfairCipher', 4)
+    registry.register('ciphers.rail_fence_cipher:RailFenceCipher', 5, (_rail_permutations,))
+    registry.register('ciphers.hill_cipher:HillCipher', 6, (_hill_key_table,))
+    registry.register('ciphers.otp_cipher:OneTimePadCipher', 7)
+    registry.register('ciphers.des_cipher:DESCipher', 8)
+    registry.register('ciphers.rsa_cipher:RSACipher', 9, (_rsa_keypairs,))
+    return registry
+
+# Process-wide registry, attached to the Flask app in create_app
+cipher_registry = default_registry()
@@ -1,28 +1,40 @@
-from ciphers.caesar_cipher import CaesarCipher
-from ciphers.monoalphabetic_cipher import MonoalphabeticCipher
-from ciphers.vigenere_cipher import VigenereCipher
-from ciphers.playfair_cipher import PlayfairCipher
-from ciphers.rail_fence_cipher import RailFenceCipher
-from ciphers.hill_cipher import HillCipher
-from ciphers.otp_cipher import OneTimePadCipher
-from ciphers.des_cipher import DESCipher
-from ciphers.rsa_cipher import RSACipher
+import threading
+from config import Config
+from services.cipher_registry import cipher_registry
 
 class CipherService:
     """Service for managing cipher instances and orchestrating encryption."""
 
-    def __init__(self):
-        self.cipher_classes = {
-            1: CaesarCipher,
-            2: MonoalphabeticCipher,
-            3: VigenereCipher,
-            4: PlayfairCipher,
-            5: RailFenceCipher,
-            6: HillCipher,
-            7: OneTimePadCipher,
-            8: DESCipher,
-            9: RSACipher,
-        }
+    def __init__(self, registry=None):
+        """
+        Args:
+            registry: CipherRegistry to look levels up in (defaults to the process-wide one)
+        """
+        self.registry = registry or cipher_registry
+
+        # Round-trip verification counters per cipher name
+        self._stats_lock = threading.Lock()
+        self._verification = {}
+
+    @property
+    def cipher_classes(self) -> dict:
+        """Dictionary of level -> cipher class, from the registry."""
+        return self.registry.cipher_classes
+
+    def get_cipher_class(self, level: int):
+        """
+        Get the cipher class for the specified level.
+
+        Args:
+            level: The difficulty level (1-9)
+
+        Returns:
+            A BaseCipher subclass
+
+        Raises:
+            ValueError: If level is not supported
+        """
+        return self.registry.get_cipher_class(level)
 
     def get_cipher_for_level(self, level: int):
         """
@@ -37,32 +49,163 @@ class CipherService:
         Raises:
             ValueError: If level is not supported
         """
-        if level not in self.cipher_classes:
-            raise ValueError(f"Unsupported level: {level}. Supported levels: {list(self.cipher_classes.keys())}")
+        return self.get_cipher_class(level)()
 
-        return self.cipher_classes[level]()
-
-    def encrypt_word(self, plaintext: str, level: int) -> tuple:
+    def encrypt_word(self, plaintext: str, level: int, verify: bool = False):
         """
         Encrypt a word using the cipher for the specified level.
 
         Args:
             plaintext: The word to encrypt
             level: The difficulty level (1-9)
+            verify: Check that the puzzle decrypts back to plaintext
 
         Returns:
-            Tuple of (encrypted_word, cipher_name, hints)
+            Tuple of (encrypted_word, cipher_name, hints), or None if
+            verification was requested and the round trip failed
 
         Raises:
             ValueError: If level is not supported
         """
         cipher = self.get_cipher_for_level(level)
         encrypted_word = cipher.encrypt(plaintext)
-        cipher_name = cipher.get_level_info()['name']
+        if verify and not self.verify_batch([plaintext], [encrypted_word], [cipher])[0]:
+            return None
+
+        cipher_name = cipher.NAME
         hints = cipher.get_hints()
 
         return encrypted_word, cipher_name, hints
 
+    def encrypt_batch(self, words: list, level: int, verify: bool = False) -> list:
+        """
+        Encrypt many words at once using the cipher for the specified level.
+
+        Each word gets its own key. Caesar, Vigenère, One-Time Pad, Hill and
+        Rail Fence run as NumPy array kernels over the whole batch; the other
+        ciphers fall back to a per-word loop.
+
+        Args:
+            words: 5-letter words to encrypt
+            level: The difficulty level (1-9)
+            verify: Check that every puzzle decrypts back to its word (and
+                score its ambiguity, see verify_batch)
+
+        Returns:
+            List of (encrypted_word, cipher_name, hints) tuples, one per word;
+            puzzles that fail verification are None
+
+        Raises:
+            ValueError: If level is not supported
+        """
+        cipher_class = self.get_cipher_class(level)
+        if not words:
+            return []
+
+        encrypted_words, ciphers = cipher_class.encrypt_batch(words)
+        if verify:
+            passed = self.verify_batch(words, encrypted_words, ciphers, score=True)
+        else:
+            passed = [True] * len(words)
+
+        cipher_name = cipher_class.NAME
+        return [
+            (encrypted_word, cipher_name, cipher.get_hints()) if ok else None
+            for encrypted_word, cipher, ok in zip(encrypted_words, ciphers, passed)
+        ]
+
+    def verify_batch(self, words: list, encrypted_words: list, ciphers: list, score: bool = False) -> list:
+        """
+        Check that puzzles decrypt back to their words, in one decrypt_batch call.
+
+        A puzzle that does not round-trip has more than one possible answer
+        (or none). Ciphers whose output cannot be decrypted pass unverified.
+
+        With score set (and Config.PUZZLE_SCORE_AMBIGUITY on and a word list
+        configured), puzzles that pass are also run through the ambiguity
+        analyzer, and those with more than Config.PUZZLE_MAX_CANDIDATES
+        consistent dictionary words at Config.PUZZLE_AMBIGUITY_TIER are
+        rejected as ambiguous.
+
+        Args:
+            words: The plaintext words
+            encrypted_words: Their encryptions
+            ciphers: The cipher instances that produced them
+            score: Score ambiguity as well (meant for background generation)
+
+        Returns:
+            List of booleans, True where the puzzle may be served
+        """
+        if not words:
+            return []
+        cipher_class = type(ciphers[0])
+        try:
+            decrypted = cipher_class.decrypt_batch(encrypted_words, ciphers)
+        except NotImplementedError:
+            self._record_verification(ciphers[0], checked=0, rejected=0, unverified=len(words))
+            return [True] * len(words)
+
+        passed = [plain == word for plain, word in zip(decrypted, words)]
+        rejected = passed.count(False)
+        ambiguous = 0
+        if score and Config.PUZZLE_SCORE_AMBIGUITY:
+            # Imported on first use: the analyzer loads NumPy and every cipher module
+            from services.ambiguity_analyzer import ambiguity_analyzer
+            from services.dictionary_service import word_dictionary
+            # Most answers are not among the fallback words, so counting candidates in them means nothing
+            if word_dictionary.has_word_list() and ambiguity_analyzer.supports(ciphers[0]):
+                ambiguous = self._reject_ambiguous(encrypted_words, ciphers, passed, ambiguity_analyzer)
+        self._record_verification(ciphers[0], checked=len(words), rejected=rejected, unverified=0,
+                                  ambiguous=ambiguous)
+        return passed
+
+    @staticmethod
+    def _reject_ambiguous(encrypted_words: list, ciphers: list, passed: list, analyzer) -> int:
+        """
+        Score the puzzles that passed so far, clearing passed[i] for ambiguous ones.
+
+        Returns:
+            Number of puzzles rejected as ambiguous
+        """
+        limit = Config.PUZZLE_MAX_CANDIDATES
+        ambiguous = 0
+        for i, (encrypted_word, cipher) in enumerate(zip(encrypted_words, ciphers)):
+            if not passed[i]:
+                continue
+            counts = analyzer.analyze(encrypted_word, cipher)
+            if limit and counts[Config.PUZZLE_AMBIGUITY_TIER] > limit:
+                passed[i] = False
+                ambiguous += 1
+        return ambiguous
+
+    def _record_verification(self, cipher, checked: int, rejected: int, unverified: int, ambiguous: int = 0):
+        """Add to the verification counters of a cipher."""
+        name = cipher.NAME
+        with self._stats_lock:
+            counters = self._verification.setdefault(
+                name, {'checked': 0, 'rejected': 0, 'ambiguous': 0, 'unverified': 0}
+            )
+            counters['checked'] += checked
+            counters['rejected'] += rejected
+            counters['ambiguous'] += ambiguous
+            counters['unverified'] += unverified
+
+    def get_verification_stats(self) -> dict:
+        """
+        Get round-trip verification counters.
+
+        Returns:
+            Dictionary of cipher name -> checked, rejected (round trip
+            failed), ambiguous and unverified counts and the overall reject rate
+        """
+        with self._stats_lock:
+            stats = {}
+            for name, counters in self._verification.items():
+                checked = counters['checked']
+                reject_rate = (counters['rejected'] + counters['ambiguous']) / checked if checked else 0.0
+                stats[name] = dict(counters, reject_rate=round(reject_rate, 4))
+            return stats
+
     def get_all_levels_info(self) -> list:
         """
         Get information about all available cipher levels.
@@ -70,11 +213,7 @@ class CipherService:
         Returns:
             List of dictionaries containing level information
         """
-        levels = []
-        for level_num in sorted(self.cipher_classes.keys()):
-            cipher = self.cipher_classes[level_num]()
-            level_info = cipher.get_level_info()
-            level_info['level'] = level_num
-            levels.append(level_info)
+        return self.registry.get_all_levels_info()
 
-        return levels
\ No newline at end of file
+# Process-wide service; its verification counters cover every puzzle built
+cipher_service = CipherService()
\ No newline at end of file
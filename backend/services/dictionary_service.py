@@ -0,0 +1,158 @@
+import hashlib
+import os
+import threading
+from config import Config
+from services.word_service import FALLBACK_WORDS
+
+def load_word_list(path: str = None) -> list:
+    """
+    Read the dictionary word list.
+
+    Args:
+        path: Word-list file, one word per line (defaults to Config.DICTIONARY_PATH)
+
+    Returns:
+        The words in the file, or the built-in fallback words if no file is configured
+    """
+    path = path or Config.DICTIONARY_PATH
+    if not path:
+        return list(FALLBACK_WORDS)
+    with open(path, encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip()]
+
+class WordDictionary:
+    """
+    Process-wide dictionary of valid 5-letter words.
+
+    The word list is packed into a WordIndex bitset once, saved under
+    Config.CACHE_DIR and memory-mapped from there, so later starts skip
+    parsing the list and every worker process shares the same pages.
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path if path is not None else Config.DICTIONARY_PATH
+        self._index = None
+        self._source = None
+        self._lock = threading.Lock()
+
+    @property
+    def index(self) -> 'WordIndex':
+        """The dictionary bitset, loaded on first use."""
+        return self.load()
+
+    def load(self) -> 'WordIndex':
+        """
+        Load the dictionary bitset if it is not loaded yet.
+
+        An unreadable DICTIONARY_PATH is dropped here in favour of the
+        fallback words (see has_word_list).
+
+        Returns:
+            The dictionary's WordIndex
+        """
+        if self._index is None:
+            with self._lock:
+                if self._index is None:
+                    self._index = self._load()
+        return self._index
+
+    def has_word_list(self) -> bool:
+        """
+        Check whether a word list is loaded, rather than just the fallback words.
+
+        Returns:
+            True if DICTIONARY_PATH is set and could be read
+        """
+        if self.path:
+            self.load()
+        return bool(self.path)
+
+    def is_word(self, word: str) -> bool:
+        """
+        Check whether a word is in the dictionary (one bit lookup).
+
+        Args:
+            word: Candidate word (any case)
+
+        Returns:
+            True if word is 5 letters A-Z and listed in the dictionary
+        """
+        return word.upper() in self.index
+
+    def __contains__(self, word: str) -> bool:
+        return self.is_word(word)
+
+    def accepts_guess(self, word: str) -> bool:
+        """
+        Check whether a guess may be played.
+
+        Without a word list (DICTIONARY_PATH unset or unreadable) every guess
+        is accepted: the built-in fallback words are far too few to judge
+        guesses against.
+
+        Args:
+            word: Candidate word (any case)
+
+        Returns:
+            True if no word list is configured or word is listed in it
+        """
+        return not self.has_word_list() or self.is_word(word)
+
+    def get_stats(self) -> dict:
+        """
+        Get dictionary metrics.
+
+        Returns:
+            Dictionary with the word count and where the bitset was loaded
+            from (zero and None until the dictionary is first used)
+        """
+        return {
+            'words': len(self._index) if self._index is not None else 0,
+            'source': self._source
+        }
+
+    def _cache_path(self) -> str:
+        """Cache file for the bitset, named after the word list it was built from."""
+        if self.path:
+            stat = os.stat(self.path)
+            key = f'{os.path.abspath(self.path)}:{stat.st_size}:{stat.st_mtime_ns}'
+        else:
+            key = '\n'.join(FALLBACK_WORDS)
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(Config.CACHE_DIR, f'dictionary_{digest}.npy')
+
+    def _words(self) -> list:
+        """The words to index: the configured list, or the built-in fallback words."""
+        return load_word_list(self.path) if self.path else list(FALLBACK_WORDS)
+
+    def _load(self) -> 'WordIndex':
+        """Memory-map the cached bitset, building it from the word list first if needed."""
+        # NumPy is only imported once the dictionary is first needed
+        import numpy as np
+        from utils.word_index import WordIndex
+
+        try:
+            path = self._cache_path()
+        except OSError as e:
+            print(f"Could not read dictionary {self.path}, using fallback words: {e}")
+            self.path = None
+            path = self._cache_path()
+
+        try:
+            if not os.path.exists(path):
+                os.makedirs(Config.CACHE_DIR, exist_ok=True)
+                # Write to a private file first so concurrent workers never see a partial bitset
+                tmp_path = f'{path}.{os.getpid()}.tmp'
+                with open(tmp_path, 'wb') as f:
+                    np.save(f, WordIndex.from_words(self._words()).bits)
+                os.replace(tmp_path, path)
+            index = WordIndex(np.load(path, mmap_mode='r'))
+            self._source = 'mmap'
+        except OSError as e:
+            print(f"Could not cache dictionary, keeping it in memory: {e}")
+            index = WordIndex.from_words(self._words())
+            self._source = 'memory'
+        return index
+
+# Process-wide dictionary shared by request validation and puzzle analysis
+word_dictionary = WordDictionary()
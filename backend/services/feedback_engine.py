@@ -0,0 +1,194 @@
+import hashlib
+import os
+from array import array
+from bisect import bisect_left
+import threading
+import time
+from config import Config
+from services.dictionary_service import word_dictionary
+from utils.feedback_utils import feedback_code, feedback_matrix
+from utils.word_utils import WORD_LENGTH, unpack_word
+
+# Answer rows computed per vectorized step while building the matrix
+_BUILD_ROWS = 1024
+
+def _ascii_keys(codes: 'np.ndarray') -> 'np.ndarray':
+    """Packed word codes -> the words' uppercase ASCII bytes read as big-endian integers."""
+    import numpy as np
+    from utils.batch_utils import unpack_codes
+
+    letters = unpack_codes(codes, WORD_LENGTH).astype(np.uint64) + ord('A')
+    return letters @ (np.uint64(256) ** np.arange(WORD_LENGTH - 1, -1, -1, dtype=np.uint64))
+
+class FeedbackEngine:
+    """
+    Wordle feedback served from a precomputed answers x guesses matrix.
+
+    Every dictionary word is both an answer row and a guess column, and each
+    cell holds the base-3 feedback code (utils.feedback_utils) for that pair.
+    The matrix is built once, saved under Config.CACHE_DIR and memory-mapped,
+    so a lookup is two bisects over the sorted words and one byte read. Pairs involving a
+    word outside the dictionary, or any lookup before the matrix is loaded,
+    are computed directly instead.
+    """
+
+    def __init__(self, dictionary=None):
+        self.dictionary = dictionary or word_dictionary
+        self._matrix = None
+        self._codes = None
+        # Lookup-path views: sorted ASCII keys for bisect, cells as a flat memoryview
+        self._keys = None
+        self._cells = None
+        self._lock = threading.Lock()
+        self._thread = None
+
+        self._stats_lock = threading.Lock()
+        self._matrix_hits = 0
+        self._computed = 0
+        self._build_seconds = None
+
+    def start(self):
+        """Load (or build) the matrix in a background thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name='feedback-matrix', daemon=True)
+        self._thread.start()
+
+    def load(self) -> 'np.ndarray':
+        """
+        Load the matrix, building and caching it first if needed.
+
+        Returns:
+            uint8 array of shape (N, N) indexed [answer, guess] in dictionary order
+        """
+        if self._matrix is None:
+            # NumPy and the dictionary are only loaded with the matrix
+            import numpy as np
+
+            with self._lock:
+                if self._matrix is None:
+                    codes = self.dictionary.index.codes()
+                    matrix = self._load_matrix(codes)
+                    self._codes = codes
+                    self._keys = array('Q', _ascii_keys(codes).tobytes())
+                    self._cells = memoryview(np.ascontiguousarray(matrix).reshape(-1))
+                    self._matrix = matrix
+        return self._matrix
+
+    def feedback_code(self, guess: str, answer: str) -> int:
+        """
+        Feedback code for a guess against an answer.
+
+        Args:
+            guess: The guessed word (uppercase)
+            answer: The answer (uppercase)
+
+        Returns:
+            Integer in [0, 243)
+        """
+        if self._matrix is not None:
+            row, column = self._position(answer), self._position(guess)
+            if row is not None and column is not None:
+                with self._stats_lock:
+                    self._matrix_hits += 1
+                return self._cells[row * len(self._keys) + column]
+
+        with self._stats_lock:
+            self._computed += 1
+        return feedback_code(guess, answer)
+
+    def remaining_answers(self, history: list) -> list:
+        """
+        Dictionary words still possible as the answer after some guesses.
+
+        Args:
+            history: (guess, feedback code) pairs; guesses must be dictionary words
+
+        Returns:
+            The consistent words, in dictionary order
+
+        Raises:
+            ValueError: If a guess is not in the dictionary
+        """
+        import numpy as np
+
+        matrix = self.load()
+        consistent = np.ones(len(self._codes), dtype=bool)
+        for guess, code in history:
+            column = self._position(guess)
+            if column is None:
+                raise ValueError(f"{guess!r} is not in the dictionary")
+            consistent &= matrix[:, column] == code
+        return [unpack_word(int(code)) for code in self._codes[consistent]]
+
+    def get_stats(self) -> dict:
+        """
+        Get feedback lookup metrics.
+
+        Returns:
+            Dictionary with the matrix size, build time and how many lookups
+            used the matrix versus direct computation
+        """
+        with self._stats_lock:
+            return {
+                'loaded': self._matrix is not None,
+                'words': len(self._codes) if self._codes is not None else 0,
+                'build_seconds': self._build_seconds,
+                'matrix_hits': self._matrix_hits,
+                'computed': self._computed
+            }
+
+    def _position(self, word: str):
+        """Index of a word in the matrix, or None if it is not in the dictionary."""
+        # Uppercase ASCII words sort the same as their packed codes
+        key = int.from_bytes(word.encode('utf-8'), 'big')
+        keys = self._keys
+        position = bisect_left(keys, key)
+        if position < len(keys) and keys[position] == key:
+            return position
+        return None
+
+    def _load_matrix(self, codes: 'np.ndarray') -> 'np.ndarray':
+        """Memory-map the cached matrix for these words, building it first if needed."""
+        import numpy as np
+
+        digest = hashlib.sha1(codes.tobytes()).hexdigest()[:16]
+        path = os.path.join(Config.CACHE_DIR, f'feedback_{digest}.npy')
+        try:
+            if not os.path.exists(path):
+                os.makedirs(Config.CACHE_DIR, exist_ok=True)
+                # Write to a private file first so concurrent workers never see a partial matrix
+                tmp_path = f'{path}.{os.getpid()}.tmp'
+                matrix = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=np.uint8,
+                                                   shape=(len(codes), len(codes)))
+                self._build(codes, matrix)
+                matrix.flush()
+                del matrix
+                os.replace(tmp_path, path)
+            return np.load(path, mmap_mode='r')
+        except OSError as e:
+            print(f"Could not cache feedback matrix, keeping it in memory: {e}")
+            matrix = np.empty((len(codes), len(codes)), dtype=np.uint8)
+            self._build(codes, matrix)
+            return matrix
+
+    def _build(self, codes: 'np.ndarray', out: 'np.ndarray'):
+        """Fill the matrix in blocks of answer rows."""
+        from utils.batch_utils import unpack_codes
+
+        started = time.perf_counter()
+        words = unpack_codes(codes)
+        for start in range(0, len(words), _BUILD_ROWS):
+            out[start:start + _BUILD_ROWS] = feedback_matrix(words[start:start + _BUILD_ROWS], words)
+        with self._stats_lock:
+            self._build_seconds = round(time.perf_counter() - started, 3)
+
+    def _run(self):
+        """Background loader: build or map the matrix once."""
+        try:
+            self.load()
+        except Exception as e:
+            print(f"Error loading feedback matrix: {e}")
+
+# Process-wide engine over the shared dictionary
+feedback_engine = FeedbackEngine()
@@ -0,0 +1,338 @@
+import threading
+import time
+from collections import deque
+from config import Config
+from services.cipher_service import cipher_service as default_cipher_service
+from services.word_pool import word_pool
+
+def verify_attempts() -> int:
+    """Encryptions allowed per word: PUZZLE_VERIFY_ATTEMPTS (at least one) when verifying, otherwise one."""
+    return max(1, Config.PUZZLE_VERIFY_ATTEMPTS) if Config.PUZZLE_VERIFY else 1
+
+class PuzzleFactory:
+    """Keeps a queue of ready-to-serve encrypted puzzles for every cipher level."""
+
+    def __init__(self, target_depths: dict = None, workers: int = None, word_source=None,
+                 cipher_service=None):
+        self.cipher_service = cipher_service or default_cipher_service
+        self.target_depths = dict(Config.PUZZLE_QUEUE_DEPTHS if target_depths is None else target_depths)
+        unknown = set(self.target_depths) - set(self.cipher_service.registry.levels())
+        if unknown:
+            raise ValueError(f"Unsupported levels in puzzle queue depths: {sorted(unknown)}")
+
+        self.worker_count = workers or Config.PUZZLE_FACTORY_WORKERS
+        self.batch_size = Config.PUZZLE_BATCH_SIZE
+        self._word_source = word_source or word_pool.get_word
+        # Per level, (word, attempts used) for words whose puzzles failed
+        # verification, retried with fresh keys before drawing new words
+        self._spare_words = {}
+        self._spare_limit = Config.WORD_POOL_HIGH_WATERMARK
+
+        # One bounded queue of (word, encrypted_word, cipher_name, hints) per level
+        self._queues = {
+            level: deque(maxlen=depth) for level, depth in self.target_depths.items()
+        }
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._threads = []
+
+        self._stats_lock = threading.Lock()
+        self._queue_hits = {level: 0 for level in self._queues}
+        self._inline_builds = {level: 0 for level in self._queues}
+        self._served_unverified = 0
+        self._spare_dropped = 0
+        self._words_exhausted = 0
+        self._words_unsupported = {level: 0 for level in self._queues}
+        self._built = 0
+        self._build_seconds = 0.0
+
+    def start(self):
+        """Start the background refill workers (no-op if already running)."""
+        if any(thread.is_alive() for thread in self._threads):
+            return
+        self._stop.clear()
+        self._threads = [
+            threading.Thread(target=self._run, name=f'puzzle-factory-{i}', daemon=True)
+            for i in range(self.worker_count)
+        ]
+        for thread in self._threads:
+            thread.start()
+        self._wake.set()
+
+    def stop(self, timeout: float = None):
+        """Stop the background refill workers."""
+        self._stop.set()
+        self._wake.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def _next_words(self, level: int, count: int) -> list:
+        """
+        Draw words for a batch, reusing the level's set-aside words (oldest
+        first) before new ones but always drawing at least one new word, so
+        words that keep failing cannot stall the batch.
+
+        When verifying, new words the level's cipher can never round-trip are
+        rejected here, so the batch may hold fewer than count words.
+
+        Returns:
+            List of (word, attempts already used) tuples
+        """
+        words = []
+        spare = self._spare_words.get(level)
+        for _ in range(count - 1 if spare else 0):
+            try:
+                words.append(spare.popleft())
+            except IndexError:
+                break
+        drawn = [self._word_source() for _ in range(count - len(words))]
+        if Config.PUZZLE_VERIFY:
+            cipher_class = self.cipher_service.get_cipher_class(level)
+            supported = [word for word in drawn if cipher_class.round_trips(word)]
+            if len(supported) < len(drawn):
+                with self._stats_lock:
+                    self._words_unsupported[level] += len(drawn) - len(supported)
+            drawn = supported
+        words.extend((word, 0) for word in drawn)
+        return words
+
+    def _draw_word(self, level: int) -> str:
+        """
+        Draw one word for an inline build, skipping words the level's cipher
+        can never round-trip (the last draw is kept if every one of them fails).
+        """
+        cipher_class = self.cipher_service.get_cipher_class(level)
+        for _ in range(verify_attempts()):
+            word = self._word_source()
+            if cipher_class.round_trips(word):
+                break
+            with self._stats_lock:
+                self._words_unsupported[level] += 1
+        return word
+
+    def _set_aside(self, level: int, words: list):
+        """Keep (word, attempts used) pairs for the level's next batch, counting any beyond the limit as dropped."""
+        spare = self._spare_words.setdefault(level, deque())
+        room = max(0, self._spare_limit - len(spare))
+        spare.extend(words[:room])
+        if len(words) > room:
+            with self._stats_lock:
+                self._spare_dropped += len(words) - room
+
+    def build_puzzle(self, level: int, word: str = None) -> tuple:
+        """
+        Build one puzzle for a level on the calling thread.
+
+        Puzzles that fail round-trip verification are rebuilt with a fresh
+        key; the final attempt is served without verification so a request
+        never fails on a rejected puzzle. A word the cipher can never
+        round-trip is served unverified straight away.
+
+        Args:
+            level: The difficulty level (1-9)
+            word: Word to encrypt (drawn from the word source if omitted)
+
+        Returns:
+            Tuple of (word, encrypted_word, cipher_name, hints)
+
+        Raises:
+            ValueError: If level is not supported
+        """
+        started = time.perf_counter()
+        word = word or self._draw_word(level)
+        attempts = verify_attempts()
+        if not self.cipher_service.get_cipher_class(level).round_trips(word):
+            attempts = 1
+        for attempt in range(1, attempts + 1):
+            puzzle = self.cipher_service.encrypt_word(word, level, verify=attempt < attempts)
+            if puzzle is not None:
+                break
+        encrypted_word, cipher_name, hints = puzzle
+        elapsed = time.perf_counter() - started
+
+        with self._stats_lock:
+            self._built += 1
+            self._build_seconds += elapsed
+            if Config.PUZZLE_VERIFY and attempt == attempts:
+                self._served_unverified += 1
+        return word, encrypted_word, cipher_name, hints
+
+    def build_batch(self, level: int, count: int) -> list:
+        """
+        Build several puzzles for a level with batched encryption and verification.
+
+        Each word is encrypted once. Words whose puzzles fail verification are
+        set aside for the level's next batch, to be retried with a fresh key,
+        until they have been tried Config.PUZZLE_VERIFY_ATTEMPTS times; then
+        they are dropped. Fewer than count puzzles may be returned. Each level
+        keeps at most Config.WORD_POOL_HIGH_WATERMARK spare words.
+
+        Args:
+            level: The difficulty level (1-9)
+            count: Number of words to draw
+
+        Returns:
+            List of (word, encrypted_word, cipher_name, hints) tuples
+
+        Raises:
+            ValueError: If level is not supported
+        """
+        started = time.perf_counter()
+        words = self._next_words(level, count)
+        attempts = verify_attempts()
+
+        puzzles, retry, exhausted = [], [], 0
+        if words:
+            encrypted = self.cipher_service.encrypt_batch(
+                [word for word, _ in words], level, verify=Config.PUZZLE_VERIFY
+            )
+            for (word, tried), puzzle in zip(words, encrypted):
+                if puzzle is not None:
+                    puzzles.append((word,) + puzzle)
+                elif tried + 1 < attempts:
+                    retry.append((word, tried + 1))
+                else:
+                    exhausted += 1
+        if retry:
+            self._set_aside(level, retry)
+        elapsed = time.perf_counter() - started
+
+        with self._stats_lock:
+            self._built += len(puzzles)
+            self._build_seconds += elapsed
+            self._words_exhausted += exhausted
+        return puzzles
+
+    def take(self, level: int) -> tuple:
+        """
+        Take a pre-built puzzle for a level, building one inline if the queue is empty.
+
+        Args:
+            level: The difficulty level (1-9)
+
+        Returns:
+            Tuple of (word, encrypted_word, cipher_name, hints)
+
+        Raises:
+            ValueError: If level is not supported
+        """
+        puzzle = self.try_take(level)
+        if puzzle is None:
+            return self.build_puzzle(level)
+        return puzzle
+
+    def try_take(self, level: int):
+        """
+        Take a pre-built puzzle for a level without building one.
+
+        An empty queue counts as an inline build: the caller is expected to
+        build the puzzle itself (see build_puzzle).
+
+        Args:
+            level: The difficulty level (1-9)
+
+        Returns:
+            Tuple of (word, encrypted_word, cipher_name, hints), or None if
+            the level has no queue or its queue is empty
+        """
+        queue = self._queues.get(level)
+        if queue is None:
+            # Levels without a queue (or unknown levels) go straight to the cipher service
+            return None
+
+        try:
+            puzzle = queue.popleft()
+        except IndexError:
+            with self._stats_lock:
+                self._inline_builds[level] += 1
+            self._wake.set()
+            return None
+
+        with self._stats_lock:
+            self._queue_hits[level] += 1
+        self._wake.set()
+        return puzzle
+
+    def fill(self, level: int = None) -> int:
+        """
+        Top queues up to their target depth on the calling thread.
+
+        Args:
+            level: Only fill this level's queue (all levels if omitted)
+
+        Returns:
+            Number of puzzles built
+        """
+        levels = [level] if level is not None else list(self._queues)
+        built = 0
+        for lvl in levels:
+            queue = self._queues[lvl]
+            while len(queue) < self.target_depths[lvl] and not self._stop.is_set():
+                count = min(self.batch_size, self.target_depths[lvl] - len(queue))
+                puzzles = self.build_batch(lvl, count)
+                queue.extend(puzzles)
+                built += len(puzzles)
+        return built
+
+    def get_stats(self) -> dict:
+        """
+        Get per-level queue depths and hit counts.
+
+        Returns:
+            Dictionary with per-level queue metrics, average build time and
+            per-cipher verification reject rates
+        """
+        with self._stats_lock:
+            average = self._build_seconds / self._built if self._built else 0.0
+            levels = {
+                level: {
+                    'depth': len(queue),
+                    'target_depth': self.target_depths[level],
+                    'queue_hits': self._queue_hits[level],
+                    'inline_builds': self._inline_builds[level],
+                    'spare_words': len(self._spare_words.get(level, ())),
+                    'unsupported_words': self._words_unsupported[level]
+                }
+                for level, queue in self._queues.items()
+            }
+            return {
+                'levels': levels,
+                'puzzles_built': self._built,
+                'avg_build_seconds': round(average, 6),
+                'served_unverified': self._served_unverified,
+                'spare_words_dropped': self._spare_dropped,
+                'words_exhausted': self._words_exhausted,
+                'verification': self.cipher_service.get_verification_stats()
+            }
+
+    def _most_depleted_level(self):
+        """Return the level furthest below its target depth, or None if all are full."""
+        best_level, best_ratio = None, 1.0
+        for level, queue in self._queues.items():
+            target = self.target_depths[level]
+            ratio = len(queue) / target if target else 1.0
+            if ratio < best_ratio:
+                best_level, best_ratio = level, ratio
+        return best_level
+
+    def _run(self):
+        """Worker loop: build puzzle batches for the most depleted level until all queues are full."""
+        while not self._stop.is_set():
+            self._wake.wait()
+            self._wake.clear()
+
+            while not self._stop.is_set():
+                level = self._most_depleted_level()
+                if level is None:
+                    break
+                queue = self._queues[level]
+                count = min(self.batch_size, self.target_depths[level] - len(queue))
+                try:
+                    queue.extend(self.build_batch(level, count))
+                except Exception as e:
+                    print(f"Error pre-generating puzzle for level {level}: {e}")
+                    self._stop.wait(1)
+
+# Process-wide puzzle factory shared by all requests
+puzzle_factory = PuzzleFactory()
@@ -0,0 +1,199 @@
+import multiprocessing
+import threading
+import time
+from collections import deque
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor, as_completed
+from config import Config
+from ciphers import rsa_cipher
+
+class RSAKeyReservoir:
+    """Bounded reservoir of RSA keypairs generated ahead of demand in worker processes."""
+
+    def __init__(self, bits: int = None, high_watermark: int = None, low_watermark: int = None,
+                 workers: int = None):
+        self.bits = Config.RSA_KEY_BITS if bits is None else bits
+        self.high_watermark = high_watermark or Config.RSA_KEY_POOL_HIGH_WATERMARK
+        self.low_watermark = low_watermark or Config.RSA_KEY_POOL_LOW_WATERMARK
+        if self.low_watermark > self.high_watermark:
+            raise ValueError("RSA key reservoir low watermark must not exceed the high watermark")
+        self.worker_count = workers or Config.RSA_KEY_POOL_WORKERS
+
+        # deque.append/popleft are atomic, so the request path needs no lock
+        self._keypairs = deque(maxlen=self.high_watermark)
+        self._executor = None
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+        self._stats_lock = threading.Lock()
+        self._reservoir_hits = 0
+        self._fallback_hits = 0
+        self._generated = 0
+        self._failures = 0
+        self._refills = 0
+        self._last_refill_seconds = 0.0
+        self._total_refill_seconds = 0.0
+
+    def start(self, warm_up: bool = False):
+        """
+        Start the worker processes and background refill thread, and route
+        new RSACipher instances through the reservoir.
+
+        Args:
+            warm_up: Block until the reservoir holds its low watermark of keys
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._executor = self._new_executor()
+        if warm_up:
+            self.refill(self.low_watermark)
+        rsa_cipher.set_key_provider(self.get_keypair)
+
+        self._thread = threading.Thread(target=self._run, name='rsa-key-refill', daemon=True)
+        self._thread.start()
+        self._wake.set()
+
+    def stop(self, timeout: float = None):
+        """Stop refilling, shut down the worker processes and restore the cached demo keys."""
+        rsa_cipher.set_key_provider(None)
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        """Create the worker process pool."""
+        # Spawned workers do not inherit the parent's threads or locks
+        return ProcessPoolExecutor(
+            max_workers=self.worker_count, mp_context=multiprocessing.get_context('spawn')
+        )
+
+    def get_keypair(self) -> rsa_cipher.RSAKeypair:
+        """
+        Take a keypair from the reservoir without blocking.
+
+        Returns:
+            A generated keypair, or a cached demo keypair when the reservoir is empty
+        """
+        try:
+            keypair = self._keypairs.popleft()
+        except IndexError:
+            with self._stats_lock:
+                self._fallback_hits += 1
+            self._wake.set()
+            return rsa_cipher.rsa_key_cache.random_keypair()
+
+        with self._stats_lock:
+            self._reservoir_hits += 1
+        if len(self._keypairs) < self.low_watermark:
+            self._wake.set()
+        return keypair
+
+    def depth(self) -> int:
+        """Number of keypairs currently waiting in the reservoir."""
+        return len(self._keypairs)
+
+    def refill(self, target: int = None) -> int:
+        """
+        Generate keypairs in the worker processes until the reservoir reaches a target depth.
+
+        Args:
+            target: Depth to fill to (defaults to the high watermark)
+
+        Returns:
+            Number of keypairs added to the reservoir
+        """
+        target = min(target or self.high_watermark, self.high_watermark)
+        executor = self._executor
+        if executor is None:
+            raise RuntimeError("RSA key reservoir is not started")
+
+        added = 0
+        started = time.perf_counter()
+        while len(self._keypairs) < target and not self._stop.is_set():
+            # Keep every worker busy, but do not overshoot the target
+            count = min(self.worker_count * 2, target - len(self._keypairs))
+            failed, broken = 0, False
+            try:
+                futures = [executor.submit(rsa_cipher.generate_keypair, self.bits) for _ in range(count)]
+            except BrokenExecutor as e:
+                print(f"Error generating RSA keypair: {e}")
+                futures, failed, broken = [], count, True
+
+            for future in as_completed(futures):
+                try:
+                    self._keypairs.append(future.result())
+                    added += 1
+                except Exception as e:
+                    print(f"Error generating RSA keypair: {e}")
+                    failed += 1
+                    broken = broken or isinstance(e, BrokenExecutor)
+
+            if failed:
+                with self._stats_lock:
+                    self._failures += failed
+                if broken and not self._stop.is_set():
+                    # A worker died; replace the pool so the next refill can proceed
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    self._executor = self._new_executor()
+                break
+        elapsed = time.perf_counter() - started
+
+        if added:
+            with self._stats_lock:
+                self._generated += added
+                self._refills += 1
+                self._last_refill_seconds = elapsed
+                self._total_refill_seconds += elapsed
+        return added
+
+    def get_stats(self) -> dict:
+        """
+        Get reservoir sizing metrics.
+
+        Returns:
+            Dictionary with depth, watermarks, hit counts and refill latency
+        """
+        with self._stats_lock:
+            average = self._total_refill_seconds / self._refills if self._refills else 0.0
+            per_key = self._total_refill_seconds / self._generated if self._generated else 0.0
+            return {
+                'key_bits': self.bits,
+                'depth': len(self._keypairs),
+                'high_watermark': self.high_watermark,
+                'low_watermark': self.low_watermark,
+                'reservoir_hits': self._reservoir_hits,
+                'fallback_hits': self._fallback_hits,
+                'generated': self._generated,
+                'failures': self._failures,
+                'refills': self._refills,
+                'last_refill_seconds': round(self._last_refill_seconds, 4),
+                'avg_refill_seconds': round(average, 4),
+                'avg_seconds_per_key': round(per_key, 4)
+            }
+
+    def _run(self):
+        """Refill loop: sleep until woken, then top the reservoir back up."""
+        while not self._stop.is_set():
+            self._wake.wait(Config.RSA_KEY_POOL_RETRY_INTERVAL)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            if len(self._keypairs) >= self.low_watermark:
+                continue
+
+            try:
+                added = self.refill()
+            except Exception as e:
+                print(f"Error refilling RSA key reservoir: {e}")
+                added = 0
+            if added == 0 and len(self._keypairs) < self.high_watermark:
+                self._stop.wait(Config.RSA_KEY_POOL_RETRY_INTERVAL)
+
+# Process-wide reservoir; only started when RSA_KEY_BITS asks for generated keys
+rsa_key_reservoir = RSAKeyReservoir()
@@ -0,0 +1,268 @@
+import struct
+import sys
+import threading
+import time
+import uuid
+from config import Config
+from utils.word_utils import pack_word, unpack_word
+
+# Stored session value: last-touch timestamp, 24-bit word code, level, attempts
+_PACKED_SESSION = struct.Struct('<dIBB')
+
+class SessionRecord:
+    """Decoded snapshot of one game session."""
+
+    __slots__ = ('level', 'word_code', 'cipher_name', 'timestamp', 'attempts')
+
+    def __init__(self, level: int, word_code: int, cipher_name: str, timestamp: float, attempts: int = 0):
+        self.level = level
+        self.word_code = word_code
+        self.cipher_name = cipher_name
+        self.timestamp = timestamp
+        self.attempts = attempts
+
+    @property
+    def actual_word(self) -> str:
+        """The answer word, unpacked from its integer code."""
+        return unpack_word(self.word_code)
+
+    def pack(self) -> bytes:
+        """Encode this record as the fixed-width value kept in the store."""
+        return _PACKED_SESSION.pack(self.timestamp, self.word_code, self.level, self.attempts)
+
+def session_key(session_id: str):
+    """
+    Convert a session id string to its 16-byte store key.
+
+    Returns:
+        The UUID bytes, or None if session_id is not a valid UUID
+    """
+    try:
+        return uuid.UUID(session_id).bytes
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+class _Shard:
+    """One lock-striped partition of the session store."""
+
+    __slots__ = ('lock', 'sessions', 'expiry_buckets', 'oldest_tick')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # 16-byte session key -> 14-byte packed session value
+        self.sessions = {}
+        # Timing wheel: tick -> keys last touched during that tick. Refreshing a
+        # session appends its key to a newer bucket; the superseded entry is
+        # skipped when its bucket expires. A list slot per entry keeps this far
+        # smaller than a heap of (timestamp, key) tuples.
+        self.expiry_buckets = {}
+        self.oldest_tick = None
+
+    def schedule(self, key: bytes, tick: int):
+        """Record that a session was touched during a tick (caller holds the lock)."""
+        bucket = self.expiry_buckets.get(tick)
+        if bucket is None:
+            self.expiry_buckets[tick] = [key]
+            if self.oldest_tick is None or tick < self.oldest_tick:
+                self.oldest_tick = tick
+        else:
+            bucket.append(key)
+
+class SessionStore:
+    """Thread-safe in-memory game session store, lock-striped across shards with timing-wheel expiry."""
+
+    def __init__(self, timeout: float = None, shards: int = None, resolution: float = None):
+        self.timeout = timeout or Config.GAME_SESSION_TIMEOUT
+        # Width of one timing-wheel bucket in seconds
+        self.resolution = resolution or Config.SESSION_EXPIRY_RESOLUTION
+        shard_count = shards or Config.SESSION_STORE_SHARDS
+        if shard_count < 1:
+            raise ValueError("Session store needs at least one shard")
+        self._shards = tuple(_Shard() for _ in range(shard_count))
+        # Cipher names are per level, so they are stored once here rather than per session
+        self._cipher_names = {}
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __len__(self):
+        return sum(len(shard.sessions) for shard in self._shards)
+
+    def _shard_for(self, key: bytes) -> _Shard:
+        """Pick the shard owning a session key."""
+        return self._shards[hash(key) % len(self._shards)]
+
+    def _decode(self, value: bytes) -> SessionRecord:
+        """Turn a packed session value back into a record."""
+        timestamp, word_code, level, attempts = _PACKED_SESSION.unpack(value)
+        return SessionRecord(level, word_code, self._cipher_names.get(level), timestamp, attempts)
+
+    def put(self, session_id: str, level: int, actual_word: str, cipher_name: str):
+        """
+        Store a new game session, stamping it with the current time.
+
+        Raises:
+            ValueError: If session_id is not a UUID or actual_word is not 5 letters
+        """
+        key = session_key(session_id)
+        if key is None:
+            raise ValueError(f"Invalid session id: {session_id!r}")
+        now = time.time()
+        self._cipher_names[level] = sys.intern(cipher_name)
+        value = _PACKED_SESSION.pack(now, pack_word(actual_word), level, 0)
+        shard = self._shard_for(key)
+        with shard.lock:
+            shard.sessions[key] = value
+            shard.schedule(key, int(now // self.resolution))
+
+    def get(self, session_id: str):
+        """Get a snapshot of a session record, or None if the session does not exist."""
+        key = session_key(session_id)
+        if key is None:
+            return None
+        shard = self._shard_for(key)
+        with shard.lock:
+            value = shard.sessions.get(key)
+        return self._decode(value) if value is not None else None
+
+    def update(self, session_id: str, **fields):
+        """
+        Atomically update fields of a session and refresh its timestamp.
+
+        Returns:
+            Snapshot of the updated session record, or None if it does not exist
+        """
+        key = session_key(session_id)
+        if key is None:
+            return None
+        now = time.time()
+        shard = self._shard_for(key)
+        with shard.lock:
+            value = shard.sessions.get(key)
+            if value is None:
+                return None
+            record = self._decode(value)
+            for name, field_value in fields.items():
+                setattr(record, name, field_value)
+            record.timestamp = now
+            shard.sessions[key] = record.pack()
+            shard.schedule(key, int(now // self.resolution))
+        return record
+
+    def increment_attempts(self, session_id: str):
+        """
+        Atomically increment a session's attempt count and refresh its timestamp.
+
+        Returns:
+            Snapshot of the updated session record, or None if it does not exist
+        """
+        key = session_key(session_id)
+        if key is None:
+            return None
+        now = time.time()
+        shard = self._shard_for(key)
+        with shard.lock:
+            value = shard.sessions.get(key)
+            if value is None:
+                return None
+            _, word_code, level, attempts = _PACKED_SESSION.unpack(value)
+            attempts += 1
+            shard.sessions[key] = _PACKED_SESSION.pack(now, word_code, level, attempts)
+            shard.schedule(key, int(now // self.resolution))
+        return SessionRecord(level, word_code, self._cipher_names.get(level), now, attempts)
+
+    def touch(self, session_id: str):
+        """Refresh a session's timestamp so it is not expired."""
+        self.update(session_id)
+
+    def pop(self, session_id: str):
+        """Remove a session and return its record (None if it does not exist)."""
+        key = session_key(session_id)
+        if key is None:
+            return None
+        shard = self._shard_for(key)
+        with shard.lock:
+            value = shard.sessions.pop(key, None)
+        return self._decode(value) if value is not None else None
+
+    def sweep(self, now: float = None) -> int:
+        """
+        Remove sessions that have not been touched within the timeout.
+
+        Only timing-wheel buckets that lie entirely before the cutoff are
+        visited, so the cost is proportional to the number of expired (or
+        superseded) entries rather than the number of live sessions. Shards
+        are swept one at a time, so requests on other shards are never blocked.
+
+        Args:
+            now: Reference time (defaults to the current time)
+
+        Returns:
+            Number of sessions removed
+        """
+        cutoff = (now if now is not None else time.time()) - self.timeout
+        # Buckets before this tick only hold entries touched before the cutoff
+        last_tick = int(cutoff // self.resolution)
+        unpack_timestamp = _PACKED_SESSION.unpack_from
+        removed = 0
+        for shard in self._shards:
+            with shard.lock:
+                if shard.oldest_tick is None:
+                    continue
+                for tick in range(shard.oldest_tick, last_tick):
+                    for key in shard.expiry_buckets.pop(tick, ()):
+                        value = shard.sessions.get(key)
+                        # Skip entries for sessions that were refreshed or already removed
+                        if value is not None and unpack_timestamp(value)[0] < cutoff:
+                            del shard.sessions[key]
+                            removed += 1
+                if shard.expiry_buckets:
+                    shard.oldest_tick = max(shard.oldest_tick, last_tick)
+                else:
+                    shard.oldest_tick = None
+        return removed
+
+    def start_sweeper(self, interval: float = None):
+        """Start a background thread that sweeps expired sessions periodically."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        interval = interval or Config.SESSION_SWEEP_INTERVAL
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(interval,), name='session-sweeper', daemon=True
+        )
+        self._thread.start()
+
+    def stop_sweeper(self, timeout: float = None):
+        """Stop the background sweeper thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self, interval: float):
+        """Sweeper loop."""
+        while not self._stop.wait(interval):
+            self.sweep()
+
+def create_session_store(backend: str = None):
+    """
+    Create the session store for a backend.
+
+    Args:
+        backend: 'memory' for this process only, or 'shared' for a table
+            shared by every worker process on the host (defaults to
+            Config.SESSION_BACKEND)
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    backend = backend or Config.SESSION_BACKEND
+    if backend == 'shared':
+        from services.shared_session_store import SharedSessionStore
+        return SharedSessionStore()
+    if backend != 'memory':
+        raise ValueError(f"Unknown session backend: {backend!r}")
+    return SessionStore()
+
+# Process-wide session store; SESSION_BACKEND=shared for prefork servers
+session_store = create_session_store()
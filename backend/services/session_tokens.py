@@ -0,0 +1,239 @@
+import base64
+import os
+import struct
+import threading
+import time
+from collections import OrderedDict
+from config import Config
+from services.session_store import SessionRecord
+from utils.word_utils import pack_word
+
+# Token: version, 12-byte GCM nonce, encrypted payload, 16-byte tag (base64url, no padding)
+_VERSION = b'\x01'
+_NONCE_SIZE = 12
+_TAG_SIZE = 16
+# Payload: game id, word code, level, attempts, issue time (epoch seconds)
+_PAYLOAD = struct.Struct('<8sIBBI')
+_TOKEN_SIZE = len(_VERSION) + _NONCE_SIZE + _PAYLOAD.size + _TAG_SIZE
+
+# Replay cache value for games that have ended
+_FINISHED = -1
+
+class SessionTokens:
+    """
+    Stateless game sessions carried by the client as encrypted tokens.
+
+    With Config.SESSION_TOKENS the session id handed out by /generate is an
+    AES-GCM token holding the game id, packed answer, level, attempt count
+    and issue time, under a key derived from Config.SECRET_KEY. Any process
+    with the same secret can serve any request, and the server keeps no
+    per-game state beyond the replay cache below. Every /validate returns
+    the next token. A token expires GAME_SESSION_TIMEOUT seconds after it
+    was issued.
+
+    Replaying an older token, to get back used attempts or keep playing a
+    finished game, is refused by a per-process LRU map of game id -> latest
+    attempt count (Config.SESSION_TOKEN_REPLAY_CACHE entries). Games evicted
+    from it, or replays sent to another process, are not caught. Pair token
+    mode with sticky routing where that matters.
+    """
+
+    def __init__(self, secret: str = None, timeout: float = None, cache_size: int = None):
+        self._secret = secret or Config.SECRET_KEY
+        self.timeout = timeout or Config.GAME_SESSION_TIMEOUT
+        self.cache_size = cache_size or Config.SESSION_TOKEN_REPLAY_CACHE
+        # Derived on first use so pycryptodome stays out of startup
+        self._key = None
+
+        # Last token each thread decrypted: a request opens the same token up to three times
+        self._opened = threading.local()
+
+        self._lock = threading.Lock()
+        self._latest = OrderedDict()
+        self._issued = 0
+        self._rejected = 0
+
+    def _cipher(self, nonce: bytes):
+        """A fresh AES-GCM cipher object for one token."""
+        from Crypto.Cipher import AES
+
+        if self._key is None:
+            from Crypto.Hash import SHA256
+            from Crypto.Protocol.KDF import HKDF
+            self._key = HKDF(self._secret.encode('utf-8'), 32, b'', SHA256, context=b'cryptowordle session token')
+        return AES.new(self._key, AES.MODE_GCM, nonce=nonce, mac_len=_TAG_SIZE)
+
+    def _seal(self, game_id: bytes, word_code: int, level: int, attempts: int, issued: float) -> str:
+        """Encrypt and authenticate a token payload."""
+        nonce = os.urandom(_NONCE_SIZE)
+        cipher = self._cipher(nonce)
+        cipher.update(_VERSION)
+        ciphertext, tag = cipher.encrypt_and_digest(_PAYLOAD.pack(game_id, word_code, level, attempts, int(issued)))
+        with self._lock:
+            self._issued += 1
+        return base64.urlsafe_b64encode(_VERSION + nonce + ciphertext + tag).rstrip(b'=').decode('ascii')
+
+    def _open(self, token: str):
+        """
+        Decrypt a token.
+
+        Returns:
+            (game id, word code, level, attempts, issue time), or None if the
+            token is malformed, forged or expired
+        """
+        opened = getattr(self._opened, 'last', None)
+        if opened is not None and opened[0] == token:
+            fields = opened[1]
+        else:
+            fields = self._decrypt(token)
+            self._opened.last = (token, fields)
+
+        if fields is None or fields[4] < time.time() - self.timeout:
+            return None
+        return fields
+
+    def _decrypt(self, token: str):
+        """Authenticate and decrypt a token's payload (None if malformed or forged)."""
+        try:
+            raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        except (ValueError, TypeError):
+            return None
+        if len(raw) != _TOKEN_SIZE or raw[:1] != _VERSION:
+            return None
+
+        cipher = self._cipher(raw[1:1 + _NONCE_SIZE])
+        cipher.update(_VERSION)
+        try:
+            payload = cipher.decrypt_and_verify(raw[1 + _NONCE_SIZE:-_TAG_SIZE], raw[-_TAG_SIZE:])
+        except ValueError:
+            return None
+        return _PAYLOAD.unpack(payload)
+
+    def _check_replay(self, game_id: bytes, attempts: int):
+        """
+        Refuse tokens that are not the latest for their game (caller holds the lock).
+
+        Returns:
+            False if the game has ended
+
+        Raises:
+            ValueError: If a newer token for the game has been issued
+        """
+        latest = self._latest.get(game_id)
+        if latest == _FINISHED:
+            return False
+        if latest is not None and latest != attempts:
+            self._rejected += 1
+            raise ValueError('Session token has already been used; send the latest one')
+        return True
+
+    def _remember(self, game_id: bytes, attempts: int):
+        """Record a game's latest attempt count, evicting the least recently used games (caller holds the lock)."""
+        self._latest[game_id] = attempts
+        self._latest.move_to_end(game_id)
+        while len(self._latest) > self.cache_size:
+            self._latest.popitem(last=False)
+
+    @staticmethod
+    def _record(fields: tuple, registry=None) -> SessionRecord:
+        """Turn token fields into a session record (cipher name from the level, looked up in registry)."""
+        if registry is None:
+            from services.cipher_registry import cipher_registry as registry
+
+        _, word_code, level, attempts, issued = fields
+        return SessionRecord(level, word_code, registry.get_cipher_class(level).NAME, issued, attempts)
+
+    def issue(self, level: int, actual_word: str) -> str:
+        """
+        Start a game.
+
+        Returns:
+            The game's first token
+
+        Raises:
+            ValueError: If actual_word is not 5 letters
+        """
+        game_id = os.urandom(8)
+        token = self._seal(game_id, pack_word(actual_word), level, 0, time.time())
+        with self._lock:
+            self._remember(game_id, 0)
+        return token
+
+    def get(self, token: str, registry=None):
+        """
+        Read a game from its token without advancing it.
+
+        Args:
+            token: The game's latest token
+            registry: CipherRegistry that names the game's cipher (defaults
+                to the process-wide one)
+
+        Returns:
+            Session record, or None if the token is invalid, expired or its game has ended
+
+        Raises:
+            ValueError: If a newer token for the game has been issued
+        """
+        fields = self._open(token)
+        if fields is None:
+            return None
+        with self._lock:
+            if not self._check_replay(fields[0], fields[3]):
+                return None
+        return self._record(fields, registry)
+
+    def increment_attempts(self, token: str, registry=None):
+        """
+        Use up one attempt.
+
+        Args:
+            token: The game's latest token
+            registry: CipherRegistry that names the game's cipher (see get)
+
+        Returns:
+            (updated session record, next token), or None if the token is
+            invalid, expired or its game has ended
+
+        Raises:
+            ValueError: If a newer token for the game has been issued
+        """
+        fields = self._open(token)
+        if fields is None:
+            return None
+        game_id, word_code, level, attempts, _ = fields
+        with self._lock:
+            if not self._check_replay(game_id, attempts):
+                return None
+            # Claimed before the new token exists, so concurrent uses of one token cannot both advance
+            self._remember(game_id, attempts + 1)
+
+        now = time.time()
+        next_token = self._seal(game_id, word_code, level, attempts + 1, now)
+        return self._record((game_id, word_code, level, attempts + 1, now), registry), next_token
+
+    def pop(self, token: str, registry=None):
+        """End a game so none of its tokens are accepted again (in this process)."""
+        fields = self._open(token)
+        if fields is None:
+            return None
+        with self._lock:
+            self._remember(fields[0], _FINISHED)
+        return self._record(fields, registry)
+
+    def get_stats(self) -> dict:
+        """
+        Get token metrics.
+
+        Returns:
+            Dictionary with tokens issued, replays refused and replay cache size
+        """
+        with self._lock:
+            return {
+                'tokens_issued': self._issued,
+                'replays_rejected': self._rejected,
+                'replay_cache': len(self._latest),
+                'replay_cache_size': self.cache_size
+            }
+
+# Process-wide token codec and replay cache
+session_tokens = SessionTokens()
@@ -0,0 +1,469 @@
+import fcntl
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+import time
+from config import Config
+from services.session_store import SessionRecord, session_key
+from utils.word_utils import pack_word
+
+# Header: magic, capacity (slots), slots per bucket, record size, last sweep time
+_HEADER = struct.Struct('<8sQIId')
+_MAGIC = b'CWSESS01'
+_HEADER_SIZE = 64
+_LAST_SWEEP = _HEADER.size - 8
+
+# Cipher names by level, fixed-width UTF-8, after the header
+_NAME_SIZE = 32
+_NAME_COUNT = 256
+_NAMES_OFFSET = _HEADER_SIZE
+_DATA_OFFSET = _NAMES_OFFSET + _NAME_SIZE * _NAME_COUNT
+
+# Slot: 16-byte session key, last-touch timestamp, word code, level, attempts, state
+_RECORD = struct.Struct('<16sdIBBBx')
+_TIMESTAMP = 16
+_ATTEMPTS = 29
+_STATE = 30
+_EMPTY, _LIVE = 0, 1
+
+# Keys probe linearly within their bucket of slots, which one lock guards
+SLOTS_PER_BUCKET = 64
+_SLOT_MASK = SLOTS_PER_BUCKET - 1
+_BUCKET_BYTES = SLOTS_PER_BUCKET * _RECORD.size
+
+# Byte-range lock offsets in the backing file (advisory; they do not cover the data)
+_INIT_LOCK = 0
+_SWEEP_LOCK = 1
+_BUCKET_LOCKS = 2
+
+# Open file description locks (Linux) are owned by the descriptor rather than the
+# process, so the kernel's per-process deadlock detection cannot report false
+# deadlocks between threads; elsewhere POSIX record locks are used
+_OFD_SETLK = getattr(fcntl, 'F_OFD_SETLK', None)
+_OFD_SETLKW = getattr(fcntl, 'F_OFD_SETLKW', None)
+# struct flock: type, whence, start, length, pid
+_FLOCK = struct.Struct('hhqqi4x')
+
+def _lock_byte(fd: int, offset: int, blocking: bool = True):
+    """Take the exclusive lock on one byte of the backing file (OSError if not blocking and held)."""
+    if _OFD_SETLKW is None:
+        fcntl.lockf(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB, 1, offset)
+    else:
+        fcntl.fcntl(fd, _OFD_SETLKW if blocking else _OFD_SETLK,
+                    _FLOCK.pack(fcntl.F_WRLCK, os.SEEK_SET, offset, 1, 0))
+
+def _unlock_byte(fd: int, offset: int):
+    """Release a lock taken with _lock_byte."""
+    if _OFD_SETLKW is None:
+        fcntl.lockf(fd, fcntl.LOCK_UN, 1, offset)
+    else:
+        fcntl.fcntl(fd, _OFD_SETLK, _FLOCK.pack(fcntl.F_UNLCK, os.SEEK_SET, offset, 1, 0))
+
+def _record_dtype():
+    """NumPy view of one slot, for vectorized sweeps."""
+    import numpy as np
+    return np.dtype([('key', 'V16'), ('timestamp', '<f8'), ('word_code', '<u4'),
+                     ('level', 'u1'), ('attempts', 'u1'), ('state', 'u1'), ('pad', 'u1')])
+
+def default_path() -> str:
+    """Backing file location: /dev/shm when available, else the temp directory."""
+    directory = '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+    return os.path.join(directory, 'cryptowordle-sessions')
+
+class SharedSessionStore:
+    """
+    Game session store shared by every worker process on a host.
+
+    Sessions live in a fixed-size open-addressing hash table inside a
+    memory-mapped file (on tmpfs by default), so a /validate can land on
+    any worker. Slots are fixed-width records of the 16-byte session key,
+    the packed answer, level, attempts and last-touch timestamp. The table
+    is split into buckets of SLOTS_PER_BUCKET slots. A key probes linearly
+    within its bucket, and each bucket is guarded by a byte-range file lock
+    (between processes) plus a thread lock (within a process). Deletes
+    shift the following entries back, so there are no tombstones.
+
+    Reads take the bucket lock as well. A seqlock would avoid the lock
+    syscall, but CPython gives no ordering guarantee for loads from the
+    mapping on weakly ordered CPUs.
+
+    A session that outlives the timeout reads as missing. When a bucket is
+    full, its least recently touched session is evicted.
+
+    Same interface as SessionStore. Cipher names are stored once per level
+    in the file's header.
+    """
+
+    def __init__(self, path: str = None, capacity: int = None, timeout: float = None):
+        self.timeout = timeout or Config.GAME_SESSION_TIMEOUT
+        self.path = path or Config.SESSION_SHARED_PATH or default_path()
+        requested = max(SLOTS_PER_BUCKET, capacity or Config.SESSION_SHARED_CAPACITY)
+
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            self.capacity = self._initialize(1 << (requested - 1).bit_length())
+            self._mm = mmap.mmap(self._fd, _DATA_OFFSET + self.capacity * _RECORD.size)
+        except Exception:
+            os.close(self._fd)
+            raise
+
+        self._buckets = self.capacity // SLOTS_PER_BUCKET
+        self._bucket_bits = self._buckets.bit_length() - 1
+        self._thread_locks = tuple(threading.Lock() for _ in range(min(self._buckets, 256)))
+        self._cipher_names = {}
+        self._evictions = 0
+        self._stop = threading.Event()
+        self._thread = None
+        # The mapping is inherited by forked workers; the descriptor (which owns the locks) is not
+        os.register_at_fork(after_in_child=self._after_fork)
+
+    def _after_fork(self):
+        """Give a forked child its own descriptor and thread locks."""
+        if self._fd is None:
+            return
+        os.close(self._fd)
+        self._fd = os.open(self.path, os.O_RDWR)
+        self._thread_locks = tuple(threading.Lock() for _ in self._thread_locks)
+        self._thread = None
+
+    def _initialize(self, capacity: int) -> int:
+        """
+        Size and stamp a new backing file, or check an existing one.
+
+        Returns:
+            The table capacity (an existing file keeps its own)
+
+        Raises:
+            ValueError: If the file holds something other than a session table
+        """
+        _lock_byte(self._fd, _INIT_LOCK)
+        try:
+            if os.fstat(self._fd).st_size == 0:
+                os.ftruncate(self._fd, _DATA_OFFSET + capacity * _RECORD.size)
+                os.pwrite(self._fd, _HEADER.pack(_MAGIC, capacity, SLOTS_PER_BUCKET, _RECORD.size, 0.0), 0)
+                return capacity
+
+            magic, existing, slots, record_size, _ = _HEADER.unpack(os.pread(self._fd, _HEADER.size, 0))
+            if (magic, slots, record_size) != (_MAGIC, SLOTS_PER_BUCKET, _RECORD.size):
+                raise ValueError(f"{self.path} is not a compatible session table; remove it or set SESSION_SHARED_PATH")
+            if existing != capacity:
+                print(f"Session table {self.path} has {existing} slots; ignoring the requested {capacity}")
+            return existing
+        finally:
+            _unlock_byte(self._fd, _INIT_LOCK)
+
+    def close(self):
+        """Unmap the table and close the backing file."""
+        self.stop_sweeper()
+        self._mm.close()
+        os.close(self._fd)
+        self._fd = None
+
+    def unlink(self):
+        """Remove the backing file (sessions stay readable until every process closes it)."""
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+    def __len__(self):
+        import numpy as np
+        records = np.frombuffer(self._mm, dtype=_record_dtype(), count=self.capacity, offset=_DATA_OFFSET)
+        live = int(np.count_nonzero(records['state'] == _LIVE))
+        del records
+        return live
+
+    def _acquire(self, bucket: int):
+        """Take a bucket's lock against other threads and other processes (pair with _release)."""
+        self._thread_locks[bucket % len(self._thread_locks)].acquire()
+        try:
+            _lock_byte(self._fd, _BUCKET_LOCKS + bucket)
+        except BaseException:
+            self._thread_locks[bucket % len(self._thread_locks)].release()
+            raise
+
+    def _release(self, bucket: int):
+        """Release a bucket's lock."""
+        try:
+            _unlock_byte(self._fd, _BUCKET_LOCKS + bucket)
+        finally:
+            self._thread_locks[bucket % len(self._thread_locks)].release()
+
+    def _locate(self, key: bytes) -> tuple:
+        """Bucket and home slot of a key (from its leading bytes; UUIDs are already random)."""
+        h = int.from_bytes(key[:8], 'little')
+        return h & (self._buckets - 1), (h >> self._bucket_bits) & _SLOT_MASK
+
+    def _home(self, offset: int) -> int:
+        """Home slot of the key stored at a slot offset."""
+        return (int.from_bytes(self._mm[offset:offset + 8], 'little') >> self._bucket_bits) & _SLOT_MASK
+
+    def _probe(self, key: bytes, bucket: int, home: int) -> tuple:
+        """
+        Find a key in its bucket (caller holds the lock).
+
+        Returns:
+            (offset of the key's slot or None, offset of the first empty
+            slot on its probe path or None if the bucket is full)
+        """
+        mm = self._mm
+        base = _DATA_OFFSET + bucket * _BUCKET_BYTES
+        for step in range(SLOTS_PER_BUCKET):
+            offset = base + ((home + step) & _SLOT_MASK) * _RECORD.size
+            if mm[offset + _STATE] == _EMPTY:
+                return None, offset
+            if mm[offset:offset + 16] == key:
+                return offset, None
+        return None, None
+
+    def _delete(self, bucket: int, slot: int):
+        """Empty a slot, shifting later entries of the probe run back into it (caller holds the lock)."""
+        mm = self._mm
+        base = _DATA_OFFSET + bucket * _BUCKET_BYTES
+        hole = slot
+        for step in range(1, SLOTS_PER_BUCKET):
+            index = (slot + step) & _SLOT_MASK
+            offset = base + index * _RECORD.size
+            if mm[offset + _STATE] == _EMPTY:
+                break
+            # An entry may fill the hole unless its home lies after the hole in the run
+            if (index - self._home(offset)) & _SLOT_MASK >= (index - hole) & _SLOT_MASK:
+                hole_offset = base + hole * _RECORD.size
+                mm[hole_offset:hole_offset + _RECORD.size] = mm[offset:offset + _RECORD.size]
+                hole = index
+        mm[base + hole * _RECORD.size + _STATE] = _EMPTY
+
+    def _evict_oldest(self, bucket: int):
+        """Make room in a full bucket by removing its least recently touched session."""
+        base = _DATA_OFFSET + bucket * _BUCKET_BYTES
+        oldest = min(
+            range(SLOTS_PER_BUCKET),
+            key=lambda index: struct.unpack_from('<d', self._mm, base + index * _RECORD.size + _TIMESTAMP)[0]
+        )
+        self._delete(bucket, oldest)
+        self._evictions += 1
+
+    def _live_record(self, key: bytes, bucket: int, home: int, now: float):
+        """Offset and fields of a key's unexpired record, deleting it if expired (caller holds the lock)."""
+        offset, _ = self._probe(key, bucket, home)
+        if offset is None:
+            return None, None
+        fields = _RECORD.unpack_from(self._mm, offset)
+        if fields[1] < now - self.timeout:
+            self._delete(bucket, (offset - _DATA_OFFSET) // _RECORD.size & _SLOT_MASK)
+            return None, None
+        return offset, fields
+
+    def _cipher_name(self, level: int):
+        """Cipher name recorded for a level by any process."""
+        name = self._cipher_names.get(level)
+        if name is None:
+            offset = _NAMES_OFFSET + level * _NAME_SIZE
+            raw = self._mm[offset:offset + _NAME_SIZE].rstrip(b'\0')
+            if raw:
+                name = self._cipher_names[level] = sys.intern(raw.decode('utf-8'))
+        return name
+
+    def _record(self, fields: tuple) -> SessionRecord:
+        """Turn unpacked slot fields into a record."""
+        _, timestamp, word_code, level, attempts, _ = fields
+        return SessionRecord(level, word_code, self._cipher_name(level), timestamp, attempts)
+
+    def put(self, session_id: str, level: int, actual_word: str, cipher_name: str):
+        """
+        Store a new game session, stamping it with the current time.
+
+        Raises:
+            ValueError: If session_id is not a UUID, actual_word is not 5
+                letters or cipher_name does not fit the name table
+        """
+        key = session_key(session_id)
+        if key is None:
+            raise ValueError(f"Invalid session id: {session_id!r}")
+        if self._cipher_names.get(level) != cipher_name:
+            encoded = cipher_name.encode('utf-8')
+            if len(encoded) > _NAME_SIZE or not 0 <= level < _NAME_COUNT:
+                raise ValueError(f"Cannot store cipher name {cipher_name!r} for level {level}")
+            offset = _NAMES_OFFSET + level * _NAME_SIZE
+            self._mm[offset:offset + _NAME_SIZE] = encoded.ljust(_NAME_SIZE, b'\0')
+            self._cipher_names[level] = sys.intern(cipher_name)
+
+        value = (key, time.time(), pack_word(actual_word), level, 0, _LIVE)
+        bucket, home = self._locate(key)
+        self._acquire(bucket)
+        try:
+            offset, empty = self._probe(key, bucket, home)
+            if offset is None and empty is None:
+                self._evict_oldest(bucket)
+                offset, empty = self._probe(key, bucket, home)
+            _RECORD.pack_into(self._mm, offset if offset is not None else empty, *value)
+        finally:
+            self._release(bucket)
+
+    def get(self, session_id: str):
+        """Get a snapshot of a session record, or None if the session does not exist."""
+        key = session_key(session_id)
+        if key is None:
+            return None
+        bucket, home = self._locate(key)
+        self._acquire(bucket)
+        try:
+            _, fields = self._live_record(key, bucket, home, time.time())
+        finally:
+            self._release(bucket)
+        return self._record(fields) if fields is not None else None
+
+    def update(self, session_id: str, **fields):
+        """
+        Atomically update fields of a session and refresh its timestamp.
+
+        Returns:
+            Snapshot of the updated session record, or None if it does not exist
+        """
+        key = session_key(session_id)
+        if key is None:
+            return None
+        now = time.time()
+        bucket, home = self._locate(key)
+        self._acquire(bucket)
+        try:
+            offset, values = self._live_record(key, bucket, home, now)
+            if offset is None:
+                return None
+            record = self._record(values)
+            for name, field_value in fields.items():
+                setattr(record, name, field_value)
+            record.timestamp = now
+            _RECORD.pack_into(self._mm, offset, key, now, record.word_code, record.level, record.attempts, _LIVE)
+        finally:
+            self._release(bucket)
+        return record
+
+    def increment_attempts(self, session_id: str):
+        """
+        Atomically increment a session's attempt count and refresh its timestamp.
+
+        Returns:
+            Snapshot of the updated session record, or None if it does not exist
+        """
+        key = session_key(session_id)
+        if key is None:
+            return None
+        now = time.time()
+        bucket, home = self._locate(key)
+        self._acquire(bucket)
+        try:
+            offset, values = self._live_record(key, bucket, home, now)
+            if offset is None:
+                return None
+            attempts = values[4] + 1
+            struct.pack_into('<d', self._mm, offset + _TIMESTAMP, now)
+            self._mm[offset + _ATTEMPTS] = attempts
+        finally:
+            self._release(bucket)
+        return SessionRecord(values[3], values[2], self._cipher_name(values[3]), now, attempts)
+
+    def touch(self, session_id: str):
+        """Refresh a session's timestamp so it is not expired."""
+        self.update(session_id)
+
+    def pop(self, session_id: str):
+        """Remove a session and return its record (None if it does not exist)."""
+        key = session_key(session_id)
+        if key is None:
+            return None
+        bucket, home = self._locate(key)
+        self._acquire(bucket)
+        try:
+            offset, fields = self._live_record(key, bucket, home, time.time())
+            if offset is not None:
+                self._delete(bucket, (offset - _DATA_OFFSET) // _RECORD.size & _SLOT_MASK)
+        finally:
+            self._release(bucket)
+        return self._record(fields) if fields is not None else None
+
+    def sweep(self, now: float = None) -> int:
+        """
+        Remove sessions that have not been touched within the timeout.
+
+        Expired slots are found with one vectorized pass over the mapping,
+        then each affected bucket is rechecked and cleaned under its lock.
+
+        Args:
+            now: Reference time (defaults to the current time)
+
+        Returns:
+            Number of sessions removed
+        """
+        import numpy as np
+
+        now = now if now is not None else time.time()
+        cutoff = now - self.timeout
+        records = np.frombuffer(self._mm, dtype=_record_dtype(), count=self.capacity, offset=_DATA_OFFSET)
+        stale = (records['state'] == _LIVE) & (records['timestamp'] < cutoff)
+        buckets = np.unique(np.flatnonzero(stale) // SLOTS_PER_BUCKET).tolist()
+        del records, stale
+
+        removed = 0
+        for bucket in buckets:
+            base = _DATA_OFFSET + bucket * _BUCKET_BYTES
+            self._acquire(bucket)
+            try:
+                for index in range(SLOTS_PER_BUCKET):
+                    offset = base + index * _RECORD.size
+                    # Deleting shifts a later entry into this slot, so check it again
+                    while (self._mm[offset + _STATE] == _LIVE and
+                           struct.unpack_from('<d', self._mm, offset + _TIMESTAMP)[0] < cutoff):
+                        self._delete(bucket, index)
+                        removed += 1
+            finally:
+                self._release(bucket)
+
+        struct.pack_into('<d', self._mm, _LAST_SWEEP, now)
+        return removed
+
+    def get_stats(self) -> dict:
+        """
+        Get table occupancy.
+
+        Returns:
+            Dictionary with capacity, live sessions and this process's evictions
+        """
+        return {'capacity': self.capacity, 'sessions': len(self), 'evictions': self._evictions}
+
+    def start_sweeper(self, interval: float = None):
+        """Start a background thread that sweeps expired sessions periodically."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        interval = interval or Config.SESSION_SWEEP_INTERVAL
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(interval,), name='session-sweeper', daemon=True
+        )
+        self._thread.start()
+
+    def stop_sweeper(self, timeout: float = None):
+        """Stop the background sweeper thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self, interval: float):
+        """Sweeper loop: one process per interval does the sweep, the others skip it."""
+        while not self._stop.wait(interval):
+            try:
+                _lock_byte(self._fd, _SWEEP_LOCK, blocking=False)
+            except OSError:
+                continue
+            try:
+                last_sweep = struct.unpack_from('<d', self._mm, _LAST_SWEEP)[0]
+                if time.time() - last_sweep >= interval:
+                    self.sweep()
+            except Exception as e:
+                print(f"Error sweeping shared sessions: {e}")
+            finally:
+                _unlock_byte(self._fd, _SWEEP_LOCK)
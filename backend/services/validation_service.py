@@ -1,59 +1,50 @@
 from typing import List, Tuple
+from services.feedback_engine import feedback_engine
+from utils.feedback_utils import ALL_GREEN, decode_feedback
 
 class ValidationService:
     """Service for validating user guesses against actual words with Wordle-style feedback."""
 
     @staticmethod
-    def validate_guess(guess: str, actual_word: str) -> Tuple[List[str], bool]:
+    def feedback_code(guess: str, actual_word: str) -> int:
         """
-        Validate a user's guess against the actual word.
+        Compute a guess's feedback as one base-3 code (see utils.feedback_utils).
 
         Args:
             guess: The user's 5-letter guess
             actual_word: The actual word to guess
 
         Returns:
-            Tuple of (feedback_list, is_correct)
-            feedback_list: List of 'green', 'yellow', or 'gray' for each letter
-            is_correct: Boolean indicating if the guess is completely correct
+            Integer in [0, 243); ALL_GREEN means the guess is correct
 
         Raises:
             ValueError: If guess or actual_word is not exactly 5 letters
         """
-        # Validate input
         if len(guess) != 5 or len(actual_word) != 5:
             raise ValueError("Both guess and actual word must be exactly 5 letters")
 
-        guess = guess.upper()
-        actual_word = actual_word.upper()
-
-        # Check if guess is completely correct
-        is_correct = guess == actual_word
+        # One lookup in the precomputed feedback matrix (or a direct computation)
+        return feedback_engine.feedback_code(guess.upper(), actual_word.upper())
 
-        # Create feedback list
-        feedback = ['gray'] * 5
-
-        # First pass: mark green (correct position)
-        actual_word_chars = list(actual_word)
-        guess_chars = list(guess)
+    @classmethod
+    def validate_guess(cls, guess: str, actual_word: str) -> Tuple[List[str], bool]:
+        """
+        Validate a user's guess against the actual word.
 
-        for i in range(5):
-            if guess_chars[i] == actual_word_chars[i]:
-                feedback[i] = 'green'
-                # Mark these as processed
-                actual_word_chars[i] = None
-                guess_chars[i] = None
+        Args:
+            guess: The user's 5-letter guess
+            actual_word: The actual word to guess
 
-        # Second pass: mark yellow (correct letter, wrong position)
-        for i in range(5):
-            if guess_chars[i] is not None:  # Not already marked green
-                if guess_chars[i] in actual_word_chars:
-                    feedback[i] = 'yellow'
-                    # Remove one occurrence from actual_word_chars
-                    index = actual_word_chars.index(guess_chars[i])
-                    actual_word_chars[index] = None
+        Returns:
+            Tuple of (feedback_list, is_correct)
+            feedback_list: List of 'green', 'yellow', or 'gray' for each letter
+            is_correct: Boolean indicating if the guess is completely correct
 
-        return feedback, is_correct
+        Raises:
+            ValueError: If guess or actual_word is not exactly 5 letters
+        """
+        code = cls.feedback_code(guess, actual_word)
+        return decode_feedback(code), code == ALL_GREEN
 
     @staticmethod
     def get_color_code(color_name: str) -> str:
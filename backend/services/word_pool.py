@@ -0,0 +1,153 @@
+import threading
+import time
+from collections import deque
+from typing import Optional
+from config import Config
+from services.word_service import WordService
+
+class WordPool:
+    """Bounded pool of prefetched words kept filled by a background thread."""
+
+    def __init__(self, high_watermark: int = None, low_watermark: int = None, fetcher=None):
+        self.high_watermark = high_watermark or Config.WORD_POOL_HIGH_WATERMARK
+        self.low_watermark = low_watermark or Config.WORD_POOL_LOW_WATERMARK
+        if self.low_watermark > self.high_watermark:
+            raise ValueError("Word pool low watermark must not exceed the high watermark")
+
+        # Callable taking a batch size and returning a (possibly empty) list of words
+        self._fetcher = fetcher or WordService.fetch_batch_from_api
+
+        # deque.append/popleft are atomic, so the request path needs no lock
+        self._words = deque(maxlen=self.high_watermark)
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+        self._stats_lock = threading.Lock()
+        self._pool_hits = 0
+        self._fallback_hits = 0
+        self._refills = 0
+        self._last_refill_seconds = 0.0
+        self._total_refill_seconds = 0.0
+
+    def start(self):
+        """Start the background refill thread (no-op if already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='word-pool-refill', daemon=True)
+        self._thread.start()
+        self._wake.set()
+
+    def stop(self, timeout: float = None):
+        """Stop the background refill thread."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def get_word(self) -> str:
+        """
+        Take a word from the pool without blocking.
+
+        Returns:
+            A 5-letter word in uppercase, taken from the local fallback list
+            when the pool is empty
+        """
+        word = self.try_get_word()
+        if word is None:
+            with self._stats_lock:
+                self._fallback_hits += 1
+            return WordService.get_fallback_word()
+        return word
+
+    def try_get_word(self) -> Optional[str]:
+        """
+        Take a word from the pool without blocking or falling back.
+
+        Returns:
+            A 5-letter word in uppercase, or None if the pool is empty
+        """
+        try:
+            word = self._words.popleft()
+        except IndexError:
+            self._wake.set()
+            return None
+
+        with self._stats_lock:
+            self._pool_hits += 1
+        if len(self._words) < self.low_watermark:
+            self._wake.set()
+        return word
+
+    def put_words(self, words: list):
+        """Add words fetched elsewhere (e.g. by the async word service); the oldest are dropped when full."""
+        self._words.extend(words)
+
+    def depth(self) -> int:
+        """Number of words currently waiting in the pool."""
+        return len(self._words)
+
+    def refill(self) -> int:
+        """
+        Fetch words until the pool reaches its high watermark.
+
+        Returns:
+            Number of words added to the pool
+        """
+        added = 0
+        started = time.perf_counter()
+        while len(self._words) < self.high_watermark and not self._stop.is_set():
+            room = self.high_watermark - len(self._words)
+            words = self._fetcher(min(Config.WORD_API_BATCH_SIZE, room))
+            if not words:
+                break
+            words = words[:room]
+            self._words.extend(words)
+            added += len(words)
+        elapsed = time.perf_counter() - started
+
+        if added:
+            with self._stats_lock:
+                self._refills += 1
+                self._last_refill_seconds = elapsed
+                self._total_refill_seconds += elapsed
+        return added
+
+    def get_stats(self) -> dict:
+        """
+        Get pool sizing metrics.
+
+        Returns:
+            Dictionary with depth, watermarks, hit counts and refill latency
+        """
+        with self._stats_lock:
+            average = self._total_refill_seconds / self._refills if self._refills else 0.0
+            return {
+                'depth': len(self._words),
+                'high_watermark': self.high_watermark,
+                'low_watermark': self.low_watermark,
+                'pool_hits': self._pool_hits,
+                'fallback_hits': self._fallback_hits,
+                'refills': self._refills,
+                'last_refill_seconds': round(self._last_refill_seconds, 4),
+                'avg_refill_seconds': round(average, 4)
+            }
+
+    def _run(self):
+        """Refill loop: sleep until woken, then top the pool back up."""
+        while not self._stop.is_set():
+            self._wake.wait(Config.WORD_POOL_RETRY_INTERVAL)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            if len(self._words) >= self.low_watermark:
+                continue
+
+            if self.refill() == 0 and len(self._words) < self.high_watermark:
+                # Upstream is unavailable; back off before trying again
+                self._stop.wait(Config.WORD_POOL_RETRY_INTERVAL)
+
+# Process-wide pool shared by all requests
+word_pool = WordPool()
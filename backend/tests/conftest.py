@@ -0,0 +1,11 @@
+import pytest
+from config import Config
+
+@pytest.fixture
+def offline(monkeypatch):
+    """Config for apps built in tests: no background prefetch, pre-generation or matrix build, so nothing calls the word API."""
+    monkeypatch.setattr(Config, 'WORD_POOL_PREFETCH', False)
+    monkeypatch.setattr(Config, 'PUZZLE_PREGENERATE', False)
+    monkeypatch.setattr(Config, 'FEEDBACK_MATRIX', False)
+    monkeypatch.setattr(Config, 'RSA_KEY_BITS', 0)
+    monkeypatch.setattr(Config, 'SESSION_TOKENS', False)
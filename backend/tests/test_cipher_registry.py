@@ -0,0 +1,114 @@
+import asyncio
+import httpx
+import pytest
+from app import create_app
+from asgi import create_asgi_app
+from benchmarks.stub_word_api import create_stub_word_api
+from ciphers.base_cipher import BaseCipher
+from config import Config
+from services.async_word_service import AsyncWordService
+from services.cipher_registry import CipherRegistry, cipher_registry
+from services.cipher_service import cipher_service
+from services.puzzle_factory import puzzle_factory
+from services.word_pool import WordPool
+
+class ReverseCipher(BaseCipher):
+    """A cipher level that only exists in the test registry."""
+
+    LEVEL = 10
+    NAME = 'Reverse Cipher'
+    DESCRIPTION = 'Letters in reverse order'
+    DIFFICULTY = 'Trivial'
+
+    def encrypt(self, plaintext: str) -> str:
+        return plaintext[::-1]
+
+    def decrypt(self, ciphertext: str) -> str:
+        return ciphertext[::-1]
+
+    def get_hints(self) -> tuple:
+        return ('Read it backwards', 'Really, backwards', 'Last letter first')
+
+@pytest.fixture
+def registry():
+    registry = CipherRegistry()
+    registry.register('ciphers.caesar_cipher:CaesarCipher', 1)
+    registry.register(ReverseCipher)
+    return registry
+
+def test_path_levels_are_imported_on_first_use(registry):
+    assert not registry.is_loaded(1)
+    assert registry.get_cipher_class(1).__name__ == 'CaesarCipher'
+    assert registry.is_loaded(1)
+    assert registry.levels() == [1, 10]
+    assert 2 not in registry
+
+def test_register_rejects_duplicates_and_unnamed_paths(registry):
+    with pytest.raises(ValueError):
+        registry.register(ReverseCipher)
+    with pytest.raises(ValueError):
+        registry.register('ciphers.caesar_cipher:CaesarCipher')
+    registry.register('ciphers.caesar_cipher:CaesarCipher', 10, replace=True)
+    assert registry.get_cipher_class(10).__name__ == 'CaesarCipher'
+
+def test_unknown_level(registry):
+    with pytest.raises(ValueError, match='Supported levels: \\[1, 10\\]'):
+        registry.get_cipher_class(2)
+
+def test_prepare_imports_every_level_and_runs_its_hooks(registry):
+    calls = []
+    registry.register('ciphers.vigenere_cipher:VigenereCipher', 3, prepare=(lambda: calls.append('a'), lambda: calls.append('b')))
+    registry.prepare()
+    assert all(registry.is_loaded(level) for level in registry.levels())
+    assert calls == ['a', 'b']
+
+def test_default_app_uses_the_process_wide_services(offline):
+    app = create_app()
+    assert app.extensions['cipher_registry'] is cipher_registry
+    assert app.extensions['cipher_service'] is cipher_service
+    assert app.extensions['puzzle_factory'] is puzzle_factory
+
+def test_app_built_on_an_injected_registry(offline, registry):
+    app = create_app(registry)
+    assert app.extensions['cipher_service'].registry is registry
+    # Queues only for the standard levels the registry also has
+    assert set(app.extensions['puzzle_factory'].target_depths) == {1}
+
+    client = app.test_client()
+    levels = client.get('/api/levels').get_json()['levels']
+    assert [(level['level'], level['name']) for level in levels] == [(1, 'Caesar Cipher'), (10, 'Reverse Cipher')]
+    assert client.get('/api/generate?level=2').status_code == 400
+
+    puzzle = client.get('/api/generate?level=10').get_json()
+    assert puzzle['cipher'] == 'Reverse Cipher'
+    word = puzzle['encrypted_word'][::-1]
+    assert client.get(f"/api/game-status?session_id={puzzle['session_id']}").get_json()['cipher_name'] == 'Reverse Cipher'
+    result = client.post('/api/validate', json={'guess': word, 'session_id': puzzle['session_id']}).get_json()
+    assert result['correct'] and result['actual_word'] == word
+
+def test_token_sessions_name_ciphers_from_the_injected_registry(offline, registry, monkeypatch):
+    monkeypatch.setattr(Config, 'SESSION_TOKENS', True)
+    client = create_app(registry).test_client()
+    puzzle = client.get('/api/generate?level=10').get_json()
+    status = client.get(f"/api/game-status?session_id={puzzle['session_id']}").get_json()
+    assert (status['level'], status['cipher_name']) == (10, 'Reverse Cipher')
+
+def test_asgi_app_uses_the_flask_app_registry(offline, registry):
+    word_service = AsyncWordService(pool=WordPool(), transport=httpx.ASGITransport(app=create_stub_word_api(words=['SLATE'])))
+    app = create_asgi_app(flask_app=create_app(registry), word_service=word_service)
+    assert app.state.cipher_registry is registry
+
+    async def play():
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url='http://test') as client:
+                # A ready puzzle on the injected factory's level 1 queue is served as is
+                app.state.puzzle_factory._queues[1].append(('CRANE', 'FUDQH', 'Caesar Cipher', ('', '', '')))
+                queued = await client.get('/api/generate?level=1')
+                custom = await client.get('/api/generate?level=10')
+                unknown = await client.get('/api/generate?level=2')
+                return queued, custom, unknown
+
+    queued, custom, unknown = asyncio.run(play())
+    assert queued.json()['encrypted_word'] == 'FUDQH'
+    assert (custom.json()['encrypted_word'], custom.json()['cipher']) == ('ETALS', 'Reverse Cipher')
+    assert unknown.status_code == 400
@@ -0,0 +1,24 @@
+import pytest
+from config import Config
+from services.ambiguity_analyzer import ambiguity_analyzer
+from services.cipher_service import CipherService
+from services.dictionary_service import word_dictionary
+
+@pytest.fixture
+def scored(monkeypatch):
+    """Puzzles passed to the ambiguity analyzer during the test."""
+    monkeypatch.setattr(Config, 'PUZZLE_SCORE_AMBIGUITY', True)
+    calls = []
+    monkeypatch.setattr(ambiguity_analyzer, 'analyze', lambda encrypted_word, cipher: calls.append(encrypted_word) or (1, 1, 1, 1))
+    return calls
+
+def test_ambiguity_is_not_scored_without_word_list(scored, monkeypatch):
+    monkeypatch.setattr(word_dictionary, 'has_word_list', lambda: False)
+    puzzles = CipherService().encrypt_batch(['CRANE', 'SLATE'], 1, verify=True)
+    assert all(puzzles)
+    assert scored == []
+
+def test_ambiguity_is_scored_with_word_list(scored, monkeypatch):
+    monkeypatch.setattr(word_dictionary, 'has_word_list', lambda: True)
+    puzzles = CipherService().encrypt_batch(['CRANE', 'SLATE'], 1, verify=True)
+    assert scored == [puzzle[0] for puzzle in puzzles]
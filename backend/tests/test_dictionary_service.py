@@ -0,0 +1,24 @@
+from config import Config
+from services.dictionary_service import WordDictionary
+
+def test_without_word_list_every_guess_is_accepted():
+    dictionary = WordDictionary(path='')
+    assert not dictionary.has_word_list()
+    assert dictionary.accepts_guess('CRANE')
+    assert dictionary.accepts_guess('QQQQQ')
+
+def test_word_list_limits_guesses(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, 'CACHE_DIR', str(tmp_path / 'cache'))
+    words = tmp_path / 'words.txt'
+    words.write_text('crane\nslate\n')
+    dictionary = WordDictionary(path=str(words))
+    assert dictionary.has_word_list()
+    assert len(dictionary.load()) == 2
+    assert dictionary.accepts_guess('crane')
+    assert not dictionary.accepts_guess('QQQQQ')
+
+def test_unreadable_word_list_falls_back_to_accepting_every_guess(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, 'CACHE_DIR', str(tmp_path / 'cache'))
+    dictionary = WordDictionary(path=str(tmp_path / 'missing.txt'))
+    assert not dictionary.has_word_list()
+    assert dictionary.accepts_guess('QQQQQ')
@@ -0,0 +1,88 @@
+import itertools
+import numpy as np
+import pytest
+from config import Config
+from services.dictionary_service import WordDictionary
+from services.feedback_engine import FeedbackEngine
+from utils.batch_utils import words_to_codes
+from utils.feedback_utils import ALL_GREEN, decode_feedback, feedback_code, feedback_matrix
+
+# Every 5-letter word over three letters: all repeated-letter shapes, and
+# answer/guess pairs with more, fewer and equal copies of a letter
+SMALL_ALPHABET_WORDS = [''.join(letters) for letters in itertools.product('ABC', repeat=5)]
+
+@pytest.mark.parametrize('guess, answer, colors', [
+    ('CRANE', 'CRANE', 'GGGGG'),
+    ('SPEED', 'ABIDE', '..Y.Y'),
+    ('EERIE', 'THEME', 'Y...G'),
+    ('LLAMA', 'HELLO', 'YY...'),
+    ('ALLEY', 'LOYAL', 'YYY.Y'),
+    ('GEESE', 'EAGER', 'YYY..'),
+])
+def test_feedback_code_with_repeated_letters(guess, answer, colors):
+    names = {'G': 'green', 'Y': 'yellow', '.': 'gray'}
+    assert decode_feedback(feedback_code(guess, answer)) == [names[c] for c in colors]
+
+def test_feedback_code_all_green():
+    assert feedback_code('SLATE', 'SLATE') == ALL_GREEN
+
+def test_feedback_matrix_matches_feedback_code():
+    codes = words_to_codes(SMALL_ALPHABET_WORDS)
+    matrix = feedback_matrix(codes, codes)
+    assert matrix.shape == (243, 243)
+    expected = np.array([[feedback_code(guess, answer) for guess in SMALL_ALPHABET_WORDS]
+                         for answer in SMALL_ALPHABET_WORDS], dtype=np.uint8)
+    np.testing.assert_array_equal(matrix, expected)
+
+def test_feedback_matrix_with_different_answers_and_guesses():
+    answers = ['ABIDE', 'THEME', 'HELLO', 'LOYAL', 'EAGER']
+    guesses = ['SPEED', 'EERIE', 'LLAMA', 'ALLEY', 'GEESE', 'CRANE']
+    matrix = feedback_matrix(words_to_codes(answers), words_to_codes(guesses))
+    assert matrix.tolist() == [[feedback_code(guess, answer) for guess in guesses] for answer in answers]
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, 'CACHE_DIR', str(tmp_path / 'cache'))
+    words = tmp_path / 'words.txt'
+    words.write_text('\n'.join(['CRANE', 'SLATE', 'SPEED', 'ABIDE', 'EERIE', 'THEME', 'LLAMA', 'HELLO']))
+    return FeedbackEngine(WordDictionary(path=str(words)))
+
+def test_engine_computes_before_the_matrix_is_loaded(engine):
+    assert engine.feedback_code('SPEED', 'ABIDE') == feedback_code('SPEED', 'ABIDE')
+    assert engine.get_stats()['computed'] == 1
+    assert not engine.get_stats()['loaded']
+
+def test_engine_looks_up_dictionary_pairs(engine):
+    engine.load()
+    for guess, answer in itertools.product(['CRANE', 'SPEED', 'EERIE', 'LLAMA'], ['ABIDE', 'THEME', 'HELLO']):
+        assert engine.feedback_code(guess, answer) == feedback_code(guess, answer)
+    stats = engine.get_stats()
+    assert (stats['words'], stats['matrix_hits'], stats['computed']) == (8, 12, 0)
+
+@pytest.mark.parametrize('guess, answer', [
+    ('GEESE', 'EAGER'),  # neither word in the dictionary
+    ('GEESE', 'THEME'),  # guess outside it
+    ('SPEED', 'EAGER'),  # answer outside it
+    ('CRANZ', 'CRANE'),  # sorts between dictionary words
+    ('ZZZZZ', 'AAAAA'),  # past either end of the word list
+])
+def test_engine_computes_words_outside_the_dictionary(engine, guess, answer):
+    engine.load()
+    assert engine.feedback_code(guess, answer) == feedback_code(guess, answer)
+    assert engine.get_stats()['computed'] == 1
+
+def test_engine_matrix_is_cached(engine, tmp_path):
+    engine.load()
+    assert engine.get_stats()['build_seconds'] is not None
+    reloaded = FeedbackEngine(engine.dictionary)
+    reloaded.load()
+    assert reloaded.get_stats()['build_seconds'] is None
+    assert reloaded.feedback_code('SPEED', 'ABIDE') == feedback_code('SPEED', 'ABIDE')
+
+def test_remaining_answers(engine):
+    code = feedback_code('SLATE', 'THEME')
+    remaining = engine.remaining_answers([('SLATE', code)])
+    assert 'THEME' in remaining
+    assert all(feedback_code('SLATE', word) == code for word in remaining)
+    with pytest.raises(ValueError):
+        engine.remaining_answers([('GEESE', code)])
@@ -0,0 +1,135 @@
+import asyncio
+import httpx
+import pytest
+from app import create_app
+from asgi import create_asgi_app
+from benchmarks.stub_word_api import create_stub_word_api
+from config import Config
+from services.async_word_service import AsyncWordService
+from services.word_pool import WordPool
+from utils.serialization import COMPACT_MIMETYPE
+
+def build_app(stub):
+    """ASGI app whose async word service fetches from the stand-in word API, with an empty prefetch pool."""
+    word_service = AsyncWordService(pool=WordPool(), transport=httpx.ASGITransport(app=stub))
+    return create_asgi_app(flask_app=create_app(), word_service=word_service)
+
+def serve(app, play):
+    """Run play(client) against the ASGI app inside its lifespan and return its result."""
+    async def main():
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url='http://test') as client:
+                return await play(client)
+    return asyncio.run(main())
+
+@pytest.fixture
+def stub():
+    return create_stub_word_api(words=['CRANE'])
+
+@pytest.fixture
+def app(offline, stub):
+    return build_app(stub)
+
+def test_generate_and_solve(app, stub):
+    async def play(client):
+        puzzle = (await client.get('/api/generate?level=1')).json()
+        wrong = await client.post('/api/validate', json={'guess': 'SLATE', 'session_id': puzzle['session_id']})
+        right = await client.post('/api/validate', json={'guess': 'crane', 'session_id': puzzle['session_id']})
+        return puzzle, wrong.json(), right.json()
+
+    puzzle, wrong, right = serve(app, play)
+    assert puzzle['level'] == 1 and len(puzzle['encrypted_word']) == 5
+    assert {'hint1', 'hint2', 'hint3', 'cipher'} <= puzzle.keys()
+    assert wrong == {'result': ['gray', 'gray', 'green', 'gray', 'green'], 'correct': False,
+                     'attempts': 1, 'max_attempts': 6}
+    assert right['correct'] and right['game_over'] and right['actual_word'] == 'CRANE'
+    assert right['attempts'] == 2
+    assert stub.state.requests == 1
+
+def test_concurrent_generates_share_one_upstream_request(offline):
+    stub = create_stub_word_api(latency=0.05, words=['CRANE'])
+    app = build_app(stub)
+
+    async def play(client):
+        responses = await asyncio.gather(*(client.get('/api/generate?level=1') for _ in range(30)))
+        return [response.status_code for response in responses], app.state.word_service.get_stats()
+
+    statuses, stats = serve(app, play)
+    assert statuses == [200] * 30
+    assert stub.state.requests == 1
+    assert stats['coalesced_waits'] == 29
+    assert stats['fallbacks'] == 0
+
+def test_generate_falls_back_when_the_word_api_has_no_words(offline):
+    app = build_app(create_stub_word_api(words=['TOOLONG']))
+
+    async def play(client):
+        response = await client.get('/api/generate?level=1')
+        return response.status_code, app.state.word_service.get_stats()
+
+    status, stats = serve(app, play)
+    assert status == 200
+    assert stats['fallbacks'] == 1
+
+def test_compact_responses(app):
+    async def play(client):
+        puzzle = await client.get('/api/generate?level=3&compact=1')
+        guess = await client.post('/api/validate', json={'guess': 'SLATE', 'session_id': puzzle.json()['session_id']},
+                                  headers={'Accept': COMPACT_MIMETYPE})
+        return puzzle, guess
+
+    puzzle, guess = serve(app, play)
+    assert puzzle.headers['content-type'].startswith(COMPACT_MIMETYPE)
+    assert puzzle.json()['cipher'] == 3 and len(puzzle.json()['hints']) == 3
+    assert guess.headers['content-type'].startswith(COMPACT_MIMETYPE)
+    assert isinstance(guess.json()['result'], int)
+
+VALIDATE_ERRORS = [
+    None,
+    b'not json',
+    b'[]',
+    {'guess': 'CRANE'},
+    {'guess': 'CRAN', 'session_id': 'x'},
+    {'guess': 'CR4NE', 'session_id': 'x'},
+    {'guess': 'CRANE', 'session_id': 'not-a-session'},
+    {'guess': 'CRANE', 'session_id': '00000000-0000-0000-0000-000000000000'},
+]
+
+@pytest.mark.parametrize('body', VALIDATE_ERRORS)
+def test_validate_errors_match_the_flask_view(app, body):
+    kwargs = {'content': body} if isinstance(body, bytes) else {'json': body} if body is not None else {}
+
+    async def play(client):
+        return await client.post('/api/validate', **kwargs)
+
+    response = serve(app, play)
+    flask_kwargs = {'data': body} if isinstance(body, bytes) else {'json': body} if body is not None else {}
+    expected = app.state.flask_app.test_client().post('/api/validate', **flask_kwargs)
+    assert response.status_code == expected.status_code
+    assert response.json() == expected.get_json()
+    assert response.status_code in (400, 404)
+
+@pytest.mark.parametrize('query', ['level=99', 'level=abc', 'level=0'])
+def test_generate_errors_match_the_flask_view(app, query):
+    async def play(client):
+        return await client.get(f'/api/generate?{query}')
+
+    response = serve(app, play)
+    expected = app.state.flask_app.test_client().get(f'/api/generate?{query}')
+    assert response.status_code == expected.status_code == 400
+    assert response.json() == expected.get_json()
+
+def test_token_sessions(app, monkeypatch):
+    monkeypatch.setattr(Config, 'SESSION_TOKENS', True)
+
+    async def play(client):
+        token = (await client.get('/api/generate?level=1')).json()['session_id']
+        first = await client.post('/api/validate', json={'guess': 'SLATE', 'session_id': token})
+        replay = await client.post('/api/validate', json={'guess': 'SLATE', 'session_id': token})
+        last = await client.post('/api/validate', json={'guess': 'CRANE', 'session_id': first.json()['session_id']})
+        return token, first.json(), replay, last.json()
+
+    token, first, replay, last = serve(app, play)
+    assert first['session_id'] != token and first['attempts'] == 1
+    assert replay.status_code == 400
+    assert last['correct'] and last['attempts'] == 2
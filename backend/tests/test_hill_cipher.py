@@ -0,0 +1,18 @@
+import pytest
+from ciphers.hill_cipher import HillCipher
+from config import Config
+
+WORDS_ENDING_IN_X = ['RELAX', 'INDEX', 'BORAX']
+
+@pytest.mark.parametrize('size', [2, 3, 4])
+@pytest.mark.parametrize('word', WORDS_ENDING_IN_X + ['CRANE'])
+def test_decrypt_strips_only_the_padding(size, word):
+    cipher = HillCipher(matrix_size=size)
+    assert cipher.decrypt(cipher.encrypt(word)) == word
+
+@pytest.mark.parametrize('size', [2, 3])
+def test_decrypt_batch_strips_only_the_padding(size, monkeypatch):
+    monkeypatch.setattr(Config, 'HILL_MATRIX_SIZE', size)
+    words = WORDS_ENDING_IN_X + ['CRANE']
+    encrypted_words, ciphers = HillCipher.encrypt_batch(words)
+    assert HillCipher.decrypt_batch(encrypted_words, ciphers) == words
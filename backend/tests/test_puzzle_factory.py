@@ -0,0 +1,45 @@
+import pytest
+from config import Config
+from services.puzzle_factory import PuzzleFactory
+
+@pytest.fixture
+def factory():
+    return PuzzleFactory(target_depths={1: 4, 4: 4}, word_source=lambda: 'CRANE')
+
+@pytest.mark.parametrize('attempts', [0, -1])
+def test_build_puzzle_with_no_verify_attempts_still_builds(factory, monkeypatch, attempts):
+    monkeypatch.setattr(Config, 'PUZZLE_VERIFY_ATTEMPTS', attempts)
+    word, encrypted_word, cipher_name, hints = factory.build_puzzle(1)
+    assert word == 'CRANE'
+    assert len(encrypted_word) == 5
+    assert factory.build_batch(1, 2)
+
+def test_words_playfair_cannot_round_trip_are_rejected_at_selection(monkeypatch):
+    monkeypatch.setattr(Config, 'PUZZLE_VERIFY', True)
+    words = iter(['JAPAN', 'CRANE', 'MAJOR', 'SLATE'] * 4)
+    factory = PuzzleFactory(target_depths={4: 16}, word_source=lambda: next(words))
+    puzzles = factory.build_batch(4, 4)
+    assert {puzzle[0] for puzzle in puzzles} <= {'CRANE', 'SLATE'}
+    stats = factory.get_stats()
+    assert stats['levels'][4]['unsupported_words'] == 2
+    assert stats['levels'][4]['spare_words'] == 4 - len(puzzles) - 2
+
+def test_build_puzzle_skips_words_that_cannot_round_trip(monkeypatch):
+    monkeypatch.setattr(Config, 'PUZZLE_VERIFY', True)
+    words = iter(['JAPAN', 'CRANE'])
+    factory = PuzzleFactory(target_depths={4: 4}, word_source=lambda: next(words))
+    assert factory.build_puzzle(4)[0] == 'CRANE'
+
+def test_failing_words_are_dropped_after_their_attempts(monkeypatch):
+    monkeypatch.setattr(Config, 'PUZZLE_VERIFY', True)
+    monkeypatch.setattr(Config, 'PUZZLE_VERIFY_ATTEMPTS', 3)
+    drawn = []
+    factory = PuzzleFactory(target_depths={1: 4}, word_source=lambda: drawn.append(f'W{len(drawn)}') or drawn[-1])
+    monkeypatch.setattr(factory.cipher_service, 'encrypt_batch', lambda words, level, verify: [None] * len(words))
+    for _ in range(20):
+        assert factory.build_batch(1, 4) == []
+    spare = factory._spare_words[1]
+    assert all(tried < 3 for _, tried in spare)
+    # Every word drawn is either still waiting or was dropped after its third attempt
+    assert factory.get_stats()['words_exhausted'] + len(spare) == len(drawn)
+    assert factory.get_stats()['words_exhausted'] > 0
@@ -0,0 +1,44 @@
+import uuid
+import pytest
+from services.session_store import SessionRecord, SessionStore, session_key
+from utils.word_utils import WORD_SPACE, pack_word, unpack_word
+
+@pytest.mark.parametrize('word', ['AAAAA', 'CRANE', 'ZZZZZ', 'slate'])
+def test_pack_word_round_trips(word):
+    code = pack_word(word)
+    assert 0 <= code < WORD_SPACE < 1 << 24
+    assert unpack_word(code) == word.upper()
+
+def test_pack_word_keeps_alphabetical_order():
+    assert pack_word('AAAAB') == pack_word('AAAAA') + 1
+    assert pack_word('BAAAA') == 26 ** 4
+
+@pytest.mark.parametrize('word', ['CRAN', 'CRANES', 'CR4NE', 'CRÄNE', ''])
+def test_pack_word_rejects_non_words(word):
+    with pytest.raises(ValueError):
+        pack_word(word)
+
+@pytest.mark.parametrize('code', [-1, WORD_SPACE])
+def test_unpack_word_rejects_out_of_range_codes(code):
+    with pytest.raises(ValueError):
+        unpack_word(code)
+
+def test_session_key_is_the_uuid_bytes():
+    session_id = uuid.uuid4()
+    assert session_key(str(session_id)) == session_id.bytes
+    assert len(session_key(session_id.hex)) == 16
+
+def test_record_has_no_instance_dict():
+    record = SessionRecord(1, pack_word('CRANE'), 'Caesar Cipher', 0.0)
+    assert not hasattr(record, '__dict__')
+    assert record.actual_word == 'CRANE'
+
+def test_stored_value_is_fixed_width_and_shares_cipher_names():
+    store = SessionStore(timeout=60, shards=1)
+    ids = [str(uuid.uuid4()) for _ in range(2)]
+    for session_id in ids:
+        store.put(session_id, 4, 'CRANE', ''.join(['Playfair', ' Cipher']))
+    values = list(store._shards[0].sessions.values())
+    assert {len(value) for value in values} == {len(SessionRecord(4, 0, None, 0.0).pack())} == {14}
+    first, second = (store.get(session_id) for session_id in ids)
+    assert first.cipher_name is second.cipher_name
@@ -0,0 +1,93 @@
+import threading
+import time
+import uuid
+import pytest
+from services.session_store import SessionStore
+
+def new_id() -> str:
+    return str(uuid.uuid4())
+
+@pytest.fixture
+def store():
+    return SessionStore(timeout=60, shards=4, resolution=1)
+
+def test_put_get_pop(store):
+    session_id = new_id()
+    store.put(session_id, 3, 'crane', 'Rail Fence Cipher')
+    record = store.get(session_id)
+    assert (record.level, record.actual_word, record.cipher_name, record.attempts) == (3, 'CRANE', 'Rail Fence Cipher', 0)
+    assert len(store) == 1
+    assert store.pop(session_id).actual_word == 'CRANE'
+    assert store.get(session_id) is None
+    assert store.pop(session_id) is None
+
+@pytest.mark.parametrize('session_id', ['not-a-uuid', '', None])
+def test_invalid_session_ids(store, session_id):
+    assert store.get(session_id) is None
+    assert store.increment_attempts(session_id) is None
+    with pytest.raises(ValueError):
+        store.put(session_id, 1, 'CRANE', 'Caesar Cipher')
+
+def test_put_rejects_words_that_do_not_pack(store):
+    with pytest.raises(ValueError):
+        store.put(new_id(), 1, 'CRANES', 'Caesar Cipher')
+
+def test_update_and_increment(store):
+    session_id = new_id()
+    store.put(session_id, 1, 'CRANE', 'Caesar Cipher')
+    assert store.increment_attempts(session_id).attempts == 1
+    record = store.update(session_id, level=2, word_code=store.get(session_id).word_code + 1)
+    assert (record.level, record.actual_word, record.attempts) == (2, 'CRANF', 1)
+    assert store.get(session_id).level == 2
+    assert store.update(new_id(), level=2) is None
+
+def test_sweep_removes_sessions_after_timeout(store, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(time, 'time', lambda: clock[0])
+    idle, active = new_id(), new_id()
+    store.put(idle, 1, 'CRANE', 'Caesar Cipher')
+    store.put(active, 1, 'SLATE', 'Caesar Cipher')
+
+    clock[0] = 1030.0
+    store.touch(active)
+    assert store.sweep() == 0
+
+    clock[0] = 1062.0
+    assert store.sweep() == 1
+    assert store.get(idle) is None
+    assert store.get(active).actual_word == 'SLATE'
+
+    clock[0] = 1100.0
+    assert store.sweep() == 1
+    assert len(store) == 0
+    assert store.sweep() == 0
+
+def test_sweep_skips_sessions_removed_before_expiry(store, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(time, 'time', lambda: clock[0])
+    session_id = new_id()
+    store.put(session_id, 1, 'CRANE', 'Caesar Cipher')
+    store.pop(session_id)
+    clock[0] = 2000.0
+    assert store.sweep() == 0
+
+def test_concurrent_increments_are_not_lost(store):
+    session_ids = [new_id() for _ in range(8)]
+    for session_id in session_ids:
+        store.put(session_id, 1, 'CRANE', 'Caesar Cipher')
+
+    def play():
+        for _ in range(50):
+            for session_id in session_ids:
+                store.increment_attempts(session_id)
+
+    threads = [threading.Thread(target=play) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert [store.get(session_id).attempts for session_id in session_ids] == [200] * 8
+
+def test_needs_a_shard():
+    with pytest.raises(ValueError):
+        SessionStore(shards=-1)
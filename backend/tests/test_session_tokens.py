@@ -0,0 +1,95 @@
+import base64
+import time
+import pytest
+from services.cipher_registry import cipher_registry
+from services.session_tokens import SessionTokens
+
+@pytest.fixture
+def tokens():
+    return SessionTokens(secret='test-secret', timeout=60, cache_size=16)
+
+def flip_byte(token: str, index: int) -> str:
+    """The token with one byte of its decoded form changed."""
+    raw = bytearray(base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)))
+    raw[index] ^= 0x01
+    return base64.urlsafe_b64encode(bytes(raw)).rstrip(b'=').decode('ascii')
+
+def test_issue_and_get_round_trip(tokens):
+    token = tokens.issue(2, 'crane')
+    record = tokens.get(token)
+    assert (record.level, record.actual_word, record.attempts, record.cipher_name) == (2, 'CRANE', 0, cipher_registry.get_cipher_class(2).NAME)
+    # Reading does not advance the game
+    assert tokens.get(token).attempts == 0
+
+def test_tokens_are_opaque_and_unique(tokens):
+    first, second = tokens.issue(1, 'CRANE'), tokens.issue(1, 'CRANE')
+    assert first != second
+    assert 'CRANE' not in base64.urlsafe_b64decode(first + '=' * (-len(first) % 4)).decode('latin-1')
+
+def test_increment_hands_out_the_next_token(tokens):
+    token = tokens.issue(1, 'CRANE')
+    record, next_token = tokens.increment_attempts(token)
+    assert record.attempts == 1
+    record, last_token = tokens.increment_attempts(next_token)
+    assert record.attempts == 2
+    assert tokens.get(last_token).attempts == 2
+
+@pytest.mark.parametrize('index', [0, 1, 12, 13, 30, -1])
+def test_tampered_tokens_are_refused(tokens, index):
+    token = tokens.issue(1, 'CRANE')
+    tampered = flip_byte(token, index)
+    assert tokens.get(tampered) is None
+    assert tokens.increment_attempts(tampered) is None
+    assert tokens.pop(tampered) is None
+
+@pytest.mark.parametrize('token', ['', 'not a token', '!!!!', 'AAAA', None])
+def test_malformed_tokens_are_refused(tokens, token):
+    assert tokens.get(token) is None
+
+def test_tokens_from_another_secret_are_refused(tokens):
+    other = SessionTokens(secret='other-secret', timeout=60)
+    assert tokens.get(other.issue(1, 'CRANE')) is None
+
+def test_tokens_expire(tokens, monkeypatch):
+    token = tokens.issue(1, 'CRANE')
+    now = time.time()
+    monkeypatch.setattr(time, 'time', lambda: now + 61)
+    assert tokens.get(token) is None
+    assert tokens.increment_attempts(token) is None
+
+def test_replaying_an_older_token_is_refused(tokens):
+    token = tokens.issue(1, 'CRANE')
+    _, next_token = tokens.increment_attempts(token)
+    with pytest.raises(ValueError):
+        tokens.get(token)
+    with pytest.raises(ValueError):
+        tokens.increment_attempts(token)
+    assert tokens.get(next_token).attempts == 1
+    assert tokens.get_stats()['replays_rejected'] == 2
+
+def test_one_token_advances_the_game_only_once(tokens):
+    token = tokens.issue(1, 'CRANE')
+    tokens.increment_attempts(token)
+    with pytest.raises(ValueError):
+        tokens.increment_attempts(token)
+
+def test_finished_games_are_not_accepted_again(tokens):
+    token = tokens.issue(1, 'CRANE')
+    _, next_token = tokens.increment_attempts(token)
+    assert tokens.pop(next_token).actual_word == 'CRANE'
+    assert tokens.get(next_token) is None
+    assert tokens.increment_attempts(next_token) is None
+
+def test_replay_cache_is_bounded(tokens):
+    for _ in range(40):
+        tokens.issue(1, 'CRANE')
+    stats = tokens.get_stats()
+    assert (stats['tokens_issued'], stats['replay_cache']) == (40, 16)
+
+def test_evicted_games_are_not_checked_for_replay():
+    tokens = SessionTokens(secret='test-secret', timeout=60, cache_size=1)
+    token = tokens.issue(1, 'CRANE')
+    tokens.increment_attempts(token)
+    tokens.issue(1, 'SLATE')
+    # The first game fell out of the replay cache (a documented limitation)
+    assert tokens.get(token).attempts == 0
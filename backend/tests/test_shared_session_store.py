@@ -0,0 +1,142 @@
+import multiprocessing
+import time
+import uuid
+import pytest
+from services.shared_session_store import SLOTS_PER_BUCKET, SharedSessionStore
+
+def new_id() -> str:
+    return str(uuid.uuid4())
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / 'sessions')
+
+@pytest.fixture
+def store(path):
+    store = SharedSessionStore(path=path, capacity=SLOTS_PER_BUCKET * 4, timeout=60)
+    yield store
+    store.close()
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A settable time.time()."""
+    now = [1000.0]
+    monkeypatch.setattr(time, 'time', lambda: now[0])
+    return now
+
+def test_put_get_increment_pop(store):
+    session_id = new_id()
+    store.put(session_id, 4, 'CRANE', 'Playfair Cipher')
+    assert store.increment_attempts(session_id).attempts == 1
+    record = store.get(session_id)
+    assert (record.level, record.actual_word, record.cipher_name, record.attempts) == (4, 'CRANE', 'Playfair Cipher', 1)
+    assert store.update(session_id, level=5).level == 5
+    assert len(store) == 1
+    assert store.pop(session_id).level == 5
+    assert store.get(session_id) is None
+    assert len(store) == 0
+
+def test_capacity_is_a_power_of_two_bucket_multiple(path):
+    store = SharedSessionStore(path=path, capacity=SLOTS_PER_BUCKET * 3, timeout=60)
+    try:
+        assert store.capacity == SLOTS_PER_BUCKET * 4
+    finally:
+        store.close()
+
+def test_expired_sessions_read_as_missing(store, clock):
+    session_id = new_id()
+    store.put(session_id, 1, 'CRANE', 'Caesar Cipher')
+    clock[0] += 61
+    assert store.get(session_id) is None
+    assert store.increment_attempts(session_id) is None
+    assert len(store) == 0
+
+def test_sweep_removes_only_idle_sessions(store, clock):
+    idle = [new_id() for _ in range(50)]
+    active = [new_id() for _ in range(50)]
+    for session_id in idle + active:
+        store.put(session_id, 1, 'CRANE', 'Caesar Cipher')
+    clock[0] += 30
+    for session_id in active:
+        store.touch(session_id)
+    clock[0] += 31
+    assert store.sweep() == 50
+    assert all(store.get(session_id) is None for session_id in idle)
+    assert all(store.get(session_id) is not None for session_id in active)
+
+def test_full_bucket_evicts_least_recently_touched(path, clock):
+    store = SharedSessionStore(path=path, capacity=SLOTS_PER_BUCKET, timeout=600)
+    try:
+        session_ids = []
+        for _ in range(SLOTS_PER_BUCKET):
+            clock[0] += 1
+            session_ids.append(new_id())
+            store.put(session_ids[-1], 1, 'CRANE', 'Caesar Cipher')
+        # Touch the oldest so the second oldest is the one evicted
+        clock[0] += 1
+        store.touch(session_ids[0])
+        clock[0] += 1
+        newest = new_id()
+        store.put(newest, 1, 'SLATE', 'Caesar Cipher')
+
+        assert store.get(session_ids[1]) is None
+        assert store.get(session_ids[0]) is not None
+        assert store.get(newest).actual_word == 'SLATE'
+        assert all(store.get(session_id) is not None for session_id in session_ids[2:])
+        assert store.get_stats()['evictions'] == 1
+        assert len(store) == SLOTS_PER_BUCKET
+    finally:
+        store.close()
+
+def test_deletes_keep_probe_runs_intact(path):
+    store = SharedSessionStore(path=path, capacity=SLOTS_PER_BUCKET, timeout=60)
+    try:
+        # One bucket, and keys whose home slots cluster (some near the end, so runs wrap)
+        homes = [60, 61, 62, 63, 0, 1, 2, 3]
+        session_ids = [
+            str(uuid.UUID(bytes=bytes([homes[i % len(homes)]]) + uuid.uuid4().bytes[1:]))
+            for i in range(SLOTS_PER_BUCKET - 8)
+        ]
+        for session_id in session_ids:
+            store.put(session_id, 1, 'CRANE', 'Caesar Cipher')
+        removed = session_ids[::3]
+        kept = [session_id for i, session_id in enumerate(session_ids) if i % 3]
+        for session_id in removed:
+            assert store.pop(session_id) is not None
+        assert all(store.get(session_id) is None for session_id in removed)
+        assert all(store.get(session_id) is not None for session_id in kept)
+        assert len(store) == len(kept)
+        assert store.get_stats()['evictions'] == 0
+    finally:
+        store.close()
+
+def _play_in_child(path: str, session_ids: list, rounds: int):
+    """Open the table independently and use up attempts on shared sessions."""
+    store = SharedSessionStore(path=path, timeout=60)
+    for _ in range(rounds):
+        for session_id in session_ids:
+            store.increment_attempts(session_id)
+    store.put(str(uuid.UUID(int=len(session_ids))), 7, 'SLATE', 'One-Time Pad')
+    store.close()
+
+@pytest.mark.parametrize('start_method', ['fork', 'spawn'])
+def test_sessions_are_shared_between_processes(store, path, start_method):
+    session_ids = [new_id() for _ in range(4)]
+    for session_id in session_ids:
+        store.put(session_id, 1, 'CRANE', 'Caesar Cipher')
+
+    context = multiprocessing.get_context(start_method)
+    children = [context.Process(target=_play_in_child, args=(path, session_ids, 50)) for _ in range(2)]
+    for child in children:
+        child.start()
+    for session_id in session_ids:
+        for _ in range(50):
+            store.increment_attempts(session_id)
+    for child in children:
+        child.join(30)
+        assert child.exitcode == 0
+
+    # Every process's increments landed, and a child's session is visible here
+    assert [store.get(session_id).attempts for session_id in session_ids] == [150] * 4
+    record = store.get(str(uuid.UUID(int=4)))
+    assert (record.actual_word, record.cipher_name) == ('SLATE', 'One-Time Pad')
@@ -0,0 +1,75 @@
+import os
+import numpy as np
+from typing import List
+
+# Shared generator for vectorized key sampling (numpy serializes access internally)
+rng = np.random.default_rng()
+
+def reseed():
+    """Give rng fresh entropy in place (modules hold it by name, so it is never rebound)."""
+    rng.bit_generator.state = np.random.PCG64().state
+
+# A forked worker would otherwise draw the same keys as its parent and siblings
+os.register_at_fork(after_in_child=reseed)
+
+def words_to_codes(words: List[str]) -> np.ndarray:
+    """
+    Convert a batch of equal-length words into letter codes.
+
+    Args:
+        words: Alphabetic words of the same length (any case)
+
+    Returns:
+        uint8 array of shape (N, length) with A=0 ... Z=25
+
+    Raises:
+        ValueError: If the words differ in length or contain non-letters
+    """
+    if not words:
+        return np.empty((0, 0), dtype=np.uint8)
+
+    length = len(words[0])
+    joined = ''.join(words).upper()
+    if len(joined) != length * len(words) or not joined.isascii() or not joined.isalpha():
+        raise ValueError("Batch words must all be alphabetic and of the same length")
+
+    codes = np.frombuffer(joined.encode('ascii'), dtype=np.uint8) - ord('A')
+    return codes.reshape(len(words), length)
+
+def codes_to_words(codes: np.ndarray) -> List[str]:
+    """
+    Convert an (N, length) array of letter codes back into uppercase words.
+
+    Args:
+        codes: Integer array with values in [0, 26)
+
+    Returns:
+        List of N uppercase words
+    """
+    count, length = codes.shape
+    if count == 0 or length == 0:
+        return [''] * count
+    joined = (codes.astype(np.uint8) + ord('A')).tobytes().decode('ascii')
+    return [joined[i:i + length] for i in range(0, count * length, length)]
+
+def pack_codes(codes: np.ndarray) -> np.ndarray:
+    """
+    Pack an (N, 5) array of letter codes into base-26 word codes.
+
+    Vectorized form of utils.word_utils.pack_word (first letter most significant).
+
+    Returns:
+        int64 array of N codes in [0, 26^5)
+    """
+    weights = 26 ** np.arange(codes.shape[1] - 1, -1, -1, dtype=np.int64)
+    return codes.astype(np.int64) @ weights
+
+def unpack_codes(packed: np.ndarray, length: int = 5) -> np.ndarray:
+    """
+    Unpack base-26 word codes into an (N, length) array of letter codes.
+
+    Returns:
+        uint8 array with A=0 ... Z=25
+    """
+    weights = 26 ** np.arange(length - 1, -1, -1, dtype=np.int64)
+    return (np.asarray(packed, dtype=np.int64)[:, None] // weights % 26).astype(np.uint8)
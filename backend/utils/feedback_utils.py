@@ -0,0 +1,107 @@
+from utils.word_utils import WORD_LENGTH
+
+# Per-letter feedback digits
+GRAY, YELLOW, GREEN = 0, 1, 2
+COLORS = ('gray', 'yellow', 'green')
+
+# A whole guess's feedback is one base-3 code, letter i weighted by 3^i
+PATTERN_COUNT = 3 ** WORD_LENGTH
+ALL_GREEN = PATTERN_COUNT - 1
+
+# Code -> feedback colors, decoded once
+PATTERNS = tuple(
+    tuple(COLORS[code // 3 ** i % 3] for i in range(WORD_LENGTH)) for code in range(PATTERN_COUNT)
+)
+
+def feedback_code(guess: str, answer: str) -> int:
+    """
+    Wordle feedback for one guess as a base-3 code.
+
+    Greens are marked first; then each remaining guess letter, left to right,
+    is yellow while unmatched copies of it are left in the answer.
+
+    Args:
+        guess: The guessed word (uppercase)
+        answer: The answer (uppercase, same length)
+
+    Returns:
+        Integer in [0, 243)
+    """
+    code = 0
+    unmatched = []
+    for i, (g, a) in enumerate(zip(guess, answer)):
+        if g == a:
+            code += GREEN * 3 ** i
+        else:
+            unmatched.append(a)
+
+    for i, (g, a) in enumerate(zip(guess, answer)):
+        if g != a and g in unmatched:
+            code += YELLOW * 3 ** i
+            unmatched.remove(g)
+    return code
+
+def feedback_matrix(answers: 'np.ndarray', guesses: 'np.ndarray') -> 'np.ndarray':
+    """
+    Vectorized feedback codes for every answer against every guess.
+
+    A non-green guess letter is yellow when the answer has more non-green
+    copies of it than the guess used up in earlier non-green positions,
+    which matches feedback_code's left-to-right pass. Guesses are grouped by
+    which of their positions repeat a letter, so that bookkeeping is only
+    done for the positions that need it.
+
+    Args:
+        answers: (A, 5) array of letter codes
+        guesses: (G, 5) array of letter codes
+
+    Returns:
+        uint8 array of shape (A, G)
+    """
+    # Imported here so the scalar helpers stay usable without NumPy loaded
+    import numpy as np
+
+    answers = np.asarray(answers, dtype=np.intp)
+    guesses = np.asarray(guesses, dtype=np.intp)
+    # Copies of each letter in each answer, (A, 26)
+    letter_counts = np.zeros((len(answers), 26), dtype=np.int8)
+    np.add.at(letter_counts, (np.arange(len(answers))[:, None], answers), 1)
+    in_answer = (letter_counts > 0).astype(np.uint8)
+
+    # One bit per position pair holding the same letter; guesses are sorted
+    # by it so each group is a contiguous run of columns
+    pairs = [(i, j) for i in range(WORD_LENGTH) for j in range(i + 1, WORD_LENGTH)]
+    shapes = np.zeros(len(guesses), dtype=np.int32)
+    for bit, (i, j) in enumerate(pairs):
+        shapes |= (guesses[:, i] == guesses[:, j]).astype(np.int32) << bit
+    order = np.argsort(shapes, kind='stable')
+    guesses, shapes = guesses[order], shapes[order]
+    group_shapes, starts = np.unique(shapes, return_index=True)
+    bounds = list(starts) + [len(guesses)]
+
+    codes = np.zeros((len(answers), len(guesses)), dtype=np.uint8)
+    for shape, start, stop in zip(group_shapes, bounds, bounds[1:]):
+        group = guesses[start:stop]
+        green = [answers[:, k:k + 1] == group[None, :, k] for k in range(WORD_LENGTH)]
+        block = codes[:, start:stop]
+        for i in range(WORD_LENGTH):
+            twins = [j if a == i else a for bit, (a, j) in enumerate(pairs) if shape >> bit & 1 and i in (a, j)]
+            if not twins:
+                # A letter the guess uses once: in the answer (1) plus green (1 more)
+                digit = in_answer[:, group[:, i]] + green[i]
+            else:
+                # Answer copies of this letter not matched green, less one for
+                # each earlier copy in the guess (green or used up as yellow)
+                available = letter_counts[:, group[:, i]] - green[i]
+                for k in twins:
+                    available -= green[k] if k > i else 1
+                digit = green[i] * np.uint8(GREEN) | ((available > 0) & ~green[i])
+            block += digit * np.uint8(3 ** i)
+
+    if shapes[0] != shapes[-1]:
+        codes = codes[:, np.argsort(order)]
+    return codes
+
+def decode_feedback(code: int) -> list:
+    """Feedback code -> list of 'green', 'yellow' or 'gray' per letter."""
+    return list(PATTERNS[code])
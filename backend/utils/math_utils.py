@@ -1,5 +1,10 @@
+import os
+import threading
 import numpy as np
 import random
+import secrets
+from config import Config
+from utils.batch_utils import rng
 
 def modinv(a, m):
     """Find modular inverse of a modulo m."""
@@ -17,28 +22,234 @@ def egcd(a, b):
         g, y, x = egcd(b % a, a)
         return (g, x - (b // a) * y, y)
 
+def prime_factors(n):
+    """Factor n by trial division into a list of (prime, exponent) pairs."""
+    factors = []
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            exponent = 0
+            while n % p == 0:
+                n //= p
+                exponent += 1
+            factors.append((p, exponent))
+        p += 1
+    if n > 1:
+        factors.append((n, 1))
+    return factors
+
+def crt(residues, moduli):
+    """Combine residues modulo pairwise coprime moduli (Chinese Remainder Theorem)."""
+    result, modulus = 0, 1
+    for r, m in zip(residues, moduli):
+        # Solve result + modulus * t == r (mod m)
+        t = (r - result) * pow(modulus, -1, m) % m
+        result += modulus * t
+        modulus *= m
+    return result % modulus
+
+def _squarefree_primes(modulus):
+    """Prime factors of a squarefree modulus (26 -> [2, 13])."""
+    factors = prime_factors(modulus)
+    if any(exponent > 1 for _, exponent in factors):
+        raise ValueError(f"Modulus {modulus} is not squarefree")
+    return [p for p, _ in factors]
+
+_SMALL_PRIMES = (3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73, 79, 83, 89, 97)
+
+def is_probable_prime(n, rounds=40):
+    """Miller-Rabin probable-prime test with random bases (error below 4**-rounds)."""
+    if n < 2:
+        return False
+    if n in (2, 3):
+        return True
+    if n % 2 == 0 or any(n % p == 0 for p in _SMALL_PRIMES if p < n):
+        return n in _SMALL_PRIMES
+
+    # Write n - 1 as d * 2**s with d odd
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    for _ in range(rounds):
+        x = pow(secrets.randbelow(n - 3) + 2, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+def random_prime(bits):
+    """Random probable prime of exactly `bits` bits (top two bits set, so p * q has 2 * bits bits)."""
+    if bits < 3:
+        raise ValueError("Primes need at least 3 bits")
+    while True:
+        candidate = secrets.randbits(bits) | (3 << (bits - 2)) | 1
+        if is_probable_prime(candidate):
+            return candidate
+
+def det_mod_prime(matrix, p):
+    """Exact determinant of an integer matrix modulo a prime, by Gaussian elimination over GF(p)."""
+    rows = [[int(x) % p for x in row] for row in matrix]
+    n = len(rows)
+    det = 1
+    for col in range(n):
+        pivot = next((r for r in range(col, n) if rows[r][col]), None)
+        if pivot is None:
+            return 0
+        if pivot != col:
+            rows[col], rows[pivot] = rows[pivot], rows[col]
+            det = -det
+        det = det * rows[col][col] % p
+        pivot_inv = pow(rows[col][col], -1, p)
+        for r in range(col + 1, n):
+            factor = rows[r][col] * pivot_inv % p
+            if factor:
+                rows[r] = [(a - factor * b) % p for a, b in zip(rows[r], rows[col])]
+    return det % p
+
+def det_bareiss(matrix):
+    """Exact integer determinant by fraction-free Bareiss elimination."""
+    rows = [[int(x) for x in row] for row in matrix]
+    n = len(rows)
+    sign, previous = 1, 1
+    for k in range(n - 1):
+        if rows[k][k] == 0:
+            swap = next((r for r in range(k + 1, n) if rows[r][k]), None)
+            if swap is None:
+                return 0
+            rows[k], rows[swap] = rows[swap], rows[k]
+            sign = -sign
+        for i in range(k + 1, n):
+            for j in range(k + 1, n):
+                rows[i][j] = (rows[i][j] * rows[k][k] - rows[i][k] * rows[k][j]) // previous
+        previous = rows[k][k]
+    return sign * rows[n - 1][n - 1] if n else 1
+
+def mod_det(matrix, modulus=26):
+    """
+    Exact determinant of an integer matrix modulo modulus.
+
+    Squarefree moduli are handled by elimination modulo each prime factor
+    combined with CRT (26 = 2 * 13); others fall back to Bareiss.
+    """
+    factors = prime_factors(modulus)
+    if all(exponent == 1 for _, exponent in factors):
+        primes = [p for p, _ in factors]
+        return crt([det_mod_prime(matrix, p) for p in primes], primes)
+    return det_bareiss(matrix) % modulus
+
+def matrix_inv_mod_prime(matrix, p):
+    """Inverse of an integer matrix modulo a prime by Gauss-Jordan elimination, or None if singular."""
+    n = len(matrix)
+    rows = [[int(x) % p for x in row] + [int(i == j) for j in range(n)] for i, row in enumerate(matrix)]
+    for col in range(n):
+        pivot = next((r for r in range(col, n) if rows[r][col]), None)
+        if pivot is None:
+            return None
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        pivot_inv = pow(rows[col][col], -1, p)
+        rows[col] = [x * pivot_inv % p for x in rows[col]]
+        for r in range(n):
+            factor = rows[r][col]
+            if r != col and factor:
+                rows[r] = [(a - factor * b) % p for a, b in zip(rows[r], rows[col])]
+    return [row[n:] for row in rows]
+
 def generate_invertible_matrix(size=2):
     """Generate a random invertible matrix modulo 26."""
+    if size == 2:
+        # One random row of the precomputed table of all invertible 2x2 keys
+        table = invertible_2x2_table()
+        return table[random.randrange(len(table))].reshape(2, 2).astype(np.int64)
+
     while True:
         # Generate random matrix
-        matrix = np.random.randint(0, 26, (size, size))
+        matrix = rng.integers(0, 26, (size, size))
 
         # Check if determinant has modular inverse
-        det = int(round(np.linalg.det(matrix))) % 26
-        if modinv(det, 26) is not None:
+        if modinv(mod_det(matrix, 26), 26) is not None:
             return matrix
 
+def generate_invertible_matrices(count, size=2):
+    """Generate a batch of random invertible matrices modulo 26, shape (count, size, size)."""
+    if size == 2:
+        table = invertible_2x2_table()
+        indices = rng.integers(0, len(table), count)
+        return table[indices].reshape(count, 2, 2).astype(np.int64)
+
+    if count == 0:
+        return np.empty((0, size, size), dtype=np.int64)
+    return np.stack([generate_invertible_matrix(size) for _ in range(count)])
+
 def matrix_mod_inv(matrix, modulus):
-    """Find the modular inverse of a matrix."""
-    det = int(round(np.linalg.det(matrix))) % modulus
-    det_inv = modinv(det, modulus)
+    """
+    Find the modular inverse of a matrix.
+
+    Computed exactly modulo each prime factor of a squarefree modulus and
+    recombined with CRT. Returns None if the matrix is not invertible.
+    """
+    primes = _squarefree_primes(modulus)
+    inverses = []
+    for p in primes:
+        inverse = matrix_inv_mod_prime(matrix, p)
+        if inverse is None:
+            return None
+        inverses.append(inverse)
+
+    n = len(inverses[0])
+    result = [
+        [crt([inverse[i][j] for inverse in inverses], primes) for j in range(n)]
+        for i in range(n)
+    ]
+    return np.array(result, dtype=np.int64)
+
+_table_lock = threading.Lock()
+_invertible_2x2 = None
+
+def build_invertible_2x2_table():
+    """
+    Enumerate every invertible 2x2 matrix modulo 26.
+
+    Returns:
+        uint8 array of shape (157248, 4), each row [a, b, c, d] for [[a, b], [c, d]]
+    """
+    a, b, c, d = np.indices((26, 26, 26, 26), dtype=np.int32).reshape(4, -1)
+    det = (a * d - b * c) % 26
+    # Invertible mod 26 <=> det is a unit mod 2 and mod 13
+    invertible = (det % 2 == 1) & (det != 13)
+    return np.stack([a, b, c, d], axis=1)[invertible].astype(np.uint8)
 
-    if det_inv is None:
-        return None
+def invertible_2x2_table():
+    """
+    Get the table of all invertible 2x2 matrices modulo 26.
 
-    matrix_inv = np.linalg.inv(matrix)
-    adjugate = matrix_inv * np.linalg.det(matrix)
+    The table is built once, saved under Config.CACHE_DIR and memory-mapped
+    from there, so worker processes share its pages. If the cache directory
+    is not writable the table is kept in memory instead.
+    """
+    global _invertible_2x2
+    if _invertible_2x2 is not None:
+        return _invertible_2x2
 
-    # Apply modular arithmetic to each element
-    result = (adjugate * det_inv) % modulus
-    return result.astype(int)
\ No newline at end of file
+    with _table_lock:
+        if _invertible_2x2 is None:
+            path = os.path.join(Config.CACHE_DIR, 'hill_invertible_2x2.npy')
+            try:
+                if not os.path.exists(path):
+                    os.makedirs(Config.CACHE_DIR, exist_ok=True)
+                    # Write to a private file first so concurrent workers never see a partial table
+                    tmp_path = f'{path}.{os.getpid()}.tmp'
+                    with open(tmp_path, 'wb') as f:
+                        np.save(f, build_invertible_2x2_table())
+                    os.replace(tmp_path, path)
+                _invertible_2x2 = np.load(path, mmap_mode='r')
+            except OSError as e:
+                print(f"Could not cache Hill key table, keeping it in memory: {e}")
+                _invertible_2x2 = build_invertible_2x2_table()
+    return _invertible_2x2
@@ -0,0 +1,62 @@
+from flask import request
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to Flask's json-module provider
+    orjson = None
+
+# Clients ask for compact responses with this Accept type or ?compact=1
+COMPACT_MIMETYPE = 'application/vnd.cryptowordle.compact+json'
+
+def wants_compact() -> bool:
+    """Whether the current request asked for the compact response format."""
+    if request.args.get('compact', '').lower() in ('1', 'true'):
+        return True
+    return any(mimetype == COMPACT_MIMETYPE for mimetype, _ in request.accept_mimetypes)
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that encodes with orjson.
+
+    Output matches the default provider except that keys keep insertion
+    order instead of being sorted and non-ASCII text is sent as UTF-8.
+    Calls that pass json.dumps keyword arguments use the default provider.
+    """
+
+    # Integer keys (e.g. per-level stats) are written as strings, like json.dumps does
+    _options = orjson.OPT_NON_STR_KEYS if orjson else 0
+
+    def dumps(self, obj, **kwargs) -> str:
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self._options).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        options = self._options | orjson.OPT_APPEND_NEWLINE
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            options |= orjson.OPT_INDENT_2
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=options), mimetype=self.mimetype
+        )
+
+def install_json_provider(app, fast: bool = True):
+    """
+    Use the orjson provider for the app's JSON when orjson is installed.
+
+    Args:
+        app: The Flask app
+        fast: Set False to keep Flask's default provider
+
+    Returns:
+        The provider class in use
+    """
+    if fast and orjson is not None:
+        app.json = OrjsonProvider(app)
+    return type(app.json)
@@ -0,0 +1,32 @@
+import string
+
+UPPERCASE = string.ascii_uppercase
+LETTERS = string.ascii_uppercase + string.ascii_lowercase
+
+def _shifted(shift: int) -> str:
+    """The uppercase alphabet rotated left by shift places."""
+    shift %= 26
+    return UPPERCASE[shift:] + UPPERCASE[:shift]
+
+# SHIFT_TABLES[k] maps A-Z and a-z to the uppercase letter k places later and
+# leaves every other character untouched; built once at import for all shifts
+SHIFT_TABLES = tuple(str.maketrans(LETTERS, _shifted(shift) * 2) for shift in range(26))
+
+# Same mappings as 256-byte tables for bytes.translate over ASCII text
+SHIFT_BYTE_TABLES = tuple(
+    bytes.maketrans(LETTERS.encode('ascii'), (_shifted(shift) * 2).encode('ascii'))
+    for shift in range(26)
+)
+
+def substitution_table(cipher_alphabet: str) -> dict:
+    """
+    Compile a substitution alphabet into a str.translate table.
+
+    Args:
+        cipher_alphabet: 26 letters; the i-th replaces the i-th letter of A-Z
+
+    Returns:
+        Translation table mapping upper- and lowercase letters to uppercase
+        cipher letters
+    """
+    return str.maketrans(LETTERS, cipher_alphabet * 2)
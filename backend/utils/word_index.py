@@ -0,0 +1,68 @@
+import numpy as np
+from typing import Iterable
+from utils.batch_utils import pack_codes, unpack_codes, words_to_codes
+from utils.word_utils import WORD_LENGTH, WORD_SPACE, pack_word
+
+class WordIndex:
+    """
+    Set of 5-letter words stored as a bitset over all 26^5 packed word codes.
+
+    The bitset is about 1.5 MB regardless of how many words it holds, and
+    membership is one shift-and-mask, for single words or whole arrays of codes.
+    """
+
+    def __init__(self, bits: np.ndarray):
+        """
+        Args:
+            bits: uint8 array of ceil(26^5 / 8) bytes; bit (code & 7) of byte
+                (code >> 3) is set when the word with that code is present
+        """
+        if bits.shape != ((WORD_SPACE + 7) // 8,):
+            raise ValueError(f"Word index bitset must hold {WORD_SPACE} bits")
+        self.bits = bits
+        self._codes = None
+
+    @classmethod
+    def from_words(cls, words: Iterable[str]) -> 'WordIndex':
+        """
+        Build an index from words; anything that is not 5 letters A-Z is skipped.
+        """
+        words = [word.strip().upper() for word in words]
+        words = [word for word in words if len(word) == WORD_LENGTH and word.isascii() and word.isalpha()]
+        bits = np.zeros((WORD_SPACE + 7) // 8, dtype=np.uint8)
+        if words:
+            packed = pack_codes(words_to_codes(words))
+            np.bitwise_or.at(bits, packed >> 3, (1 << (packed & 7)).astype(np.uint8))
+        return cls(bits)
+
+    def contains_codes(self, packed: np.ndarray) -> np.ndarray:
+        """
+        Vectorized membership test.
+
+        Args:
+            packed: Integer array of word codes in [0, 26^5)
+
+        Returns:
+            Boolean array, True where the word is in the index
+        """
+        packed = np.asarray(packed, dtype=np.int64)
+        return (self.bits[packed >> 3] >> (packed & 7)) & 1 == 1
+
+    def __contains__(self, word: str) -> bool:
+        if len(word) != WORD_LENGTH or not word.isascii() or not word.isalpha():
+            return False
+        code = pack_word(word)
+        return bool(self.bits[code >> 3] >> (code & 7) & 1)
+
+    def codes(self) -> np.ndarray:
+        """Sorted packed codes of every word in the index (computed once)."""
+        if self._codes is None:
+            self._codes = np.flatnonzero(np.unpackbits(self.bits, bitorder='little')[:WORD_SPACE])
+        return self._codes
+
+    def letter_codes(self) -> np.ndarray:
+        """Every word in the index as an (N, 5) array of letter codes."""
+        return unpack_codes(self.codes(), WORD_LENGTH)
+
+    def __len__(self):
+        return len(self.codes())
@@ -0,0 +1,46 @@
+ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+WORD_LENGTH = 5
+
+# 26^5 distinct 5-letter words, which fits in 24 bits
+WORD_SPACE = 26 ** WORD_LENGTH
+
+def pack_word(word: str) -> int:
+    """
+    Pack a 5-letter word into an integer in [0, 26^5).
+
+    Args:
+        word: A 5-letter alphabetic word (any case)
+
+    Returns:
+        Base-26 integer code of the word, first letter most significant
+
+    Raises:
+        ValueError: If word is not exactly 5 letters A-Z
+    """
+    word = word.upper()
+    if len(word) != WORD_LENGTH or not word.isascii() or not word.isalpha():
+        raise ValueError(f"Cannot pack {word!r}: expected exactly {WORD_LENGTH} letters A-Z")
+
+    code = 0
+    for char in word:
+        code = code * 26 + (ord(char) - 65)
+    return code
+
+def unpack_word(code: int) -> str:
+    """
+    Unpack an integer produced by pack_word back into the uppercase word.
+
+    Args:
+        code: Integer in [0, 26^5)
+
+    Returns:
+        The 5-letter word in uppercase
+    """
+    if not 0 <= code < WORD_SPACE:
+        raise ValueError(f"Word code out of range: {code}")
+
+    chars = []
+    for _ in range(WORD_LENGTH):
+        code, remainder = divmod(code, 26)
+        chars.append(ALPHABET[remainder])
+    return ''.join(reversed(chars))
@@ -87,6 +87,8 @@ export function useGameState() {
 
       setGameState({
         ...gameState,
+        // Stateless session mode hands out a new session token with every guess
+        sessionId: response.session_id ?? gameState.sessionId,
         guesses: newGuesses,
         currentGuess: '',
         validationResults: newValidationResults,
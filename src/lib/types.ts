@@ -28,6 +28,7 @@ export interface ValidationResponse {
   max_attempts: number;
   game_over?: boolean;
   actual_word?: string;
+  session_id?: string; // next session token, sent while the game goes on in stateless session mode
 }
 
 export interface GeneratePuzzleResponse {